@@ -0,0 +1,42 @@
+from typing import List
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.config import settings
+from app.models.bar import Bar
+from app.services.bar_broadcaster import BarBroadcaster
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def get_bar_broadcaster(request: Request) -> BarBroadcaster:
+    """Return the process-wide BarBroadcaster built in the app lifespan."""
+    return request.app.state.bar_broadcaster
+
+
+@router.get("/bars", response_model=List[Bar], summary="Get OHLCV bars")
+async def get_bars(
+    symbol: str = Query(..., description="Symbol to fetch bars for"),
+    interval: str = Query("1m", description="Bar interval, e.g. 1s, 1m or 5m"),
+    limit: int = Query(
+        100,
+        ge=1,
+        le=settings.BAR_HISTORY,
+        description="Number of newest bars to return",
+    ),
+    bars: BarBroadcaster = Depends(get_bar_broadcaster),
+):
+    """
+    Return the newest bars of ``symbol``, oldest first. The last bar is the
+    one still being built.
+    """
+    if not bars.has_symbol(symbol):
+        logger.warning("Invalid symbol for bars: %s", symbol)
+        raise HTTPException(status_code=400, detail="Invalid symbol")
+    try:
+        return bars.get_bars(symbol, interval, limit)
+    except ValueError as e:
+        logger.warning(str(e))
+        raise HTTPException(status_code=400, detail=str(e))
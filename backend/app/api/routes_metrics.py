@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Request, Response
+from app.core.metrics import CONTENT_TYPE, REGISTRY, stream_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", tags=["Metrics"], include_in_schema=False)
+async def get_metrics(request: Request):
+    """Expose process metrics in the Prometheus text format."""
+    state = request.app.state
+    streams = {
+        "ticks": getattr(state, "tick_broadcaster", None),
+        "bars": getattr(state, "bar_broadcaster", None),
+        "orders": getattr(state, "order_broadcaster", None),
+    }
+    return Response(REGISTRY.render(stream_metrics(streams)), media_type=CONTENT_TYPE)
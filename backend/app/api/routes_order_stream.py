@@ -0,0 +1,25 @@
+import logging
+from fastapi import APIRouter, WebSocket
+from app.api.ws_subscriptions import serve_subscriptions
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.websocket("/ws/orders")
+async def stream_orders(websocket: WebSocket):
+    """
+    WebSocket endpoint that pushes new orders as they are created.
+
+    Uses the same {"action": "subscribe" | "unsubscribe", "symbols": [...]}
+    protocol as /ws/ticks; each committed order for a subscribed symbol
+    arrives once, as an order JSON object.
+    """
+    await websocket.accept()
+    logger.info("Order stream connection accepted")
+    await serve_subscriptions(
+        websocket,
+        websocket.app.state.order_broadcaster,
+        queue_size=settings.ORDER_STREAM_QUEUE_SIZE,
+    )
@@ -1,21 +1,21 @@
-from typing import List
+from typing import List, Literal, Optional
 import logging
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
+from app.config import settings
 from app.models.order import OrderResponse, OrderCreateRequest
-from app.repositories.order_repository import OrderRepository
 from app.services.order_service import OrderService
-from app.services.symbol_service import SymbolService
+from app.utils.order_export import EXPORT_FORMATS, export_orders
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def get_order_service() -> OrderService:
-    symbol_service = SymbolService()
-    symbols = symbol_service.get_all_symbols()
-    return OrderService(OrderRepository(), symbols)
+def get_order_service(request: Request) -> OrderService:
+    """Return the process-wide OrderService built in the app lifespan."""
+    return request.app.state.order_service
 
 
 @router.post("/orders", response_model=OrderResponse, summary="Create a new order")
@@ -24,28 +24,87 @@ async def create_order(
 ):
     """Create a new order with validation and persistence."""
     try:
-        return service.create_order(request)
+        return await service.create_order_async(request)
     except HTTPException as e:
-        logger.warning(f"Order validation failed: {e.detail}")
+        logger.warning("Order validation failed: %s", e.detail)
         raise e
     except Exception as e:
-        logger.error(f"Unexpected error while creating order: {e}", exc_info=True)
+        logger.error("Unexpected error while creating order: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create order: {str(e)}")
 
 
-@router.get(
-    "/orders", response_model=List[OrderResponse], summary="List orders for a symbol"
-)
+@router.get("/orders", response_model=List[OrderResponse], summary="List orders")
 async def list_orders(
-    symbol: str = Query(..., description="Symbol to fetch orders for"),
+    symbol: Optional[str] = Query(
+        None, description="Symbol to fetch orders for; all symbols if omitted"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=settings.ORDER_PAGE_MAX,
+        description="Maximum orders to return; ORDER_PAGE_MAX across all symbols",
+    ),
+    after_id: Optional[int] = Query(
+        None, description="Cursor: only orders with a larger id"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="Cursor: only orders with a smaller id"
+    ),
+    since: Optional[int] = Query(None, description="Earliest timestamp (inclusive)"),
+    until: Optional[int] = Query(None, description="Latest timestamp (inclusive)"),
+    side: Optional[Literal["BUY", "SELL"]] = Query(None, description="Order side"),
+    order: Literal["asc", "desc"] = Query("asc", description="Oldest or newest first"),
     service: OrderService = Depends(get_order_service),
 ):
-    """List all stored orders for a given symbol."""
+    """
+    List stored orders for a symbol, or across all symbols.
+
+    Without filters every order of the symbol is returned; across all
+    symbols, pages are capped at ``ORDER_PAGE_MAX`` orders. For large books,
+    page with ``limit`` and pass the id of the last order received as
+    ``after_id`` (or ``before_id`` with ``order=desc``).
+    """
+    if symbol is None and limit is None:
+        limit = settings.ORDER_PAGE_MAX
     try:
-        return service.list_orders(symbol)
+        return await service.query_orders_async(
+            symbol,
+            limit=limit,
+            after_id=after_id,
+            before_id=before_id,
+            since=since,
+            until=until,
+            side=side,
+            descending=order == "desc",
+        )
     except HTTPException as e:
-        logger.warning(f"Invalid request for orders: {e.detail}")
+        logger.warning("Invalid request for orders: %s", e.detail)
         raise e
     except Exception as e:
-        logger.error(f"Unexpected error while fetching orders: {e}", exc_info=True)
+        logger.error("Unexpected error while fetching orders: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch orders: {str(e)}")
+
+
+@router.get("/orders/export", summary="Stream order history as NDJSON or CSV")
+def export(
+    symbol: Optional[str] = Query(
+        None, description="Symbol to export; all stored symbols if omitted"
+    ),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    service: OrderService = Depends(get_order_service),
+):
+    """
+    Stream stored orders without loading them into memory.
+
+    Orders are read from the logs and encoded in fixed-size chunks as the
+    client consumes the response, so memory use does not depend on the size
+    of the history.
+    """
+    orders = service.iter_orders(symbol)
+    filename = f"orders-{symbol or 'all'}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_orders(orders, format, compress=gzip),
+        media_type="application/gzip" if gzip else EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
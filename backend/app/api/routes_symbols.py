@@ -1,6 +1,6 @@
 from typing import List
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from app.models.symbol import SymbolResponse
 from app.services.symbol_service import SymbolService
 
@@ -9,8 +9,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_symbol_service() -> SymbolService:
-    return SymbolService()
+def get_symbol_service(request: Request) -> SymbolService:
+    """Return the process-wide SymbolService built in the app lifespan."""
+    return request.app.state.symbol_service
 
 
 @router.get("/symbols", response_model=List[SymbolResponse], summary="Get all symbols")
@@ -18,11 +19,11 @@ async def get_symbols(service: SymbolService = Depends(get_symbol_service)):
     """Retrieve all available tradeable symbols."""
     try:
         symbols = service.get_all_symbols()
-        logger.info(f"Fetched {len(symbols)} symbols")
+        logger.info("Fetched %s symbols", len(symbols))
         return symbols
     except FileNotFoundError as e:
-        logger.error(f"Symbols file not found: {e}")
+        logger.error("Symbols file not found: %s", e)
         raise HTTPException(status_code=500, detail="Symbols file not found")
     except Exception as e:
-        logger.error(f"Failed to load symbols: {e}", exc_info=True)
+        logger.error("Failed to load symbols: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to load symbols: {str(e)}")
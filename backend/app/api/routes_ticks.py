@@ -1,9 +1,6 @@
-import asyncio
-import json
 import logging
-import random
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from app.services.tick_service import TickService
+from fastapi import APIRouter, WebSocket
+from app.api.ws_subscriptions import serve_subscriptions
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -12,37 +9,24 @@ router = APIRouter()
 @router.websocket("/ws/ticks")
 async def stream_ticks(websocket: WebSocket):
     """
-    WebSocket endpoint that streams live ticks for a subscribed symbol.
+    WebSocket endpoint that streams live ticks for any number of symbols.
+
+    Clients send {"action": "subscribe" | "unsubscribe", "symbols": [...]} at
+    any time; ticks for every subscribed symbol arrive on the same socket.
     """
     await websocket.accept()
     logger.info("WebSocket connection accepted")
+    await serve_subscriptions(websocket, websocket.app.state.tick_broadcaster)
 
-    tick_service = TickService()
-    subscribed_symbol = None
-
-    try:
-        while True:
-            message = await websocket.receive_text()
-            data = json.loads(message)
-
-            if data.get("action") == "subscribe":
-                subscribed_symbol = data.get("symbol")
-                logger.info(f"Client subscribed to {subscribed_symbol}")
-
-            while subscribed_symbol:
-                tick = tick_service.get_tick_for_symbol(subscribed_symbol)
 
-                if "error" in tick:
-                    await websocket.send_json(tick)
-                    logger.warning(tick)
-                    break
-
-                await websocket.send_json(tick)
-                await asyncio.sleep(random.uniform(1, 2))
+@router.websocket("/ws/bars")
+async def stream_bars(websocket: WebSocket):
+    """
+    WebSocket endpoint that pushes OHLCV bars as they close.
 
-    except WebSocketDisconnect:
-        logger.info("WebSocket disconnected")
-    except Exception as e:
-        logger.error(f"Unexpected error in tick stream: {e}", exc_info=True)
-        if websocket.application_state == websocket.application_state.CONNECTED:
-            await websocket.close()
+    Uses the same subscription protocol as /ws/ticks; closed bars of every
+    configured interval arrive for each subscribed symbol.
+    """
+    await websocket.accept()
+    logger.info("Bar stream connection accepted")
+    await serve_subscriptions(websocket, websocket.app.state.bar_broadcaster)
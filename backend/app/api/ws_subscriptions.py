@@ -0,0 +1,132 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+from fastapi import WebSocket, WebSocketDisconnect
+from app.config import settings
+from app.core.metrics import WS_SEND_SECONDS
+from app.services.broadcaster import Subscriber
+
+logger = logging.getLogger(__name__)
+
+
+def _requested_symbols(data: dict) -> Optional[list]:
+    """
+    Return the symbols named by a command, or None if it names none.
+
+    Accepts {"symbols": [...]} and the legacy {"symbol": "..."} form, each
+    with a string or a list of strings; raises ValueError for anything else.
+    """
+    if "symbols" in data:
+        symbols = data["symbols"]
+    elif "symbol" in data:
+        symbols = data["symbol"]
+    else:
+        return None
+    if isinstance(symbols, str):
+        return [symbols]
+    if isinstance(symbols, list) and all(isinstance(s, str) for s in symbols):
+        return symbols
+    raise ValueError("symbols must be a string or a list of strings")
+
+
+async def _read_commands(websocket: WebSocket, broadcaster, subscriber: Subscriber):
+    """Apply subscribe/unsubscribe commands until the client disconnects."""
+    while True:
+        message = await websocket.receive_text()
+        try:
+            data = json.loads(message)
+            action = data.get("action")
+        except (ValueError, AttributeError):
+            subscriber.put(json.dumps({"error": "Invalid message"}))
+            continue
+
+        try:
+            symbols = _requested_symbols(data)
+        except ValueError as e:
+            subscriber.put(json.dumps({"error": f"Invalid message: {e}"}))
+            continue
+        if action == "subscribe":
+            unknown = []
+            for symbol in symbols or []:
+                if symbol in subscriber.topics:
+                    continue
+                if len(subscriber.topics) >= settings.WS_MAX_SUBSCRIPTIONS:
+                    subscriber.put(json.dumps({"error": "Subscription limit reached"}))
+                    break
+                try:
+                    broadcaster.subscribe(subscriber, symbol)
+                except ValueError:
+                    unknown.append(symbol)
+            if unknown:
+                error = {
+                    "error": f"Invalid symbol: {', '.join(unknown)}",
+                    "unknown": unknown,
+                }
+                subscriber.put(json.dumps(error))
+                logger.warning(error)
+            logger.info("Client subscriptions: %s", sorted(subscriber.topics))
+        elif action == "unsubscribe":
+            # Without a symbols field, unsubscribe from everything; an empty
+            # list unsubscribes from nothing.
+            if symbols is None:
+                symbols = list(subscriber.topics)
+            for symbol in symbols:
+                broadcaster.unsubscribe(subscriber, symbol)
+            logger.info("Client subscriptions: %s", sorted(subscriber.topics))
+        else:
+            subscriber.put(json.dumps({"error": f"Unknown action: {action}"}))
+            continue
+
+        subscriber.put(
+            json.dumps({"type": "subscriptions", "symbols": sorted(subscriber.topics)})
+        )
+
+
+async def _write_frames(websocket: WebSocket, subscriber: Subscriber):
+    """Forward queued frames to the client; the only task that sends."""
+    send_seconds = WS_SEND_SECONDS.labels(websocket.url.path)
+    while True:
+        frame = await subscriber.get()
+        started = time.perf_counter()
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+        send_seconds.observe(time.perf_counter() - started)
+
+
+async def serve_subscriptions(
+    websocket: WebSocket, broadcaster, queue_size: int = settings.TICK_QUEUE_SIZE
+):
+    """
+    Run a subscription session on an accepted WebSocket.
+
+    A reader task applies subscribe/unsubscribe commands while a writer task
+    streams frames, so clients can change their symbol set at any time on a
+    single connection. The session ends when either task finishes. At most
+    ``queue_size`` frames are buffered for a slow client.
+    """
+    subscriber = Subscriber(queue_size)
+    reader = asyncio.create_task(_read_commands(websocket, broadcaster, subscriber))
+    writer = asyncio.create_task(_write_frames(websocket, subscriber))
+    try:
+        done, pending = await asyncio.wait(
+            {reader, writer}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        logger.info("WebSocket disconnected")
+    except Exception as e:
+        logger.error("Unexpected error in subscription stream: %s", e, exc_info=True)
+        if websocket.application_state == websocket.application_state.CONNECTED:
+            await websocket.close()
+    finally:
+        reader.cancel()
+        writer.cancel()
+        broadcaster.unsubscribe_all(subscriber)
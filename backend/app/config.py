@@ -7,6 +7,89 @@ class Settings:
 
     ORDERS_DIR: str = os.getenv("ORDERS_DIR", "orders")
     SYMBOLS_FILE: str = os.getenv("SYMBOLS_FILE", "symbols.json")
+    # Seconds between checks of the symbols file for changes
+    SYMBOLS_CHECK_INTERVAL: float = float(os.getenv("SYMBOLS_CHECK_INTERVAL", "1.0"))
+
+    # Order storage: "jsonl" (per-symbol logs in ORDERS_DIR) or "sqlite"
+    ORDER_BACKEND: str = os.getenv("ORDER_BACKEND", "jsonl")
+    # SQLite database file; defaults to orders.db inside ORDERS_DIR
+    ORDER_DB_PATH: str = os.getenv("ORDER_DB_PATH", "")
+    # Read connections kept open to the SQLite database
+    ORDER_DB_POOL_SIZE: int = int(os.getenv("ORDER_DB_POOL_SIZE", "4"))
+    # Seconds a SQLite write waits for another process holding the write lock
+    ORDER_DB_BUSY_TIMEOUT: float = float(os.getenv("ORDER_DB_BUSY_TIMEOUT", "5.0"))
+    # Minimum number of appends between compactions of an order log
+    ORDER_LOG_COMPACT_EVERY: int = int(os.getenv("ORDER_LOG_COMPACT_EVERY", "10000"))
+    # Order durability: "always" fsyncs every order, "batch" group-commits
+    # orders arriving within ORDER_BATCH_WINDOW_MS (up to ORDER_BATCH_MAX) with
+    # one fsync, "never" leaves syncing to the OS.
+    ORDER_FSYNC: str = os.getenv("ORDER_FSYNC", "batch")
+    ORDER_BATCH_WINDOW_MS: float = float(os.getenv("ORDER_BATCH_WINDOW_MS", "2"))
+    ORDER_BATCH_MAX: int = int(os.getenv("ORDER_BATCH_MAX", "256"))
+    # Worker id (0-31) embedded in order ids; -1 claims a free slot via a lock
+    # file in ORDERS_DIR, which is unique per host. Set it explicitly per host
+    # when several hosts share one order store.
+    ORDER_WORKER_ID: int = int(os.getenv("ORDER_WORKER_ID", "-1"))
+    # Threads used to read order logs off the event loop
+    ORDER_READ_THREADS: int = int(os.getenv("ORDER_READ_THREADS", "4"))
+    # Newest orders kept in memory per symbol, and in total across symbols
+    # (least recently used symbols are evicted first); 0 disables the cache
+    ORDER_CACHE_SYMBOL_ORDERS: int = int(
+        os.getenv("ORDER_CACHE_SYMBOL_ORDERS", "10000")
+    )
+    ORDER_CACHE_MAX_ORDERS: int = int(os.getenv("ORDER_CACHE_MAX_ORDERS", "100000"))
+    # Largest page size accepted by GET /api/orders
+    ORDER_PAGE_MAX: int = int(os.getenv("ORDER_PAGE_MAX", "5000"))
+
+    # Seconds between tick batches for the whole symbol universe
+    TICK_INTERVAL: float = float(os.getenv("TICK_INTERVAL", "1.0"))
+    # Price process for simulated ticks: "gbm" (random walk) or "ou" (mean
+    # reverting to the close price). Rates are annualized.
+    TICK_PRICE_MODEL: str = os.getenv("TICK_PRICE_MODEL", "ou")
+    TICK_DRIFT: float = float(os.getenv("TICK_DRIFT", "0.0"))
+    TICK_VOLATILITY: float = float(os.getenv("TICK_VOLATILITY", "0.4"))
+    TICK_MEAN_REVERSION: float = float(os.getenv("TICK_MEAN_REVERSION", "1000"))
+    # Tick source: "simulated" (price model) or "replay" of TICK_REPLAY_FILE,
+    # a recording in binary (memory-mapped) or NDJSON (*.ndjson) format.
+    # TICK_REPLAY_SPEED is a multiplier of the recorded pace, or "max".
+    TICK_SOURCE: str = os.getenv("TICK_SOURCE", "simulated")
+    TICK_REPLAY_FILE: str = os.getenv("TICK_REPLAY_FILE", "")
+    TICK_REPLAY_SPEED: str = os.getenv("TICK_REPLAY_SPEED", "1")
+    TICK_REPLAY_LOOP: bool = os.getenv("TICK_REPLAY_LOOP", "true").lower() == "true"
+    # Record every generated tick batch to this file (same formats); empty
+    # disables recording
+    TICK_RECORD_FILE: str = os.getenv("TICK_RECORD_FILE", "")
+    # Tick batches kept in memory for the snapshot sent to new subscribers;
+    # 0 disables snapshots
+    TICK_HISTORY: int = int(os.getenv("TICK_HISTORY", "300"))
+    # OHLCV bar intervals built from the tick stream (see BAR_INTERVALS in
+    # app/utils/bar_aggregator.py); empty disables bars. While bars are
+    # enabled, ticks are generated even when no client is subscribed.
+    BAR_INTERVALS: str = os.getenv("BAR_INTERVALS", "1s,1m,5m")
+    # Bars kept per symbol and interval
+    BAR_HISTORY: int = int(os.getenv("BAR_HISTORY", "500"))
+    # Frames buffered per WebSocket client before the oldest are dropped
+    TICK_QUEUE_SIZE: int = int(os.getenv("TICK_QUEUE_SIZE", "100"))
+    # Orders buffered per /ws/orders client before the oldest are dropped
+    ORDER_STREAM_QUEUE_SIZE: int = int(os.getenv("ORDER_STREAM_QUEUE_SIZE", "1000"))
+    # Send stream data as binary WebSocket frames of UTF-8 JSON, skipping the
+    # per-client text encoding; control frames stay text
+    WS_BINARY_FRAMES: bool = os.getenv("WS_BINARY_FRAMES", "false").lower() == "true"
+    # JSON encoder for stream frames: "auto" (orjson or msgspec if installed,
+    # else json), "orjson", "msgspec" or "json"
+    JSON_ENCODER: str = os.getenv("JSON_ENCODER", "auto")
+    # Maximum symbols a single WebSocket connection may subscribe to
+    WS_MAX_SUBSCRIPTIONS: int = int(os.getenv("WS_MAX_SUBSCRIPTIONS", "200"))
+
+    # Application log level, and "text" or "json" lines
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    # Also write logs to this file; empty logs to stdout only
+    LOG_FILE: str = os.getenv("LOG_FILE", "")
+    # Hand log records to a background thread that does the writes
+    LOG_ASYNC: bool = os.getenv("LOG_ASYNC", "false").lower() == "true"
+    # Serve Prometheus metrics at /metrics
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
     origins = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000")
     CORS_ALLOWED_ORIGINS: List[str] = origins.split(",")
@@ -30,7 +30,7 @@ def add_exception_handlers(app: FastAPI):
         """
         Handle all uncaught exceptions in a consistent JSON format.
         """
-        logger.error(f"Unhandled error on {request.url.path}: {exc}")
+        logger.error("Unhandled error on %s: %s", request.url.path, exc)
         return JSONResponse(
             status_code=500,
             content={
@@ -0,0 +1,126 @@
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import List, Optional
+from app.config import settings
+
+LOG_FORMATS = ("text", "json")
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Attributes of every LogRecord; any others were passed in ``extra``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None)))
+_RECORD_ATTRIBUTES.update({"message", "asctime", "taskName"})
+
+# Handlers installed on the root logger by configure_logging
+_handlers: List[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+_previous_level: Optional[int] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as one JSON object per line: time, level, logger and
+    message, plus any fields passed through ``extra``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener's handlers.
+
+    The stock handler formats records before queueing them, which would bake
+    the text layout into JSON logs. Only the message arguments and the
+    traceback are rendered here, since they may change after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(
+    level: str = settings.LOG_LEVEL,
+    fmt: str = settings.LOG_FORMAT,
+    use_queue: bool = settings.LOG_ASYNC,
+    log_file: str = settings.LOG_FILE,
+):
+    """
+    Send application logs to stdout, and to ``log_file`` if given.
+
+    With ``use_queue``, log calls only put the record on a queue; a
+    listener thread formats it and does the writes, so slow stdout or
+    disk I/O never blocks a request or the tick loop. Calling this again
+    replaces the previous configuration.
+    """
+    global _listener, _previous_level
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"Invalid log format {fmt!r}, expected one of {LOG_FORMATS}")
+    shutdown_logging()
+
+    formatter = JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    _previous_level = root.level
+    root.setLevel(level.upper())
+    if use_queue:
+        records: "queue.SimpleQueue" = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, *handlers)
+        _listener.start()
+        handlers = [_QueueHandler(records)]
+    for handler in handlers:
+        root.addHandler(handler)
+    _handlers.extend(handlers)
+
+
+def shutdown_logging():
+    """Flush queued records and remove the handlers added by configure_logging."""
+    global _listener, _previous_level
+    root = logging.getLogger()
+    for handler in _handlers:
+        root.removeHandler(handler)
+    if _listener is not None:
+        # Drains the queue before the listener thread exits
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    for handler in _handlers:
+        handler.close()
+    _handlers.clear()
+    if _previous_level is not None:
+        root.setLevel(_previous_level)
+        _previous_level = None
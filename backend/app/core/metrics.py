@@ -0,0 +1,377 @@
+import bisect
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Media type of the Prometheus text exposition format (the response adds the
+# utf-8 charset)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Histogram buckets for latencies, in seconds
+LATENCY_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+
+class _Sharded:
+    """
+    Per-thread storage for a metric's values.
+
+    Each thread only ever updates its own shard, so increments take no lock
+    and none are lost to a concurrent writer; readers sum all shards. The
+    lock is taken once per thread, when its shard is created.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[list] = []
+        self._lock = threading.Lock()
+
+    def shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0] * self._size
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def totals(self) -> list:
+        with self._lock:
+            shards = list(self._shards)
+        totals = [0] * self._size
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class _CounterChild(_Sharded):
+    def __init__(self):
+        super().__init__(1)
+
+    def inc(self, amount: float = 1):
+        self.shard()[0] += amount
+
+    def value(self) -> float:
+        return self.totals()[0]
+
+
+class _GaugeChild:
+    def __init__(self):
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = value
+
+    def value(self) -> float:
+        return self._value
+
+
+class _HistogramChild(_Sharded):
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # A count per bucket, one for +Inf, then the sum of observations
+        super().__init__(len(self.buckets) + 2)
+
+    def observe(self, value: float):
+        shard = self.shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def time(self) -> "_Timer":
+        """Observe the duration of the ``with`` block, in seconds."""
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: _HistogramChild):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+class Metric:
+    """
+    A named metric family with optional labels.
+
+    ``labels(*values)`` returns the child holding one label combination;
+    hot paths should look a child up once and keep it. Metrics without
+    labels forward ``inc``/``set``/``observe`` to their single child.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _label_pairs(self, key: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, key))
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in list(self._children.items()):
+            yield self.name, self._label_pairs(key), child.value()
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def samples(self) -> Iterable[Sample]:
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for key, child in list(self._children.items()):
+            labels = self._label_pairs(key)
+            totals = child.totals()
+            cumulative = 0
+            for bound, count in zip(bounds, totals):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + (("le", bound),), cumulative
+            yield f"{self.name}_sum", labels, totals[-1]
+            yield f"{self.name}_count", labels, cumulative
+
+
+class FanoutCounter(Metric):
+    """
+    Counter with one label, incremented for a whole tuple of label values at
+    once, such as one tick for every symbol of a batch. Each call counts the
+    tuple itself, which costs the same however long it is; counts are spread
+    over the individual values when scraped.
+    """
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelname: str):
+        super().__init__(name, documentation, (labelname,))
+        self._local = threading.local()
+        self._shards: List[Dict[tuple, int]] = []
+
+    def inc(self, values: tuple):
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        shard[values] = shard.get(values, 0) + 1
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            shards = list(self._shards)
+        totals: Dict[str, int] = {}
+        for shard in shards:
+            for values, count in list(shard.items()):
+                for value in values:
+                    totals[value] = totals.get(value, 0) + count
+        for value, count in sorted(totals.items()):
+            yield self.name, ((self.labelnames[0], value),), count
+
+
+class Registry:
+    """The metrics rendered by ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self, extra: Iterable[Metric] = ()) -> str:
+        """Render every metric, plus ``extra`` ones, in the text format."""
+        lines = []
+        for metric in list(self._metrics.values()) + list(extra):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+REGISTRY = Registry()
+
+ORDER_VALIDATION_SECONDS = REGISTRY.register(
+    Histogram(
+        "trading_order_validation_seconds",
+        "Time spent validating an order request.",
+        ("result",),
+    )
+)
+ORDER_REPOSITORY_SECONDS = REGISTRY.register(
+    Histogram(
+        "trading_order_repository_seconds",
+        "Time spent in order repository loads, queries and saves.",
+        ("backend", "operation"),
+    )
+)
+SYMBOLS_LOAD_SECONDS = REGISTRY.register(
+    Histogram(
+        "trading_symbols_load_seconds",
+        "Time spent reading and parsing the symbols file.",
+    )
+)
+TICKS_GENERATED = REGISTRY.register(
+    FanoutCounter(
+        "trading_ticks_generated_total",
+        "Ticks generated, per symbol.",
+        "symbol",
+    )
+)
+WS_SEND_SECONDS = REGISTRY.register(
+    Histogram(
+        "trading_ws_send_seconds",
+        "Time spent sending one frame to a WebSocket client.",
+        ("path",),
+    )
+)
+
+
+def stream_metrics(streams: Mapping[str, Optional[object]]) -> List[Metric]:
+    """
+    Describe the live subscriptions of each named broadcaster.
+
+    These are read from the broadcasters when scraped, so keeping them
+    current costs nothing on the subscribe and publish paths.
+    """
+    clients = Gauge(
+        "trading_ws_clients",
+        "WebSocket clients with at least one subscription.",
+        ("stream",),
+    )
+    subscriptions = Gauge(
+        "trading_ws_subscriptions",
+        "Active WebSocket subscriptions (client and topic pairs).",
+        ("stream",),
+    )
+    # Gauges rather than a histogram: depths are sampled per scrape, and
+    # histogram series must never go down.
+    depth_max = Gauge(
+        "trading_ws_queue_depth_max",
+        "Frames waiting in the fullest subscribed client's queue.",
+        ("stream",),
+    )
+    queued = Gauge(
+        "trading_ws_queued_frames",
+        "Frames waiting across all subscribed clients' queues.",
+        ("stream",),
+    )
+    for stream, broadcaster in streams.items():
+        if broadcaster is None:
+            continue
+        subscribers = broadcaster.subscribers()
+        clients.labels(stream).set(len(subscribers))
+        subscriptions.labels(stream).set(
+            sum(broadcaster.subscriber_count(topic) for topic in broadcaster.topics())
+        )
+        depths = [subscriber.qsize() for subscriber in subscribers]
+        depth_max.labels(stream).set(max(depths, default=0))
+        queued.labels(stream).set(sum(depths))
+    return [clients, subscriptions, depth_max, queued]
@@ -1,9 +1,71 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import routes_orders, routes_symbols, routes_ticks
+from app.api import (
+    routes_bars,
+    routes_metrics,
+    routes_order_stream,
+    routes_orders,
+    routes_symbols,
+    routes_ticks,
+)
 from app.config import settings
 from app.core.exception_handlers import add_exception_handlers
+from app.core.logging_config import configure_logging, shutdown_logging
+from app.repositories.order_backends import create_order_repository
+from app.services.bar_broadcaster import BarBroadcaster
+from app.services.order_broadcaster import OrderBroadcaster
+from app.services.order_service import OrderService
+from app.services.symbol_service import SymbolService
+from app.services.tick_broadcaster import TickBroadcaster
+from app.services.tick_service import create_tick_service
+from app.utils.id_generator import SnowflakeIdGenerator, claim_worker_id
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup and shutdown hooks.
+    """
+    configure_logging()
+    # Services are built once per process and injected from app.state
+    symbol_service = SymbolService()
+    # Warm the process-wide symbols snapshot before serving requests
+    symbol_service.get_symbol_map()
+    order_repository = create_order_repository()
+    # Finish writes interrupted by a crash of this or another worker
+    order_repository.recover()
+    worker_id = settings.ORDER_WORKER_ID
+    if worker_id < 0:
+        worker_id = claim_worker_id(settings.ORDERS_DIR)
+
+    app.state.symbol_service = symbol_service
+    app.state.order_repository = order_repository
+    app.state.order_broadcaster = OrderBroadcaster(symbol_service)
+    app.state.order_service = OrderService(
+        order_repository,
+        symbol_service=symbol_service,
+        id_generator=SnowflakeIdGenerator(worker_id),
+        broadcaster=app.state.order_broadcaster,
+    )
+    app.state.bar_broadcaster = BarBroadcaster(symbol_service)
+    tick_service = create_tick_service()
+    app.state.tick_broadcaster = TickBroadcaster(
+        tick_service, interval=settings.TICK_INTERVAL, bars=app.state.bar_broadcaster
+    )
+    if app.state.bar_broadcaster.intervals or tick_service.recorder is not None:
+        # Bars and recordings need a continuous tick stream, subscribers or not
+        app.state.tick_broadcaster.start()
+    try:
+        yield
+    finally:
+        await app.state.tick_broadcaster.stop()
+        tick_service.close()
+        # Flush pending order writes before the process exits
+        order_repository.close()
+        shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -14,6 +76,7 @@ def create_app() -> FastAPI:
         title="Trading Dashboard Backend",
         version="1.0.0",
         description="Backend service for the live trading dashboard",
+        lifespan=lifespan,
     )
 
     # Enable CORS
@@ -28,7 +91,11 @@ def create_app() -> FastAPI:
     # Register API routes
     app.include_router(routes_symbols.router, prefix="/api")
     app.include_router(routes_orders.router, prefix="/api")
+    app.include_router(routes_bars.router, prefix="/api")
     app.include_router(routes_ticks.router)
+    app.include_router(routes_order_stream.router)
+    if settings.METRICS_ENABLED:
+        app.include_router(routes_metrics.router)
 
     # Health check
     @app.get("/health", tags=["Health"])
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class Bar(BaseModel):
+    """OHLCV bar aggregated from ticks; ``start`` is the period start (epoch s)."""
+
+    symbol: str
+    interval: str
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Symbol(BaseModel):
     """Domain model representing a tradeable symbol (internal use)."""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     name: str
     market: str
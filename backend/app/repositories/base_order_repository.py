@@ -0,0 +1,161 @@
+import abc
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+from app.config import settings
+from app.core.metrics import ORDER_REPOSITORY_SECONDS
+from app.models.order import OrderResponse
+from app.repositories.order_writer import OrderWriter, PartialWriteError
+
+logger = logging.getLogger(__name__)
+
+
+class BaseOrderRepository(abc.ABC):
+    """
+    Storage-independent part of an order repository.
+
+    Subclasses implement ``save_orders``, ``load_orders``, ``query_orders``,
+    ``iter_orders`` and ``stored_symbols`` as blocking calls. The ``*_async``
+    methods run them on a dedicated writer thread and a small reader pool so
+    async routes never block the event loop. The writer group-commits: orders
+    queued close together are passed to ``save_orders`` as one batch, and each
+    caller is acknowledged once its batch is durable. A ``save_orders`` that
+    wrote only part of a batch raises ``PartialWriteError``, so only the
+    callers whose orders failed see an error.
+
+    Saves, and loads and queries made through the ``*_async`` methods, are
+    timed into ``trading_order_repository_seconds`` labelled with ``BACKEND``.
+    """
+
+    FSYNC_MODES = ("always", "batch", "never")
+    BACKEND = "base"
+
+    def __init__(
+        self,
+        fsync: str = settings.ORDER_FSYNC,
+        batch_window: float = settings.ORDER_BATCH_WINDOW_MS / 1000,
+        batch_max: int = settings.ORDER_BATCH_MAX,
+        read_threads: int = settings.ORDER_READ_THREADS,
+    ):
+        if fsync not in self.FSYNC_MODES:
+            raise ValueError(
+                f"Invalid fsync mode {fsync!r}, expected one of {self.FSYNC_MODES}"
+            )
+        self.fsync = fsync
+        self._timers = {
+            operation: ORDER_REPOSITORY_SECONDS.labels(self.BACKEND, operation)
+            for operation in ("load", "query", "save")
+        }
+        self._writer = OrderWriter(
+            self._save_timed,
+            # Only wait for more orders when the wait buys a shared fsync
+            window=batch_window if fsync == "batch" else 0.0,
+            max_batch=batch_max,
+        )
+        self._readers = ThreadPoolExecutor(
+            max_workers=read_threads, thread_name_prefix="order-reader"
+        )
+
+    @abc.abstractmethod
+    def save_orders(self, orders: List[OrderResponse]):
+        """Persist a batch of orders, durably according to the fsync mode."""
+
+    @abc.abstractmethod
+    def load_orders(self, symbol: str) -> List[OrderResponse]:
+        """Return every order of ``symbol`` in id order."""
+
+    @abc.abstractmethod
+    def query_orders(
+        self,
+        symbol: Optional[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[OrderResponse]:
+        """
+        Return one page of orders for ``symbol``, or across all symbols.
+
+        ``after_id``/``before_id`` are exclusive id cursors, ``since``/``until``
+        an inclusive timestamp range. Orders are returned in id order, or
+        newest first when ``descending`` is set.
+        """
+
+    @abc.abstractmethod
+    def iter_orders(self, symbol: str) -> Iterator[OrderResponse]:
+        """Yield the orders of ``symbol`` one at a time, in id order."""
+
+    @abc.abstractmethod
+    def stored_symbols(self) -> List[str]:
+        """Return the symbols that have stored orders, sorted."""
+
+    def recover(self) -> Dict[str, int]:
+        """Repair state left by crashed processes; called once at startup."""
+        return {}
+
+    def _merge_pages(
+        self,
+        pages: Iterable[List[OrderResponse]],
+        limit: Optional[int],
+        descending: bool,
+    ) -> List[OrderResponse]:
+        """Merge id-ordered per-symbol pages into one page."""
+        merged = heapq.merge(*pages, key=lambda o: o.id, reverse=descending)
+        return list(itertools.islice(merged, limit))
+
+    def _save_timed(self, orders: List[OrderResponse]):
+        with self._timers["save"].time():
+            self.save_orders(orders)
+
+    def _timed(self, operation: str, method, *args, **kwargs):
+        with self._timers[operation].time():
+            return method(*args, **kwargs)
+
+    def save_order(self, order: OrderResponse):
+        try:
+            self._save_timed([order])
+            logger.debug("Saved order %s for %s", order.id, order.symbol)
+        except Exception as e:
+            logger.error(
+                "Failed to save order %s for %s: %s",
+                order.id,
+                order.symbol,
+                e,
+                exc_info=True,
+            )
+            raise
+
+    async def save_order_async(self, order: OrderResponse):
+        """Persist ``order`` on the writer thread without blocking the loop."""
+        await asyncio.wrap_future(self._writer.submit(order))
+
+    async def load_orders_async(self, symbol: str) -> List[OrderResponse]:
+        """Load orders for ``symbol`` on the reader pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers, self._timed, "load", self.load_orders, symbol
+        )
+
+    async def query_orders_async(
+        self, symbol: Optional[str], **filters
+    ) -> List[OrderResponse]:
+        """Run ``query_orders`` on the reader pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers,
+            functools.partial(
+                self._timed, "query", self.query_orders, symbol, **filters
+            ),
+        )
+
+    def close(self):
+        """Drain queued writes and stop the writer thread and reader pool."""
+        self._writer.close()
+        self._readers.shutdown(wait=True)
@@ -0,0 +1,37 @@
+from typing import Optional
+from app.config import settings
+from app.repositories.base_order_repository import BaseOrderRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.sqlite_order_repository import SqliteOrderRepository
+
+ORDER_BACKENDS = ("jsonl", "sqlite")
+
+
+def create_order_repository(backend: Optional[str] = None) -> BaseOrderRepository:
+    """
+    Build the order repository selected by ``ORDER_BACKEND``.
+
+    Settings are read here rather than left to the constructors' defaults,
+    which were bound when the modules were imported.
+    """
+    backend = backend or settings.ORDER_BACKEND
+    writes = dict(
+        fsync=settings.ORDER_FSYNC,
+        batch_window=settings.ORDER_BATCH_WINDOW_MS / 1000,
+        batch_max=settings.ORDER_BATCH_MAX,
+    )
+    if backend == "jsonl":
+        return OrderRepository(
+            settings.ORDERS_DIR,
+            compact_every=settings.ORDER_LOG_COMPACT_EVERY,
+            **writes,
+        )
+    if backend == "sqlite":
+        return SqliteOrderRepository(
+            pool_size=settings.ORDER_DB_POOL_SIZE,
+            busy_timeout=settings.ORDER_DB_BUSY_TIMEOUT,
+            **writes,
+        )
+    raise ValueError(
+        f"Unknown order backend {backend!r}, expected one of {ORDER_BACKENDS}"
+    )
@@ -0,0 +1,206 @@
+import bisect
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+from app.config import settings
+from app.models.order import OrderResponse
+
+
+class CachedBook:
+    """
+    The orders of one symbol with the highest ids, sorted by id.
+
+    ``size`` is the byte size of the log the orders were read from; the book
+    is only valid while the log still has that size. ``floor`` is the highest
+    id an order missing from the book may have, or None when the book holds
+    every order of the symbol.
+    """
+
+    __slots__ = ("orders", "size", "floor")
+
+    def __init__(
+        self, orders: List[OrderResponse], size: int, floor: Optional[int] = None
+    ):
+        self.orders = orders
+        self.size = size
+        self.floor = floor
+
+    @property
+    def complete(self) -> bool:
+        return self.floor is None
+
+    def insert(self, orders: Iterable[OrderResponse], maxlen: int) -> int:
+        """Add orders in id order, keeping the ``maxlen`` highest; return the change."""
+        before = len(self.orders)
+        for order in orders:
+            if self.orders and order.id < self.orders[-1].id:
+                # Another process's ids interleave with ours
+                bisect.insort(self.orders, order, key=_order_id)
+            else:
+                self.orders.append(order)
+        excess = len(self.orders) - maxlen
+        if excess > 0:
+            dropped = self.orders[excess - 1].id
+            self.floor = dropped if self.floor is None else max(self.floor, dropped)
+            del self.orders[:excess]
+        return len(self.orders) - before
+
+
+class OrderCache:
+    """
+    Bounded, LRU-evicted cache of recent orders per symbol.
+
+    Each symbol keeps at most ``symbol_orders`` of its newest orders, and
+    least recently used symbols are evicted once the cache holds more than
+    ``max_orders`` orders in total. A limit of 0 disables the cache.
+
+    Books are validated by log size on every lookup, so appends and
+    compactions by other processes are noticed with a single ``stat``.
+    """
+
+    def __init__(
+        self,
+        max_orders: int = settings.ORDER_CACHE_MAX_ORDERS,
+        symbol_orders: int = settings.ORDER_CACHE_SYMBOL_ORDERS,
+    ):
+        self.max_orders = max_orders
+        self.symbol_orders = min(symbol_orders, max_orders)
+        self._books: "OrderedDict[str, CachedBook]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.symbol_orders > 0
+
+    def __len__(self) -> int:
+        """Number of orders currently cached across all symbols."""
+        return self._total
+
+    def get(self, symbol: str, size: int) -> Optional[CachedBook]:
+        """Return the book of ``symbol`` if it matches a log of ``size`` bytes."""
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is not None and book.size != size:
+                self._drop(symbol)
+                book = None
+            if book is None:
+                self.misses += 1
+                return None
+            self._books.move_to_end(symbol)
+            self.hits += 1
+            return book
+
+    def put(
+        self,
+        symbol: str,
+        orders: List[OrderResponse],
+        size: int,
+        complete: bool,
+    ) -> Optional[CachedBook]:
+        """
+        Cache ``orders`` of a log of ``size`` bytes. ``complete`` says whether
+        they are all of the symbol's orders; if not, they must be the ones
+        with the highest ids.
+        """
+        if not self.enabled:
+            return None
+        orders = sorted(orders, key=_order_id)
+        floor = None if complete or not orders else orders[0].id
+        book = CachedBook([], size, floor)
+        book.insert(orders, self.symbol_orders)
+        with self._lock:
+            self._drop(symbol)
+            self._books[symbol] = book
+            self._total += len(book.orders)
+            self._evict()
+        return book
+
+    def append(
+        self, symbol: str, orders: List[OrderResponse], old_size: int, new_size: int
+    ):
+        """
+        Write-through: extend the book of ``symbol`` with orders just appended,
+        growing its log from ``old_size`` to ``new_size`` bytes.
+        """
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is None:
+                return
+            if book.size != old_size:
+                # The book missed someone else's appends
+                self._drop(symbol)
+                return
+            self._total += book.insert(orders, self.symbol_orders)
+            book.size = new_size
+            self._evict()
+
+    def invalidate(self, symbol: str):
+        with self._lock:
+            self._drop(symbol)
+
+    def clear(self):
+        with self._lock:
+            self._books.clear()
+            self._total = 0
+
+    def _drop(self, symbol: str):
+        book = self._books.pop(symbol, None)
+        if book is not None:
+            self._total -= len(book.orders)
+
+    def _evict(self):
+        while self._total > self.max_orders and self._books:
+            _, book = self._books.popitem(last=False)
+            self._total -= len(book.orders)
+
+    def orders(self, book: CachedBook) -> List[OrderResponse]:
+        """Return a snapshot of the orders in ``book``."""
+        with self._lock:
+            return list(book.orders)
+
+    def select(
+        self,
+        book: CachedBook,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> Optional[List[OrderResponse]]:
+        """
+        Answer a query from ``book``, or return None if the answer may
+        include orders older than the cached window.
+        """
+        with self._lock:
+            orders = list(book.orders)
+            floor = book.floor
+        covered = floor is None or (after_id is not None and after_id >= floor)
+        if not covered and not (descending and limit is not None):
+            return None
+
+        result = []
+        for order in reversed(orders) if descending else orders:
+            if not covered and order.id <= floor:
+                # Orders missing from the book may come before this one
+                return None
+            if (
+                (side is not None and order.side != side)
+                or (after_id is not None and order.id <= after_id)
+                or (before_id is not None and order.id >= before_id)
+                or (since is not None and order.timestamp < since)
+                or (until is not None and order.timestamp > until)
+            ):
+                continue
+            result.append(order)
+            if limit is not None and len(result) >= limit:
+                return result
+        return result if covered else None
+
+
+def _order_id(order: OrderResponse) -> int:
+    return order.id
@@ -0,0 +1,256 @@
+import bisect
+import json
+import mmap
+import os
+import struct
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# One fixed-size record per logged order: id, timestamp, byte offset and
+# length of its line in the log, and side. Records are stored in log order.
+RECORD = struct.Struct("<qqQIB3x")
+RECORD_DTYPE = np.dtype(
+    {
+        "names": ["id", "timestamp", "offset", "length", "side"],
+        "formats": ["<i8", "<i8", "<u8", "<u4", "u1"],
+        "offsets": [0, 8, 16, 24, 28],
+        "itemsize": RECORD.size,
+    }
+)
+
+SIDES = {"BUY": 0, "SELL": 1}
+
+
+def pack_entry(order_id: int, timestamp: int, offset: int, length: int, side: str):
+    return RECORD.pack(order_id, timestamp, offset, length, SIDES[side])
+
+
+def build_index(log_path: str, start: int = 0) -> bytes:
+    """Scan a JSON-lines order log from ``start`` and return its index records."""
+    entries = []
+    offset = start
+    with open(log_path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            length = len(line)
+            if line.endswith(b"\n") and line.strip():
+                try:
+                    record = json.loads(line)
+                    entries.append(
+                        pack_entry(
+                            record["id"],
+                            record["timestamp"],
+                            offset,
+                            length,
+                            record["side"],
+                        )
+                    )
+                except (ValueError, KeyError, TypeError, struct.error):
+                    # Corrupt lines are skipped by readers as well
+                    pass
+            offset += length
+    return b"".join(entries)
+
+
+def index_end(index_path: str) -> Tuple[int, int]:
+    """
+    Return ``(size, end)`` for an index: the size covered by whole records,
+    and the log offset just past the last indexed line (0 when empty).
+    """
+    if not os.path.exists(index_path):
+        return 0, 0
+    with open(index_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        size -= size % RECORD.size
+        if size == 0:
+            return 0, 0
+        f.seek(size - RECORD.size)
+        _, _, offset, length, _ = RECORD.unpack(f.read(RECORD.size))
+    return size, offset + length
+
+
+class IndexOrder(NamedTuple):
+    """Whether the first ``count`` records of an index file are sorted."""
+
+    inode: int
+    count: int
+    # Last record checked, telling a replaced file that reused the inode apart
+    last: bytes
+    ids: bool
+    timestamps: bool
+
+
+class OrderIndexReader:
+    """
+    Read-only, memory-mapped view of an order index.
+
+    A single writer appends ids and timestamps in increasing order, so range
+    bounds are found by binary search and only the records of the requested
+    page are touched. Processes sharing a log interleave their appends, and
+    then ids (or timestamps) are no longer sorted in log order: the reader
+    notices on open and falls back to a vectorized scan of every record,
+    sorted by id. Compaction rewrites the log in id order again.
+
+    Checking the order costs a pass over the index; given the ``order`` of an
+    earlier reader of the same file, only records appended since are checked.
+    """
+
+    def __init__(self, index_path: str, known: Optional[IndexOrder] = None):
+        self._file = open(index_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # A record still being appended is ignored
+        self._count = size // RECORD.size
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._count
+            else None
+        )
+        self._records = (
+            np.frombuffer(self._map, RECORD_DTYPE, self._count)
+            if self._count
+            else np.empty(0, RECORD_DTYPE)
+        )
+        self.order = self._check_order(known)
+        self.ids_in_order = self.order.ids
+        self.timestamps_in_order = self.order.timestamps
+
+    def _check_order(self, known: Optional[IndexOrder]) -> IndexOrder:
+        inode = os.fstat(self._file.fileno()).st_ino
+        start, ids, timestamps = 0, True, True
+        if (
+            known is not None
+            and known.inode == inode
+            and 0 < known.count <= self._count
+            and self._raw(known.count - 1) == known.last
+        ):
+            start, ids, timestamps = known.count - 1, known.ids, known.timestamps
+        checked = self._records[start:]
+        ids = ids and _is_sorted(checked["id"])
+        timestamps = timestamps and _is_sorted(checked["timestamp"])
+        last = self._raw(self._count - 1) if self._count else b""
+        return IndexOrder(inode, self._count, last, ids, timestamps)
+
+    def _raw(self, position: int) -> bytes:
+        start = position * RECORD.size
+        return self._map[start : start + RECORD.size]
+
+    def __enter__(self) -> "OrderIndexReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # The array must go before the map it views can be closed
+        self._records = None
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> tuple:
+        return RECORD.unpack_from(self._map, position * RECORD.size)
+
+    def select(
+        self,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[Tuple[int, int]]:
+        """Return ``(offset, length)`` log spans of matching orders, in id order."""
+        if not self.ids_in_order:
+            positions = self._scan(after_id, before_id, since, until, side)
+            if descending:
+                positions = positions[::-1]
+            if limit is not None:
+                positions = positions[:limit]
+            return self._spans(positions)
+
+        lo, hi = 0, self._count
+        if after_id is not None:
+            lo = max(lo, bisect.bisect_right(self, after_id, key=_id))
+        if before_id is not None:
+            hi = min(hi, bisect.bisect_left(self, before_id, key=_id))
+        if self.timestamps_in_order:
+            if since is not None:
+                lo = max(lo, bisect.bisect_left(self, since, key=_timestamp))
+            if until is not None:
+                hi = min(hi, bisect.bisect_right(self, until, key=_timestamp))
+        side_code = SIDES[side] if side is not None else None
+
+        spans = []
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        for position in positions:
+            order_id, timestamp, offset, length, code = self[position]
+            if (
+                (side_code is not None and code != side_code)
+                or (since is not None and timestamp < since)
+                or (until is not None and timestamp > until)
+            ):
+                continue
+            spans.append((offset, length))
+            if limit is not None and len(spans) >= limit:
+                break
+        return spans
+
+    def needs_compaction(self, log_size: int) -> bool:
+        """
+        Whether compacting the log of ``log_size`` bytes would change it:
+        ids out of order, lines skipped as corrupt, or an id logged twice.
+        """
+        if not self.ids_in_order:
+            return True
+        if int(self._records["length"].sum(dtype=np.uint64)) != log_size:
+            return True
+        ids = self._records["id"]
+        return bool(np.any(ids[1:] == ids[:-1]))
+
+    def iter_spans(self) -> Iterator[Tuple[int, int]]:
+        """Yield the ``(offset, length)`` log span of every order, in id order."""
+        if self.ids_in_order:
+            positions = range(self._count)
+        else:
+            positions = np.argsort(self._records["id"], kind="stable")
+        for position in positions:
+            _, _, offset, length, _ = self[position]
+            yield offset, length
+
+    def _scan(self, after_id, before_id, since, until, side) -> np.ndarray:
+        """Positions of every matching record, sorted by id (stable)."""
+        records = self._records
+        mask = np.ones(self._count, dtype=bool)
+        if after_id is not None:
+            mask &= records["id"] > after_id
+        if before_id is not None:
+            mask &= records["id"] < before_id
+        if since is not None:
+            mask &= records["timestamp"] >= since
+        if until is not None:
+            mask &= records["timestamp"] <= until
+        if side is not None:
+            mask &= records["side"] == SIDES[side]
+        positions = np.flatnonzero(mask)
+        return positions[np.argsort(records["id"][positions], kind="stable")]
+
+    def _spans(self, positions: np.ndarray) -> List[Tuple[int, int]]:
+        records = self._records[positions]
+        return list(zip(records["offset"].tolist(), records["length"].tolist()))
+
+
+def _is_sorted(values: np.ndarray) -> bool:
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _id(record: tuple) -> int:
+    return record[0]
+
+
+def _timestamp(record: tuple) -> int:
+    return record[1]
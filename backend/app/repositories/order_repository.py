@@ -1,50 +1,787 @@
 import json
 import os
 import logging
-from typing import List
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 from app.config import settings
 from app.models.order import OrderResponse
+from app.repositories.base_order_repository import BaseOrderRepository
+from app.repositories.order_cache import OrderCache
+from app.repositories.order_index import (
+    RECORD,
+    IndexOrder,
+    OrderIndexReader,
+    build_index,
+    index_end,
+    pack_entry,
+)
+from app.repositories.order_writer import PartialWriteError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
 
-class OrderRepository:
-    """Handles persistence of orders to JSON files."""
+class OrderRepository(BaseOrderRepository):
+    """
+    Handles persistence of orders to append-only JSON-lines logs.
+
+    Each symbol has a ``<SYMBOL>.jsonl`` log holding one order per line and a
+    ``<SYMBOL>.idx`` index of it. Several processes may share ``orders_dir``.
+    """
+
+    BACKEND = "jsonl"
+    LOG_SUFFIX = ".jsonl"
+    INDEX_SUFFIX = ".idx"
+    LOCK_SUFFIX = ".lock"
+    TMP_SUFFIX = ".tmp"
+    LEGACY_SUFFIX = ".json"
+    MIGRATED_SUFFIX = ".json.migrated"
 
-    def __init__(self, orders_dir: str = settings.ORDERS_DIR):
+    def __init__(
+        self,
+        orders_dir: str = settings.ORDERS_DIR,
+        compact_every: int = settings.ORDER_LOG_COMPACT_EVERY,
+        fsync: str = settings.ORDER_FSYNC,
+        batch_window: float = settings.ORDER_BATCH_WINDOW_MS / 1000,
+        batch_max: int = settings.ORDER_BATCH_MAX,
+        cache: Optional[OrderCache] = None,
+    ):
+        super().__init__(fsync, batch_window, batch_max)
+        self.cache = cache if cache is not None else OrderCache()
         self.orders_dir = orders_dir
+        self.compact_every = compact_every
+        self._handles: Dict[str, BinaryIO] = {}
+        self._index_handles: Dict[str, BinaryIO] = {}
+        # Log size after this process's last append; any other size means
+        # another process touched the log since
+        self._sizes: Dict[str, int] = {}
+        self._lock_fds: Dict[str, int] = {}
+        # What the last reader of each index found about its order
+        self._index_orders: Dict[str, IndexOrder] = {}
+        self._appends: Dict[str, int] = {}
+        self._compact_threshold: Dict[str, int] = {}
+        # Compaction runs off the writer thread, one symbol at a time
+        self._compactor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="order-compactor"
+        )
+        self._compacting = set()
+        self._migrated = set()
+        # One lock per symbol; ``_locks_lock`` is only held to create them
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
         os.makedirs(orders_dir, exist_ok=True)
 
     def _file_path(self, symbol: str) -> str:
-        return os.path.join(self.orders_dir, f"{symbol}.json")
+        return os.path.join(self.orders_dir, f"{symbol}{self.LOG_SUFFIX}")
 
-    def load_orders(self, symbol: str) -> List[OrderResponse]:
+    def _legacy_file_path(self, symbol: str) -> str:
+        return os.path.join(self.orders_dir, f"{symbol}{self.LEGACY_SUFFIX}")
+
+    def _index_path(self, symbol: str) -> str:
+        return os.path.join(self.orders_dir, f"{symbol}{self.INDEX_SUFFIX}")
+
+    def _thread_lock(self, symbol: str) -> threading.Lock:
+        with self._locks_lock:
+            lock = self._symbol_locks.get(symbol)
+            if lock is None:
+                lock = self._symbol_locks[symbol] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def _symbol_lock(self, symbol: str):
+        """
+        Hold this process's lock and an exclusive flock for ``symbol``.
+
+        Both are per symbol, so waiting on another process's flock only
+        blocks work on that symbol. The flock lives on a separate lock file
+        because logs and indexes are replaced by rename, and a lock on a
+        replaced inode excludes nobody. Not reentrant.
+        """
+        with self._thread_lock(symbol):
+            if fcntl is None:
+                yield
+                return
+            fd = self._lock_fds.get(symbol)
+            if fd is None:
+                path = os.path.join(self.orders_dir, f"{symbol}{self.LOCK_SUFFIX}")
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+                self._lock_fds[symbol] = fd
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _write_atomic(self, file_path: str, data: bytes):
+        """Write data to a temp file, sync it, and rename it over ``file_path``."""
+        tmp_path = f"{file_path}{self.TMP_SUFFIX}"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+        self._sync_directory()
+
+    def _sync_directory(self):
+        """Make renames in ``orders_dir`` durable."""
+        try:
+            fd = os.open(self.orders_dir, os.O_RDONLY)
+        except OSError:  # pragma: no cover - directories cannot be opened
+            return
+        try:
+            os.fsync(fd)
+        except OSError:  # pragma: no cover - not supported on this platform
+            pass
+        finally:
+            os.close(fd)
+
+    def _repair_tail(self, symbol: str) -> int:
+        """
+        Truncate a partial last record left by a crashed writer.
+
+        Must hold the symbol lock, so no live writer is mid-append. Returns
+        the resulting log size.
+        """
         file_path = self._file_path(symbol)
         if not os.path.exists(file_path):
-            logger.info(f"No orders file found for {symbol}, returning empty list")
-            return []
-        try:
-            with open(file_path, "r") as f:
+            return 0
+        with open(file_path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return 0
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return size
+            end = 0
+            position = size
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                position = start
+            f.truncate(end)
+        logger.warning("Truncated torn record at %s:%s-%s", file_path, end, size)
+        return end
+
+    def _refresh_index(self, symbol: str, log_size: int):
+        """
+        Bring the index of ``symbol`` in line with a log of ``log_size`` bytes.
+
+        The index is derived data: lines appended past the last indexed
+        record are indexed, and an index pointing beyond the log is rebuilt.
+        Must hold the symbol lock.
+        """
+        index_path = self._index_path(symbol)
+        size, end = index_end(index_path)
+        if end == log_size:
+            if os.path.exists(index_path) and os.path.getsize(index_path) != size:
+                os.truncate(index_path, size)
+            return
+        if end < log_size and os.path.exists(index_path):
+            entries = build_index(self._file_path(symbol), start=end)
+            with open(index_path, "r+b") as f:
+                f.truncate(size)
+                f.seek(size)
+                f.write(entries)
+            logger.info(
+                "Indexed %s new orders in %s", len(entries) // RECORD.size, index_path
+            )
+            return
+        data = build_index(self._file_path(symbol)) if log_size else b""
+        self._write_atomic(index_path, data)
+        logger.info("Rebuilt order index %s", index_path)
+
+    def _ensure_migrated(self, symbol: str):
+        """Convert a legacy JSON array file for ``symbol`` into a log, once."""
+        if symbol in self._migrated:
+            return
+        with self._symbol_lock(symbol):
+            self._migrate_legacy(symbol)
+        self._migrated.add(symbol)
+
+    def _migrate_legacy(self, symbol: str):
+        legacy_path = self._legacy_file_path(symbol)
+        if not os.path.exists(legacy_path):
+            return
+        file_path = self._file_path(symbol)
+        if not os.path.exists(file_path):
+            with open(legacy_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                logger.debug(f"Loaded {len(data)} orders from {file_path}")
-                return [OrderResponse(**o) for o in data]
+            self._write_atomic(
+                file_path,
+                b"".join(
+                    OrderResponse(**o).model_dump_json().encode() + b"\n" for o in data
+                ),
+            )
+            logger.info("Migrated %s legacy orders for %s", len(data), symbol)
+        migrated_path = os.path.join(self.orders_dir, f"{symbol}{self.MIGRATED_SUFFIX}")
+        os.replace(legacy_path, migrated_path)
+        self._sync_directory()
+
+    def recover(self) -> Dict[str, int]:
+        """
+        Startup scan: finish interrupted writes for every stored symbol.
+
+        Removes temp files left by interrupted rewrites, migrates legacy
+        files, truncates torn trailing records and rebuilds stale indexes.
+        Safe to run while other processes are writing. Returns the log size
+        of each symbol.
+        """
+        sizes = {}
+        for name in os.listdir(self.orders_dir):
+            if name.endswith(self.TMP_SUFFIX):
+                # Symbols may contain dots (BRK.B), so only known suffixes
+                # are stripped; compaction temp files also carry a tag
+                base = name[: -len(self.TMP_SUFFIX)]
+                suffixes = (self.LOG_SUFFIX, self.INDEX_SUFFIX)
+                symbol = self._symbol_of(base, suffixes) or self._symbol_of(
+                    base.rpartition(".")[0], suffixes
+                )
+                if symbol is None:
+                    continue
+                with self._symbol_lock(symbol):
+                    tmp_path = os.path.join(self.orders_dir, name)
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                        logger.warning("Removed interrupted rewrite %s", tmp_path)
+        for symbol in self.stored_symbols():
+            self._ensure_migrated(symbol)
+            with self._symbol_lock(symbol):
+                sizes[symbol] = self._repair_tail(symbol)
+                self._refresh_index(symbol, sizes[symbol])
+        logger.info("Recovered order logs for %s symbols", len(sizes))
+        return sizes
+
+    def _read_log(self, symbol: str) -> List[OrderResponse]:
+        return list(self._iter_log(symbol))
+
+    def _iter_log(self, symbol: str) -> Iterator[OrderResponse]:
+        file_path = self._file_path(symbol)
+        with open(file_path, "rb") as f:
+            yield from self._parse_log(f, file_path)
+
+    @staticmethod
+    def _parse_log(
+        f: BinaryIO, file_path: str, end: Optional[int] = None
+    ) -> Iterator[OrderResponse]:
+        """Parse the orders of an open log, stopping at byte ``end`` if given."""
+        offset = 0
+        for line_no, line in enumerate(f, start=1):
+            offset += len(line)
+            if not line.endswith(b"\n") or (end is not None and offset > end):
+                # Last record is still being written (or was torn)
+                break
+            if not line.strip():
+                continue
+            try:
+                order = OrderResponse.model_validate_json(line)
+            except ValueError:
+                # A torn write leaves a partial last line; skip it rather
+                # than failing the whole book.
+                logger.warning("Skipping corrupt record %s:%s", file_path, line_no)
+                continue
+            yield order
+
+    def _log_size(self, symbol: str) -> Optional[int]:
+        try:
+            return os.path.getsize(self._file_path(symbol))
+        except FileNotFoundError:
+            return None
+
+    def load_orders(self, symbol: str) -> List[OrderResponse]:
+        """
+        Return every order of ``symbol`` in id order.
+
+        Served from the cache, which appends write through to, as long as the
+        log size shows no other process changed the log.
+        """
+        file_path = self._file_path(symbol)
+        try:
+            self._ensure_migrated(symbol)
+            size = self._log_size(symbol)
+            if size is None:
+                logger.info("No orders file found for %s, returning empty list", symbol)
+                return []
+            book = self.cache.get(symbol, size) if self.cache.enabled else None
+            if book is not None and book.complete:
+                return self.cache.orders(book)
+            # Logs are only ever appended to or replaced by rename, so an
+            # unlocked read sees a consistent prefix. It may also see lines
+            # appended after the size was taken; the cached book then fails
+            # validation on the next read and is reloaded.
+            # Stable, and linear for a log already in id order
+            orders = sorted(self._read_log(symbol), key=_order_id)
+            self.cache.put(symbol, orders, size, complete=True)
+            logger.debug("Loaded %s orders from %s", len(orders), file_path)
+            return orders
         except Exception as e:
-            logger.error(f"Failed to load orders from {file_path}: {e}", exc_info=True)
+            logger.error(
+                "Failed to load orders from %s: %s", file_path, e, exc_info=True
+            )
             raise
 
-    def save_order(self, order: OrderResponse):
-        file_path = self._file_path(order.symbol)
+    def iter_orders(self, symbol: str) -> Iterator[OrderResponse]:
+        """
+        Yield the orders of ``symbol`` one at a time, in id order.
+
+        Only one record is held in memory at a time. Lines are read through
+        the index and log opened together, so a compaction running meanwhile
+        does not disturb them.
+        """
+        self._ensure_migrated(symbol)
+        opened = self._open_index(symbol)
+        if opened is None:
+            return
+        index, log, _ = opened
+        with index, log:
+            for offset, length in index.iter_spans():
+                log.seek(offset)
+                yield OrderResponse.model_validate_json(log.read(length))
+
+    @staticmethod
+    def _symbol_of(name: str, suffixes: Tuple[str, ...]) -> Optional[str]:
+        """Return the symbol of a file named ``<SYMBOL><suffix>``, if it is one."""
+        for suffix in suffixes:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                return name[: -len(suffix)]
+        return None
+
+    def stored_symbols(self) -> List[str]:
+        """Return the symbols that have an order log, sorted."""
+        suffixes = (self.LOG_SUFFIX, self.LEGACY_SUFFIX)
+        symbols = (
+            self._symbol_of(name, suffixes) for name in os.listdir(self.orders_dir)
+        )
+        return sorted({symbol for symbol in symbols if symbol is not None})
+
+    def query_orders(
+        self,
+        symbol: Optional[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[OrderResponse]:
+        """
+        Return one page of orders using the offset index.
+
+        The index is binary searched for the page, so only its lines are read
+        from the log. Without a symbol, each stored symbol is queried for a
+        full page and the pages are merged by id.
+        """
+        filters = (limit, after_id, before_id, since, until, side)
+        if symbol is None:
+            pages = [
+                self.query_orders(s, *filters, descending=descending)
+                for s in self.stored_symbols()
+            ]
+            return self._merge_pages(pages, limit, descending)
+        if not descending and all(f is None for f in filters):
+            return self.load_orders(symbol)
+
+        file_path = self._file_path(symbol)
         try:
-            orders = []
-            if os.path.exists(file_path):
-                with open(file_path, "r") as f:
-                    orders = json.load(f)
-            orders.append(order.dict())
-            with open(file_path, "w") as f:
-                json.dump(orders, f, indent=2)
-            logger.debug(f"Saved order {order.id} to {file_path}")
+            self._ensure_migrated(symbol)
+            if self.cache.enabled:
+                orders = self._query_cache(symbol, *filters, descending)
+                if orders is not None:
+                    return orders
+            orders, _, _ = self._query_index(symbol, *filters, descending)
+            logger.debug("Queried %s orders from %s", len(orders), file_path)
+            return orders
         except Exception as e:
             logger.error(
-                f"Failed to save order {order.id} to {file_path}: {e}", exc_info=True
+                "Failed to query orders from %s: %s", file_path, e, exc_info=True
             )
             raise
+
+    def _query_cache(self, symbol: str, *filters) -> Optional[List[OrderResponse]]:
+        """Answer a query from the cached recent window, loading it on a miss."""
+        size = self._log_size(symbol)
+        if size is None:
+            return []
+        book = self.cache.get(symbol, size)
+        if book is None:
+            window, total, size = self._query_index(
+                symbol, limit=self.cache.symbol_orders, descending=True
+            )
+            window.reverse()
+            book = self.cache.put(symbol, window, size, complete=len(window) == total)
+        return self.cache.select(book, *filters)
+
+    def _query_index(
+        self,
+        symbol: str,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> Tuple[List[OrderResponse], int, int]:
+        """
+        Read a page through the offset index. Returns the orders, the number
+        of indexed orders and the log size the index was checked against.
+        """
+        opened = self._open_index(symbol)
+        if opened is None:
+            return [], 0, 0
+        index, log, size = opened
+        with index, log:
+            spans = index.select(
+                limit, after_id, before_id, since, until, side, descending
+            )
+            orders = []
+            for offset, length in spans:
+                log.seek(offset)
+                orders.append(OrderResponse.model_validate_json(log.read(length)))
+            return orders, len(index), size
+
+    def _open_index(
+        self, symbol: str
+    ) -> Optional[Tuple[OrderIndexReader, BinaryIO, int]]:
+        """
+        Open the up-to-date index and the log of ``symbol``, if it has one.
+        Returns both files and the log size the index was checked against.
+        """
+        file_path = self._file_path(symbol)
+        # Open the index and log together under the lock; the open files
+        # stay consistent even if they are compacted away afterwards.
+        with self._symbol_lock(symbol):
+            if not os.path.exists(file_path):
+                return None
+            size = os.path.getsize(file_path)
+            self._refresh_index(symbol, size)
+            index = OrderIndexReader(
+                self._index_path(symbol), self._index_orders.get(symbol)
+            )
+            self._index_orders[symbol] = index.order
+            return index, open(file_path, "rb"), size
+
+    def _prepare_append(self, symbol: str) -> Tuple[BinaryIO, BinaryIO, int]:
+        """
+        Return the log and index handles of ``symbol`` and the log size.
+
+        Must hold the symbol lock. Reconciles the files with whatever other
+        processes did since this process last appended: a log compacted away
+        is reopened, a record torn by a crashed writer is truncated, and
+        lines appended by others are indexed.
+        """
+        file_path = self._file_path(symbol)
+        index_path = self._index_path(symbol)
+        handle = self._handles.get(symbol)
+        if handle is not None:
+            try:
+                current = os.stat(file_path).st_ino == os.fstat(handle.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current and os.fstat(handle.fileno()).st_size == self._sizes[symbol]:
+                return handle, self._index_handles[symbol], self._sizes[symbol]
+            # Compacted or appended to by another process
+            self._close_handle(symbol)
+
+        size = self._repair_tail(symbol)
+        self._refresh_index(symbol, size)
+        handle = open(file_path, "ab")
+        self._handles[symbol] = handle
+        self._index_handles[symbol] = open(index_path, "ab")
+        self._sizes[symbol] = size
+        return handle, self._index_handles[symbol], size
+
+    def _append_batch(self, symbol: str, orders: List[OrderResponse]):
+        """
+        Append orders of one symbol under its lock and sync them.
+
+        If any write or sync fails, the log and index are cut back to where
+        they were, so orders reported as failed are never loaded later.
+        """
+        with self._symbol_lock(symbol):
+            handle, index_handle, offset = self._prepare_append(symbol)
+            start, index_start = offset, index_handle.tell()
+            try:
+                for order in orders:
+                    data = order.model_dump_json().encode() + b"\n"
+                    handle.write(data)
+                    index_handle.write(
+                        pack_entry(
+                            order.id, order.timestamp, offset, len(data), order.side
+                        )
+                    )
+                    offset += len(data)
+                    if self.fsync == "always":
+                        self._sync(handle, index_handle, durable=True)
+                if self.fsync != "always":
+                    self._sync(handle, index_handle, durable=self.fsync == "batch")
+            except BaseException:
+                self._rollback(symbol, start, index_start)
+                raise
+            self.cache.append(symbol, orders, start, offset)
+            self._sizes[symbol] = offset
+        self._appends[symbol] = self._appends.get(symbol, 0) + len(orders)
+
+    def _rollback(self, symbol: str, size: int, index_size: int):
+        """
+        Truncate the log and index of ``symbol`` to ``size`` and ``index_size``.
+
+        Must hold the symbol lock. Buffered writes are dropped with the
+        handles, which are reopened by the next append.
+        """
+        self._sizes.pop(symbol, None)
+        for handles in (self._handles, self._index_handles):
+            handle = handles.pop(symbol, None)
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass
+        try:
+            for path, length in (
+                (self._file_path(symbol), size),
+                (self._index_path(symbol), index_size),
+            ):
+                with open(path, "r+b") as f:
+                    f.truncate(length)
+                    os.fsync(f.fileno())
+        except OSError:
+            logger.error("Failed to roll back append to %s", symbol, exc_info=True)
+
+    def _compact_due(self, symbol: str):
+        """
+        Schedule a check of ``symbol`` on the compactor thread once enough
+        orders were appended since the last one.
+        """
+        if self._appends.get(symbol, 0) < self._compact_threshold.get(
+            symbol, self.compact_every
+        ):
+            return
+        self._appends[symbol] = 0
+        if symbol not in self._compacting:
+            self._compacting.add(symbol)
+            self._compactor.submit(self._compact_if_needed, symbol)
+
+    def _compact_if_needed(self, symbol: str):
+        """Compact ``symbol`` if its index shows anything compaction would fix."""
+        try:
+            opened = self._open_index(symbol)
+            if opened is None:
+                return
+            index, log, size = opened
+            with index, log:
+                needed = index.needs_compaction(size)
+                count = len(index)
+            if needed:
+                self.compact(symbol)
+            else:
+                # Checking costs a pass over the index, so it is amortized
+                # like compaction itself
+                self._compact_threshold[symbol] = max(self.compact_every, count)
+        except Exception as e:
+            # The appended orders are already durable; only the rewrite failed
+            logger.error("Failed to compact %s: %s", symbol, e, exc_info=True)
+        finally:
+            self._compacting.discard(symbol)
+
+    def _sync(self, handle: BinaryIO, index_handle: BinaryIO, durable: bool):
+        # Everything is flushed before the lock is released, so other
+        # processes never see a partial record from a live writer.
+        handle.flush()
+        # The index only ever points at flushed log lines; it is rebuilt
+        # from the log after a crash, so it is never fsynced.
+        index_handle.flush()
+        if durable:
+            os.fsync(handle.fileno())
+
+    def save_orders(self, orders: List[OrderResponse]):
+        """
+        Append a batch of orders, syncing according to the fsync mode.
+
+        ``always`` syncs after every order, ``batch`` once per touched log at
+        the end of the batch, and ``never`` only flushes to the OS. Symbols
+        are written independently: if only some of them fail, the others are
+        kept and ``PartialWriteError`` names the failed orders.
+        """
+        positions: Dict[str, List[int]] = {}
+        for i, order in enumerate(orders):
+            positions.setdefault(order.symbol, []).append(i)
+        errors: Dict[int, BaseException] = {}
+        for symbol, symbol_positions in positions.items():
+            try:
+                self._ensure_migrated(symbol)
+                self._append_batch(symbol, [orders[i] for i in symbol_positions])
+            except Exception as e:
+                logger.error(
+                    "Failed to save %s orders for %s: %s",
+                    len(symbol_positions),
+                    symbol,
+                    e,
+                    exc_info=True,
+                )
+                errors.update(dict.fromkeys(symbol_positions, e))
+            else:
+                self._compact_due(symbol)
+        if errors and len(errors) == len(orders):
+            raise errors[0]
+        if errors:
+            raise PartialWriteError(errors)
+        logger.debug("Saved batch of %s orders", len(orders))
+
+    def compact(self, symbol: str) -> int:
+        """
+        Rewrite the log for ``symbol`` in id order, without corrupt lines or
+        repeated records.
+
+        Only exact copies of a record are dropped: legacy ids are millisecond
+        timestamps, so distinct legacy orders can share an id.
+
+        The log is read and rewritten to temp files without holding the symbol
+        lock, so appends carry on meanwhile. The lock is only taken to copy
+        the lines appended since and to rename the temp files into place.
+
+        The next compaction is scheduled once as many orders have been appended
+        as the compacted log holds, which keeps the amortized cost per insert
+        constant. Returns the number of orders kept, or 0 if there is no log or
+        another process replaced it first.
+        """
+        file_path = self._file_path(symbol)
+        index_path = self._index_path(symbol)
+        self._ensure_migrated(symbol)
+        with self._symbol_lock(symbol):
+            if not os.path.exists(file_path):
+                return 0
+            end = self._repair_tail(symbol)
+            log = open(file_path, "rb")
+        tmp_log = tmp_index = None
+        try:
+            with log:
+                inode = os.fstat(log.fileno()).st_ino
+                orders = sorted(self._parse_log(log, file_path, end), key=_order_id)
+                tmp_log = self._tmp_file(file_path)
+                tmp_index = self._tmp_file(index_path)
+                seen = set()
+                offset = 0
+                for order in orders:
+                    line = order.model_dump_json().encode() + b"\n"
+                    if line in seen:
+                        continue
+                    seen.add(line)
+                    tmp_log.write(line)
+                    tmp_index.write(
+                        pack_entry(
+                            order.id, order.timestamp, offset, len(line), order.side
+                        )
+                    )
+                    offset += len(line)
+                kept = len(seen)
+                del orders, seen
+
+                # Catch up with the appends made meanwhile, so the locked
+                # step only copies those made during the catch-up
+                with self._symbol_lock(symbol):
+                    size = self._repair_tail(symbol)
+                self._copy_tail(log, end, size, tmp_log, tmp_index)
+                with self._symbol_lock(symbol):
+                    try:
+                        replaced = os.stat(file_path).st_ino != inode
+                    except FileNotFoundError:
+                        replaced = True
+                    if replaced:
+                        logger.info(
+                            "Skipped compacting %s, replaced meanwhile", file_path
+                        )
+                        return 0
+                    end = self._repair_tail(symbol)
+                    self._copy_tail(log, size, end, tmp_log, tmp_index)
+                    for tmp in (tmp_log, tmp_index):
+                        tmp.flush()
+                        os.fsync(tmp.fileno())
+                        tmp.close()
+                    self._close_handle(symbol)
+                    self.cache.invalidate(symbol)
+                    os.replace(tmp_log.name, file_path)
+                    os.replace(tmp_index.name, index_path)
+                    tmp_log = tmp_index = None
+                    self._sync_directory()
+        finally:
+            for tmp in (tmp_log, tmp_index):
+                if tmp is not None:
+                    tmp.close()
+                    if os.path.exists(tmp.name):
+                        os.remove(tmp.name)
+        self._compact_threshold[symbol] = max(self.compact_every, kept)
+        logger.info("Compacted %s to %s orders", file_path, kept)
+        return kept
+
+    @staticmethod
+    def _copy_tail(
+        log: BinaryIO, start: int, end: int, tmp_log: BinaryIO, tmp_index: BinaryIO
+    ):
+        """Append bytes ``start`` to ``end`` of ``log`` to a rewrite, indexed."""
+        offset = tmp_log.tell()
+        log.seek(start)
+        tmp_log.write(log.read(end - start))
+        tmp_log.flush()
+        tmp_index.write(build_index(tmp_log.name, offset))
+
+    def _tmp_file(self, file_path: str) -> BinaryIO:
+        """
+        Open a new temp file for rewriting ``file_path``.
+
+        Rewrites run without the symbol lock, so each gets its own file,
+        named ``<file_path>.<tag>.tmp`` to let ``recover`` find it.
+        """
+        directory, name = os.path.split(file_path)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{name}.", suffix=self.TMP_SUFFIX, dir=directory
+        )
+        os.close(fd)
+        return open(tmp_path, "wb")
+
+    def _close_handle(self, symbol: str):
+        self._sizes.pop(symbol, None)
+        handle = self._handles.pop(symbol, None)
+        if handle is not None:
+            handle.close()
+        index_handle = self._index_handles.pop(symbol, None)
+        if index_handle is not None:
+            index_handle.close()
+
+    def flush(self):
+        """Flush buffered writes of all open logs and sync them to disk."""
+        for symbol in list(self._handles):
+            with self._thread_lock(symbol):
+                handle = self._handles.get(symbol)
+                if handle is None:
+                    continue
+                handle.flush()
+                os.fsync(handle.fileno())
+                self._index_handles[symbol].flush()
+
+    def close(self):
+        """Drain queued writes and compactions, then flush and close all files."""
+        super().close()
+        self._compactor.shutdown(wait=True)
+        self.flush()
+        for symbol in list(self._handles):
+            with self._thread_lock(symbol):
+                self._close_handle(symbol)
+        for symbol in list(self._lock_fds):
+            with self._thread_lock(symbol):
+                os.close(self._lock_fds.pop(symbol))
+
+
+def _order_id(order: OrderResponse) -> int:
+    return order.id
@@ -0,0 +1,124 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+from app.models.order import OrderResponse
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class PartialWriteError(Exception):
+    """
+    Raised by ``write_batch`` when only some orders of a batch failed.
+
+    ``errors`` maps the position of each failed order in the batch to its
+    exception; every other order of the batch was written.
+    """
+
+    def __init__(self, errors: Dict[int, BaseException]):
+        self.errors = errors
+        first = next(iter(errors.values()))
+        super().__init__(f"Failed to write {len(errors)} orders of the batch: {first}")
+
+
+class OrderWriter:
+    """
+    Dedicated group-commit writer thread for order persistence.
+
+    Callers enqueue orders and get a Future that resolves once the order is
+    written, so the event loop never blocks on disk I/O. The thread collects
+    every order queued within ``window`` seconds of the first one (up to
+    ``max_batch``) and hands them to ``write_batch`` together, so one fsync
+    covers the whole batch. A single thread does all writes, which keeps
+    per-symbol logs strictly ordered.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[OrderResponse]], None],
+        window: float = 0.0,
+        max_batch: int = 256,
+        name: str = "order-writer",
+    ):
+        self._write_batch = write_batch
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._started = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def submit(self, order: OrderResponse) -> Future:
+        """Queue ``order`` for writing and return a Future for its completion."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Order writer is closed")
+            if not self._started:
+                self._thread.start()
+                self._started = True
+            self._queue.put((order, future))
+        return future
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _collect(self, first) -> tuple:
+        """Gather a batch starting with ``first``; returns (jobs, stop)."""
+        jobs = [first]
+        deadline = time.monotonic() + self.window
+        while len(jobs) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    job = self._queue.get(timeout=timeout)
+                else:
+                    job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                return jobs, True
+            jobs.append(job)
+        return jobs, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+            jobs, stop = self._collect(job)
+            jobs = [(o, f) for o, f in jobs if f.set_running_or_notify_cancel()]
+            if not jobs:
+                continue
+            try:
+                self._write_batch([order for order, _ in jobs])
+            except PartialWriteError as e:
+                for i, (order, future) in enumerate(jobs):
+                    if i in e.errors:
+                        future.set_exception(e.errors[i])
+                    else:
+                        future.set_result(order)
+            except BaseException as e:
+                for _, future in jobs:
+                    future.set_exception(e)
+            else:
+                for order, future in jobs:
+                    future.set_result(order)
+
+    def close(self, timeout: float = None):
+        """Write everything already queued, then stop the thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            started = self._started
+        if started:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            logger.info("Order writer stopped")
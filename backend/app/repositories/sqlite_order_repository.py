@@ -0,0 +1,298 @@
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+from app.config import settings
+from app.models.order import OrderResponse
+from app.repositories.base_order_repository import BaseOrderRepository
+from app.repositories.order_writer import PartialWriteError
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("id", "symbol", "side", "quantity", "price", "timestamp")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL NOT NULL,
+    timestamp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_symbol_timestamp ON orders (symbol, timestamp);
+CREATE INDEX IF NOT EXISTS orders_symbol_id ON orders (symbol, id);
+"""
+
+# Re-inserting an existing id is a no-op, so retries and repeated
+# migrations are idempotent; skipped rows are then checked for conflicts.
+INSERT_ORDER = (
+    "INSERT INTO orders (id, symbol, side, quantity, price, timestamp) "
+    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO NOTHING"
+)
+# Largest number of ids bound in one IN (...) lookup
+LOOKUP_CHUNK = 500
+# Rows fetched per connection checkout while streaming an export
+EXPORT_PAGE = 1000
+SELECT_ORDERS = f"SELECT {', '.join(COLUMNS)} FROM orders"
+
+
+class SqliteOrderRepository(BaseOrderRepository):
+    """
+    Order persistence in a single SQLite database in WAL mode.
+
+    All symbols share one ``orders`` table keyed by order id, with indexes on
+    ``(symbol, timestamp)`` and ``(symbol, id)``, so queries can span symbols.
+    WAL lets readers run alongside the writer, and several processes can write
+    to the same database: each write transaction takes SQLite's write lock up
+    front and waits up to ``busy_timeout`` seconds for it.
+
+    Statements use fixed SQL text with bound parameters, so each connection
+    prepares them once and reuses them from its statement cache. The writer
+    thread owns one connection; reads borrow connections from a small pool.
+    """
+
+    BACKEND = "sqlite"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        fsync: str = settings.ORDER_FSYNC,
+        batch_window: float = settings.ORDER_BATCH_WINDOW_MS / 1000,
+        batch_max: int = settings.ORDER_BATCH_MAX,
+        pool_size: int = settings.ORDER_DB_POOL_SIZE,
+        busy_timeout: float = settings.ORDER_DB_BUSY_TIMEOUT,
+    ):
+        super().__init__(fsync, batch_window, batch_max, read_threads=pool_size)
+        self.db_path = (
+            db_path
+            or settings.ORDER_DB_PATH
+            or os.path.join(settings.ORDERS_DIR, "orders.db")
+        )
+        self.busy_timeout = busy_timeout
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._write_conn.executescript(SCHEMA)
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._pool_size = max(1, pool_size)
+        self._pool_created = 0
+        self._pool_lock = threading.Lock()
+        logger.info("Using SQLite order store %s", self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            # Connections move between threads through the pool but are
+            # only ever used by one thread at a time.
+            check_same_thread=False,
+            # Transactions are managed explicitly
+            isolation_level=None,
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # "batch" and "always" differ in how many orders share a commit;
+        # each commit is fully synced unless durability is disabled.
+        synchronous = "OFF" if self.fsync == "never" else "FULL"
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection, opening one if the pool is not full."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._pool_created < self._pool_size
+                if create:
+                    self._pool_created += 1
+            conn = self._connect() if create else self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @staticmethod
+    def _to_order(row: tuple) -> OrderResponse:
+        # Rows were validated on the way in
+        return OrderResponse.model_construct(**dict(zip(COLUMNS, row)))
+
+    @staticmethod
+    def _to_row(order: OrderResponse) -> tuple:
+        return tuple(getattr(order, column) for column in COLUMNS)
+
+    def _insert(self, conn: sqlite3.Connection, rows: List[tuple]) -> Tuple[int, list]:
+        """
+        Insert ``rows``. Returns the number of rows inserted and the ids of
+        rows skipped because a different order is stored under their id.
+        """
+        inserted = conn.executemany(INSERT_ORDER, rows).rowcount
+        if inserted == len(rows):
+            return inserted, []
+        stored = {}
+        ids = [row[0] for row in rows]
+        for start in range(0, len(ids), LOOKUP_CHUNK):
+            chunk = ids[start : start + LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in conn.execute(
+                f"{SELECT_ORDERS} WHERE id IN ({placeholders})", chunk
+            ):
+                stored[row[0]] = row
+        return inserted, [row[0] for row in rows if stored.get(row[0]) != row]
+
+    def insert_orders(self, orders: List[OrderResponse]) -> Tuple[int, list]:
+        """
+        Insert a batch of orders in one transaction, skipping ones already
+        stored. Returns the number of rows inserted and the ids of orders not
+        stored because a different order already has their id.
+        """
+        rows = [self._to_row(o) for o in orders]
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = self._insert(conn, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return result
+
+    def save_orders(self, orders: List[OrderResponse]):
+        """
+        Insert a batch of orders.
+
+        ``always`` commits every order on its own, ``batch`` commits the whole
+        batch in one transaction, and ``never`` does the same without syncing.
+        Saving an order again is a no-op, but an order whose id is stored with
+        different values raises ValueError: in one transaction the batch is
+        rolled back, while with ``always`` the other orders are still saved
+        and ``PartialWriteError`` names the conflicting ones.
+        """
+        rows = [self._to_row(o) for o in orders]
+        try:
+            with self._write_lock:
+                conn = self._write_conn
+                conflicts = []
+                if self.fsync == "always":
+                    positions = []
+                    for i, row in enumerate(rows):
+                        if self._insert(conn, [row])[1]:
+                            conflicts.append(row[0])
+                            positions.append(i)
+                    if conflicts and len(conflicts) < len(rows):
+                        error = ValueError(
+                            f"Order ids already stored with different values: "
+                            f"{conflicts}"
+                        )
+                        raise PartialWriteError(dict.fromkeys(positions, error))
+                else:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        _, conflicts = self._insert(conn, rows)
+                    except BaseException:
+                        conn.execute("ROLLBACK")
+                        raise
+                    conn.execute("ROLLBACK" if conflicts else "COMMIT")
+            if conflicts:
+                raise ValueError(
+                    f"Order ids already stored with different values: {conflicts}"
+                )
+            logger.debug("Saved batch of %s orders", len(orders))
+        except Exception as e:
+            logger.error(
+                "Failed to save batch of %s orders: %s", len(orders), e, exc_info=True
+            )
+            raise
+
+    def load_orders(self, symbol: str) -> List[OrderResponse]:
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(
+                    f"{SELECT_ORDERS} WHERE symbol = ? ORDER BY id", (symbol,)
+                ).fetchall()
+            logger.debug("Loaded %s orders for %s", len(rows), symbol)
+            return [self._to_order(row) for row in rows]
+        except Exception as e:
+            logger.error("Failed to load orders for %s: %s", symbol, e, exc_info=True)
+            raise
+
+    def query_orders(
+        self,
+        symbol: Optional[str],
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        side: Optional[str] = None,
+        descending: bool = False,
+    ) -> List[OrderResponse]:
+        clauses, params = [], []
+        for clause, value in (
+            ("symbol = ?", symbol),
+            ("id > ?", after_id),
+            ("id < ?", before_id),
+            ("timestamp >= ?", since),
+            ("timestamp <= ?", until),
+            ("side = ?", side),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        sql = SELECT_ORDERS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC" if descending else " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            return [self._to_order(row) for row in rows]
+        except Exception as e:
+            logger.error("Failed to query orders for %s: %s", symbol, e, exc_info=True)
+            raise
+
+    def iter_orders(self, symbol: str) -> Iterator[OrderResponse]:
+        """
+        Stream orders a page of rows at a time, paging by id.
+
+        Each page borrows a pooled connection only while it is fetched, so a
+        slow consumer of a long export never holds one and cannot starve
+        other reads. Orders saved while the export runs are included if their
+        id is past the current page.
+        """
+        after_id = None
+        while True:
+            orders = self.query_orders(symbol, limit=EXPORT_PAGE, after_id=after_id)
+            yield from orders
+            if len(orders) < EXPORT_PAGE:
+                break
+            after_id = orders[-1].id
+
+    def stored_symbols(self) -> List[str]:
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT symbol FROM orders ORDER BY symbol"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        """Drain queued writes and close every connection."""
+        super().close()
+        with self._write_lock:
+            self._write_conn.close()
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
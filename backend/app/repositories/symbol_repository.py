@@ -1,28 +1,161 @@
 import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 from app.config import settings
+from app.core.metrics import SYMBOLS_LOAD_SECONDS
 from app.models.symbol import Symbol
 
 logger = logging.getLogger(__name__)
 
 
+class SymbolSnapshot:
+    """Immutable view of the symbols file as of one load."""
+
+    __slots__ = ("symbols", "mtime_ns", "inode", "size", "version")
+
+    def __init__(self, symbols: Dict[str, Symbol], stat: os.stat_result, version: int):
+        self.symbols: Mapping[str, Symbol] = MappingProxyType(symbols)
+        self.mtime_ns = stat.st_mtime_ns
+        self.inode = stat.st_ino
+        self.size = stat.st_size
+        self.version = version
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return (
+            self.mtime_ns == stat.st_mtime_ns
+            and self.inode == stat.st_ino
+            and self.size == stat.st_size
+        )
+
+
+class _SymbolCache:
+    """Process-wide snapshot holder for one symbols file."""
+
+    def __init__(self):
+        self.snapshot: Optional[SymbolSnapshot] = None
+        self.next_check = 0.0
+        self.hits = 0
+        self.reloads = 0
+        self.lock = threading.Lock()
+
+
 class SymbolRepository:
-    """Handles reading symbols from the symbols.json file."""
+    """
+    Handles reading symbols from the symbols.json file.
+
+    Parsed symbols are kept in a process-wide snapshot shared by every
+    repository pointing at the same file. The file is only re-read when its
+    mtime, inode or size changes, and at most one ``stat`` is issued per
+    ``check_interval`` seconds, so hot paths normally do no file I/O.
+    """
 
-    def __init__(self, symbols_file: str = settings.SYMBOLS_FILE):
+    _caches: Dict[str, _SymbolCache] = {}
+    _caches_lock = threading.Lock()
+
+    def __init__(
+        self,
+        symbols_file: str = settings.SYMBOLS_FILE,
+        check_interval: float = settings.SYMBOLS_CHECK_INTERVAL,
+    ):
         self.symbols_file = Path(symbols_file)
+        self.check_interval = check_interval
+        self._cache = self._cache_for(self.symbols_file)
+
+    @classmethod
+    def _cache_for(cls, symbols_file: Path) -> _SymbolCache:
+        key = os.path.abspath(symbols_file)
+        cache = cls._caches.get(key)
+        if cache is None:
+            with cls._caches_lock:
+                cache = cls._caches.setdefault(key, _SymbolCache())
+        return cache
 
-    def load_symbols(self) -> Dict[str, Symbol]:
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached snapshots, forcing the next load to read the file."""
+        with cls._caches_lock:
+            cls._caches.clear()
+
+    def load_symbols(self) -> Mapping[str, Symbol]:
         """
-        Load symbols from JSON file into a dict {symbol: Symbol}.
+        Return the current symbols as a read-only mapping {symbol: Symbol}.
         Maps external JSON keys (camelCase) to internal model keys (snake_case).
         """
-        if not self.symbols_file.exists():
-            logger.error(f"Symbols file not found at {self.symbols_file}")
-            raise FileNotFoundError(f"Symbols file not found: {self.symbols_file}")
+        cache = self._cache
+        snapshot = cache.snapshot
+        if snapshot is not None and time.monotonic() < cache.next_check:
+            cache.hits += 1
+            return snapshot.symbols
+        return self._refresh().symbols
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters for this repository's symbols file."""
+        cache = self._cache
+        snapshot = cache.snapshot
+        return {
+            "hits": cache.hits,
+            "reloads": cache.reloads,
+            "version": snapshot.version if snapshot else 0,
+            "symbols": len(snapshot.symbols) if snapshot else 0,
+        }
+
+    def _refresh(self) -> SymbolSnapshot:
+        cache = self._cache
+        with cache.lock:
+            snapshot = cache.snapshot
+            now = time.monotonic()
+            if snapshot is not None and now < cache.next_check:
+                # Another thread refreshed while we waited for the lock
+                cache.hits += 1
+                return snapshot
+
+            try:
+                stat = os.stat(self.symbols_file)
+            except FileNotFoundError:
+                if snapshot is None:
+                    logger.error("Symbols file not found at %s", self.symbols_file)
+                    raise FileNotFoundError(
+                        f"Symbols file not found: {self.symbols_file}"
+                    )
+                logger.warning(
+                    "Symbols file %s missing, serving cached snapshot",
+                    self.symbols_file,
+                )
+                cache.next_check = now + self.check_interval
+                return snapshot
+
+            if snapshot is not None and snapshot.matches(stat):
+                cache.next_check = now + self.check_interval
+                cache.hits += 1
+                return snapshot
+
+            try:
+                with SYMBOLS_LOAD_SECONDS.time():
+                    symbols = self._read_symbols()
+            except Exception:
+                if snapshot is None:
+                    raise
+                logger.error(
+                    "Keeping symbols snapshot v%s after failed reload", snapshot.version
+                )
+                cache.next_check = now + self.check_interval
+                return snapshot
+
+            version = snapshot.version + 1 if snapshot else 1
+            new_snapshot = SymbolSnapshot(symbols, stat, version)
+            # Single reference assignment: readers see either the old or the
+            # new snapshot, never a partially built one.
+            cache.snapshot = new_snapshot
+            cache.reloads += 1
+            cache.next_check = now + self.check_interval
+            return new_snapshot
 
+    def _read_symbols(self) -> Dict[str, Symbol]:
         try:
             with open(self.symbols_file, "r") as f:
                 symbols_data = json.load(f)
@@ -38,12 +171,12 @@ class SymbolRepository:
                     )
                 )
 
-            logger.info(f"Successfully loaded {len(mapped_symbols)} symbols")
+            logger.info("Successfully loaded %s symbols", len(mapped_symbols))
             return {s.symbol: s for s in mapped_symbols}
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {self.symbols_file}: {e}")
+            logger.error("Invalid JSON in %s: %s", self.symbols_file, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error loading symbols: {e}", exc_info=True)
+            logger.error("Unexpected error loading symbols: %s", e, exc_info=True)
             raise
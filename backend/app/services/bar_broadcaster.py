@@ -0,0 +1,101 @@
+import logging
+from typing import Dict, List, Optional, Sequence
+from app.config import settings
+from app.services.broadcaster import Broadcaster, Subscriber
+from app.services.symbol_service import SymbolService
+from app.utils.bar_aggregator import BarAggregator, parse_intervals
+from app.utils.tick_generator import TickBatch
+
+logger = logging.getLogger(__name__)
+
+
+class BarBroadcaster(Broadcaster):
+    """
+    OHLCV bars built from the shared tick stream, one topic per symbol.
+
+    ``TickBroadcaster`` feeds every tick batch to ``publish_batch``, which
+    folds it into one ``BarAggregator`` per interval and pushes each closed
+    bar of a subscribed symbol as a single serialized frame. History for
+    ``GET /api/bars`` is served from the same ring buffers.
+    """
+
+    def __init__(
+        self,
+        symbol_service: SymbolService = None,
+        intervals: Sequence[str] = None,
+        capacity: int = settings.BAR_HISTORY,
+    ):
+        super().__init__()
+        self.symbol_service = symbol_service or SymbolService()
+        self.intervals = list(
+            parse_intervals(settings.BAR_INTERVALS) if intervals is None else intervals
+        )
+        self.capacity = capacity
+        self._aggregators: Dict[str, BarAggregator] = {}
+        self._symbols: Optional[Sequence[str]] = None
+
+    def subscribe(self, subscriber: Subscriber, symbol: str):
+        """Subscribe to closed bars for ``symbol``; raises ValueError if unknown."""
+        if not self.has_symbol(symbol):
+            raise ValueError(f"Invalid symbol: {symbol}")
+        self.add(subscriber, symbol)
+
+    def has_symbol(self, symbol: str) -> bool:
+        """
+        Whether bars are built for ``symbol``: it is in the tick batches seen
+        so far, or before the first batch, in the symbol file.
+        """
+        if not self._aggregators:
+            return symbol in self.symbol_service.get_symbol_map()
+        return symbol in next(iter(self._aggregators.values())).index
+
+    def unsubscribe(self, subscriber: Subscriber, symbol: str):
+        self.remove(subscriber, symbol)
+
+    def unsubscribe_all(self, subscriber: Subscriber):
+        self.remove_all(subscriber)
+
+    def _aggregators_for(self, symbols: Sequence[str]) -> Dict[str, BarAggregator]:
+        if symbols is not self._symbols:
+            aggregators = {
+                interval: BarAggregator(symbols, interval, self.capacity)
+                for interval in self.intervals
+            }
+            for interval, aggregator in aggregators.items():
+                previous = self._aggregators.get(interval)
+                if previous is not None:
+                    # Keep bar history across symbol file reloads
+                    aggregator.adopt(previous)
+            self._aggregators = aggregators
+            self._symbols = symbols
+            logger.info("Built bar aggregators for %s symbols", len(symbols))
+        return self._aggregators
+
+    def publish_batch(self, batch: TickBatch) -> int:
+        """Fold ``batch`` into every interval and publish the bars it closed."""
+        published = 0
+        for aggregator in self._aggregators_for(batch.symbols).values():
+            row = aggregator.update(batch.prices, batch.volumes, batch.timestamp)
+            if row is None:
+                continue
+            for symbol in self.topics():
+                index = aggregator.index.get(symbol)
+                bar = aggregator.bar(row, index) if index is not None else None
+                if bar is not None:
+                    self.publish(symbol, self.encode(bar))
+                    published += 1
+        return published
+
+    def get_bars(
+        self, symbol: str, interval: str, limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Return the newest bars of ``symbol``, oldest first; the last one may
+        still be open. Raises ValueError for an interval that is not built.
+        """
+        if interval not in self.intervals:
+            raise ValueError(f"Invalid interval: {interval}")
+        aggregator = self._aggregators.get(interval)
+        if aggregator is None or symbol not in aggregator.index:
+            return []
+        return aggregator.bars(aggregator.index[symbol], limit)
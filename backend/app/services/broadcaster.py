@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, Hashable, Optional, Set, Union
+from app.config import settings
+from app.utils.json_codec import make_encoder
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """
+    Bounded per-client frame queue.
+
+    When the client falls behind and the queue is full, the oldest frame is
+    dropped so a slow consumer never holds back the producer or other clients.
+    """
+
+    def __init__(self, maxsize: int):
+        self._frames = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self.topics: Set[Hashable] = set()
+        self.dropped = 0
+
+    def put(self, frame):
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def get(self):
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+
+class Broadcaster:
+    """
+    Topic-based pub/sub hub fanning serialized frames out to subscribers.
+
+    Frames are serialized once with ``encode`` and the same object is queued
+    for every subscriber. With ``binary`` they are UTF-8 bytes sent as binary
+    WebSocket frames as-is; otherwise they are str sent as text frames.
+    """
+
+    def __init__(self, binary: Optional[bool] = None, encoder: Optional[str] = None):
+        self._subscribers: Dict[Hashable, Set[Subscriber]] = {}
+        self.binary = settings.WS_BINARY_FRAMES if binary is None else binary
+        self._dumps = make_encoder(encoder or settings.JSON_ENCODER)
+
+    def encode(self, obj: Any) -> Union[bytes, str]:
+        """Serialize ``obj`` into one JSON frame shared by all subscribers."""
+        data = self._dumps(obj)
+        return data if self.binary else data.decode()
+
+    def add(self, subscriber: Subscriber, topic: Hashable) -> bool:
+        """Subscribe to ``topic``. Returns True if it is the topic's first subscriber."""
+        subscribers = self._subscribers.setdefault(topic, set())
+        first = not subscribers
+        subscribers.add(subscriber)
+        subscriber.topics.add(topic)
+        return first
+
+    def remove(self, subscriber: Subscriber, topic: Hashable) -> bool:
+        """Unsubscribe from ``topic``. Returns True if no subscribers remain."""
+        subscriber.topics.discard(topic)
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None:
+            return False
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._subscribers[topic]
+            return True
+        return False
+
+    def remove_all(self, subscriber: Subscriber):
+        for topic in list(subscriber.topics):
+            self.remove(subscriber, topic)
+
+    def publish(self, topic: Hashable, frame) -> int:
+        """Deliver an already serialized frame to every subscriber of ``topic``."""
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return 0
+        for subscriber in subscribers:
+            subscriber.put(frame)
+        return len(subscribers)
+
+    def subscribers(self) -> Set[Subscriber]:
+        """Return every subscriber with at least one topic."""
+        return set().union(*self._subscribers.values())
+
+    def subscriber_count(self, topic: Hashable) -> int:
+        return len(self._subscribers.get(topic, ()))
+
+    def topics(self):
+        return list(self._subscribers)
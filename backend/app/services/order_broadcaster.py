@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from typing import Optional
+from app.models.order import OrderResponse
+from app.services.broadcaster import Broadcaster, Subscriber
+from app.services.symbol_service import SymbolService
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBroadcaster(Broadcaster):
+    """
+    Live order stream hub, one topic per symbol.
+
+    ``OrderService`` publishes each order once it is committed; the order is
+    serialized once and the frame fanned out to every subscriber of its
+    symbol. Orders are only seen by clients of the process that created them.
+    """
+
+    def __init__(self, symbol_service: SymbolService = None):
+        super().__init__()
+        self.symbol_service = symbol_service or SymbolService()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, subscriber: Subscriber, symbol: str):
+        """Subscribe to orders for ``symbol``; raises ValueError if it is unknown."""
+        if symbol not in self.symbol_service.get_symbol_map():
+            raise ValueError(f"Invalid symbol: {symbol}")
+        self._loop = asyncio.get_running_loop()
+        self.add(subscriber, symbol)
+
+    def unsubscribe(self, subscriber: Subscriber, symbol: str):
+        self.remove(subscriber, symbol)
+
+    def unsubscribe_all(self, subscriber: Subscriber):
+        self.remove_all(subscriber)
+
+    def publish_order(self, order: OrderResponse) -> int:
+        """
+        Push ``order`` to subscribers of its symbol. Safe to call from any
+        thread; off the event loop thread, delivery is scheduled on the loop.
+        Returns the number of subscribers reached (0 if scheduled).
+        """
+        if not self.subscriber_count(order.symbol):
+            return 0
+        frame = order.model_dump_json()
+        if self.binary:
+            frame = frame.encode()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            return self.publish(order.symbol, frame)
+        self._loop.call_soon_threadsafe(self.publish, order.symbol, frame)
+        return 0
@@ -1,9 +1,16 @@
+import itertools
 import time
 import logging
+from typing import Iterator, Mapping, Optional
 from fastapi import HTTPException
+from app.config import settings
+from app.core.metrics import ORDER_VALIDATION_SECONDS
 from app.models.order import OrderCreateRequest, OrderResponse
 from app.models.symbol import Symbol
-from app.repositories.order_repository import OrderRepository
+from app.repositories.base_order_repository import BaseOrderRepository
+from app.services.order_broadcaster import OrderBroadcaster
+from app.services.symbol_service import SymbolService
+from app.utils.id_generator import SnowflakeIdGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -11,16 +18,53 @@ logger = logging.getLogger(__name__)
 class OrderService:
     """Business logic for validating and creating orders."""
 
-    def __init__(self, repository: OrderRepository, symbols: list[Symbol]):
+    def __init__(
+        self,
+        repository: BaseOrderRepository,
+        symbols: list[Symbol] = None,
+        symbol_service: SymbolService = None,
+        id_generator: SnowflakeIdGenerator = None,
+        broadcaster: OrderBroadcaster = None,
+    ):
+        """
+        Validate against a fixed ``symbols`` list, or against the live
+        snapshot of ``symbol_service`` so a long-lived service sees reloads.
+        Committed orders are pushed to ``broadcaster`` subscribers, if given.
+        """
         self.repository = repository
-        self.symbols = {s.symbol: s for s in symbols}
+        self.id_generator = id_generator or SnowflakeIdGenerator(
+            max(settings.ORDER_WORKER_ID, 0)
+        )
+        self.symbol_service = symbol_service
+        self.broadcaster = broadcaster
+        self._symbols = {s.symbol: s for s in symbols or []}
+
+    @property
+    def symbols(self) -> Mapping[str, Symbol]:
+        if self.symbol_service is not None:
+            return self.symbol_service.get_symbol_map()
+        return self._symbols
 
     def _validate_order(self, request: OrderCreateRequest) -> OrderResponse:
-        if request.symbol not in self.symbols:
-            logger.warning(f"Invalid symbol: {request.symbol}")
+        started = time.perf_counter()
+        try:
+            order = self._build_order(request)
+        except HTTPException:
+            ORDER_VALIDATION_SECONDS.labels("rejected").observe(
+                time.perf_counter() - started
+            )
+            raise
+        ORDER_VALIDATION_SECONDS.labels("accepted").observe(
+            time.perf_counter() - started
+        )
+        return order
+
+    def _build_order(self, request: OrderCreateRequest) -> OrderResponse:
+        symbol_meta = self.symbols.get(request.symbol)
+        if symbol_meta is None:
+            logger.warning("Invalid symbol: %s", request.symbol)
             raise HTTPException(status_code=400, detail="Invalid symbol")
 
-        symbol_meta = self.symbols[request.symbol]
         min_price, max_price = (
             symbol_meta.close_price * 0.8,
             symbol_meta.close_price * 1.2,
@@ -35,7 +79,7 @@ class OrderService:
             raise HTTPException(status_code=400, detail=msg)
 
         return OrderResponse(
-            id=int(time.time() * 1000),
+            id=self.id_generator.next_id(),
             symbol=request.symbol,
             side=request.side,
             quantity=request.quantity,
@@ -47,20 +91,114 @@ class OrderService:
         order = self._validate_order(request)
         try:
             self.repository.save_order(order)
-            logger.info(f"Order created successfully: {order.dict()}")
+            logger.info(
+                "Order created successfully: %s",
+                order,
+                extra={"order_id": order.id, "symbol": order.symbol},
+            )
+            self._publish(order)
             return order
         except Exception as e:
-            logger.error(f"Error saving order: {e}", exc_info=True)
+            logger.error("Error saving order: %s", e, exc_info=True)
             raise
 
-    def list_orders(self, symbol: str) -> list[OrderResponse]:
+    async def create_order_async(self, request: OrderCreateRequest) -> OrderResponse:
+        """Validate and persist an order without blocking the event loop."""
+        order = self._validate_order(request)
+        try:
+            await self.repository.save_order_async(order)
+            logger.info(
+                "Order created successfully: %s",
+                order,
+                extra={"order_id": order.id, "symbol": order.symbol},
+            )
+            self._publish(order)
+            return order
+        except Exception as e:
+            logger.error("Error saving order: %s", e, exc_info=True)
+            raise
+
+    def _publish(self, order: OrderResponse):
+        """Push a committed order to live subscribers; never fails the order."""
+        if self.broadcaster is None:
+            return
+        try:
+            self.broadcaster.publish_order(order)
+        except Exception as e:
+            logger.error("Error publishing order %s: %s", order.id, e, exc_info=True)
+
+    def _check_symbol(self, symbol: str):
         if symbol not in self.symbols:
-            logger.warning(f"Invalid symbol for listing orders: {symbol}")
+            logger.warning("Invalid symbol for listing orders: %s", symbol)
             raise HTTPException(status_code=400, detail="Invalid symbol")
+
+    def list_orders(self, symbol: str) -> list[OrderResponse]:
+        self._check_symbol(symbol)
         try:
             orders = self.repository.load_orders(symbol)
-            logger.info(f"Fetched {len(orders)} orders for symbol {symbol}")
+            logger.info("Fetched %s orders for symbol %s", len(orders), symbol)
             return orders
         except Exception as e:
-            logger.error(f"Error loading orders for {symbol}: {e}", exc_info=True)
+            logger.error("Error loading orders for %s: %s", symbol, e, exc_info=True)
             raise
+
+    async def list_orders_async(self, symbol: str) -> list[OrderResponse]:
+        """List orders for ``symbol`` without blocking the event loop."""
+        self._check_symbol(symbol)
+        try:
+            orders = await self.repository.load_orders_async(symbol)
+            logger.info("Fetched %s orders for symbol %s", len(orders), symbol)
+            return orders
+        except Exception as e:
+            logger.error("Error loading orders for %s: %s", symbol, e, exc_info=True)
+            raise
+
+    def query_orders(self, symbol: Optional[str], **filters) -> list[OrderResponse]:
+        """
+        Return a page of orders for ``symbol``, or across all symbols when it
+        is None; see ``BaseOrderRepository.query_orders``.
+        """
+        if symbol is not None:
+            self._check_symbol(symbol)
+        try:
+            orders = self.repository.query_orders(symbol, **filters)
+            logger.info(
+                "Fetched %s orders for %s", len(orders), symbol or "all symbols"
+            )
+            return orders
+        except Exception as e:
+            logger.error("Error querying orders for %s: %s", symbol, e, exc_info=True)
+            raise
+
+    async def query_orders_async(
+        self, symbol: Optional[str], **filters
+    ) -> list[OrderResponse]:
+        """Return a page of orders without blocking the event loop."""
+        if symbol is not None:
+            self._check_symbol(symbol)
+        try:
+            orders = await self.repository.query_orders_async(symbol, **filters)
+            logger.info(
+                "Fetched %s orders for %s", len(orders), symbol or "all symbols"
+            )
+            return orders
+        except Exception as e:
+            logger.error("Error querying orders for %s: %s", symbol, e, exc_info=True)
+            raise
+
+    def iter_orders(self, symbol: Optional[str] = None) -> Iterator[OrderResponse]:
+        """
+        Stream stored orders for ``symbol``, or for every stored symbol.
+
+        The symbol is validated eagerly; orders are read lazily as the
+        returned iterator is consumed.
+        """
+        if symbol is not None:
+            self._check_symbol(symbol)
+            symbols = [symbol]
+        else:
+            symbols = self.repository.stored_symbols()
+        logger.info("Exporting orders for %s", ", ".join(symbols) or "no symbols")
+        return itertools.chain.from_iterable(
+            self.repository.iter_orders(s) for s in symbols
+        )
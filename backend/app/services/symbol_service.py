@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Mapping
 import logging
 from app.repositories.symbol_repository import SymbolRepository
 from app.models.symbol import Symbol
@@ -16,8 +16,16 @@ class SymbolService:
         """Return all symbols as a list."""
         try:
             symbols = list(self.repository.load_symbols().values())
-            logger.debug(f"Loaded {len(symbols)} symbols from repository")
+            logger.debug("Loaded %s symbols from repository", len(symbols))
             return symbols
         except Exception as e:
-            logger.error(f"Error in SymbolService.get_all_symbols: {e}", exc_info=True)
+            logger.error("Error in SymbolService.get_all_symbols: %s", e, exc_info=True)
+            raise
+
+    def get_symbol_map(self) -> Mapping[str, Symbol]:
+        """Return a read-only {symbol: Symbol} mapping for O(1) lookups."""
+        try:
+            return self.repository.load_symbols()
+        except Exception as e:
+            logger.error("Error in SymbolService.get_symbol_map: %s", e, exc_info=True)
             raise
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+from typing import Optional
+from app.config import settings
+from app.services.bar_broadcaster import BarBroadcaster
+from app.services.broadcaster import Broadcaster, Subscriber
+from app.services.tick_service import TickService
+from app.utils.tick_generator import TickBatch
+from app.utils.tick_history import TickHistory
+
+logger = logging.getLogger(__name__)
+
+
+class TickBroadcaster(Broadcaster):
+    """
+    Shared tick stream hub.
+
+    While anyone is subscribed, a single clock task generates one tick for the
+    whole symbol universe per interval with the vectorized tick engine. Each
+    subscribed symbol's tick is serialized once and the same frame is fanned
+    out to every subscriber, so all viewers of a symbol see the same price and
+    the generation cost does not grow with the number of viewers.
+
+    The last ``history_size`` batches are kept in a ``TickHistory``; each new
+    subscription first receives a snapshot frame of its symbol's recent ticks,
+    then live ticks. Batches are also fed to ``bars``, if given; ``start``
+    then keeps the clock running without subscribers so bar history has no
+    gaps.
+    """
+
+    def __init__(
+        self,
+        tick_service: TickService = None,
+        interval: float = settings.TICK_INTERVAL,
+        bars: BarBroadcaster = None,
+        history_size: int = settings.TICK_HISTORY,
+    ):
+        super().__init__()
+        self.tick_service = tick_service or TickService()
+        self.interval = interval
+        self.bars = bars
+        self.history_size = history_size
+        self.history: Optional[TickHistory] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pinned = False
+
+    def start(self):
+        """Run the clock until ``stop``, whether or not anyone is subscribed."""
+        self._pinned = True
+        self._start_task()
+
+    def subscribe(self, subscriber: Subscriber, symbol: str):
+        """
+        Subscribe to ticks for ``symbol``; raises ValueError if the engine has
+        no such symbol (in replay mode, if the recording has none).
+        """
+        if symbol not in self.tick_service.get_engine().index:
+            raise ValueError(f"Invalid symbol: {symbol}")
+        if self.history_size:
+            # Queued before the symbol's first live tick can be published
+            subscriber.put(self.encode(self.snapshot(symbol)))
+        self.add(subscriber, symbol)
+        self._start_task()
+
+    def snapshot(self, symbol: str) -> dict:
+        """Return the recent ticks of ``symbol`` as a columnar snapshot frame."""
+        history = self.history
+        index = history.index.get(symbol) if history is not None else None
+        if index is None:
+            return {
+                "type": "snapshot",
+                "symbol": symbol,
+                "timestamps": [],
+                "prices": [],
+                "volumes": [],
+            }
+        return history.snapshot(index)
+
+    def _record(self, batch: TickBatch):
+        history = self.history
+        if history is None or history.symbols is not batch.symbols:
+            history = TickHistory(batch.symbols, self.history_size)
+            if self.history is not None:
+                # Keep recent ticks across symbol file reloads
+                history.adopt(self.history)
+            self.history = history
+        history.append(batch)
+
+    def unsubscribe(self, subscriber: Subscriber, symbol: str):
+        self.remove(subscriber, symbol)
+        if not self._subscribers and not self._pinned:
+            self._stop_task()
+
+    def unsubscribe_all(self, subscriber: Subscriber):
+        for symbol in list(subscriber.topics):
+            self.unsubscribe(subscriber, symbol)
+
+    def _start_task(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Started tick broadcaster")
+
+    def _stop_task(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            logger.info("Stopped tick broadcaster")
+
+    def publish_batch(self) -> int:
+        """Generate one engine batch and publish ticks for subscribed symbols."""
+        # The batch must come from the engine whose index is used below,
+        # even if the symbols are reloaded meanwhile
+        engine = self.tick_service.get_engine()
+        batch = self.tick_service.generate_batch(engine)
+        if self.history_size:
+            self._record(batch)
+        if self.bars is not None:
+            self.bars.publish_batch(batch)
+        published = 0
+        for symbol in self.topics():
+            index = engine.index.get(symbol)
+            if index is None:
+                # The symbol left the universe; end the stream for everyone
+                error = {"error": f"Invalid symbol: {symbol}"}
+                logger.warning(error)
+                self.publish(symbol, self.encode(error))
+                for subscriber in list(self._subscribers.get(symbol, ())):
+                    self.remove(subscriber, symbol)
+                continue
+            self.publish(symbol, self.encode(batch.tick(index)))
+            published += 1
+        return published
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+        failures = 0
+        try:
+            while self._subscribers or self._pinned:
+                try:
+                    self.publish_batch()
+                    delay = self.tick_service.next_interval(self.interval)
+                except Exception as e:
+                    # One bad batch must not end every stream; try the next tick
+                    failures += 1
+                    if failures == 1:
+                        logger.error("Tick batch failed: %s", e, exc_info=True)
+                    else:
+                        logger.debug("Tick batch failed again: %s", e)
+                    delay = self.interval
+                else:
+                    if failures:
+                        logger.info(
+                            "Tick broadcaster recovered after %s failed batches",
+                            failures,
+                        )
+                        failures = 0
+                    if delay is None:
+                        logger.info("Tick replay finished")
+                        break
+                next_run += delay
+                await asyncio.sleep(max(0.0, next_run - loop.time()))
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    async def stop(self):
+        """Cancel the clock task."""
+        self._pinned = False
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -1,49 +1,161 @@
-import random
-import time
 import logging
+from typing import Iterable, Optional, Union
+from app.config import settings
+from app.core.metrics import TICKS_GENERATED
 from app.models.symbol import Symbol
 from app.services.symbol_service import SymbolService
+from app.utils.tick_generator import TickBatch, TickEngine
+from app.utils.tick_replay import TickRecorder, TickReplay, parse_speed
+
+TICK_SOURCES = ("simulated", "replay")
 
 logger = logging.getLogger(__name__)
 
 
 class TickService:
-    """Service responsible for generating and serving live ticks."""
+    """
+    Service responsible for generating and serving live ticks.
+
+    Ticks come from the simulated tick engine, or from ``replay`` when one is
+    given. Batches produced by ``generate_batch`` are also written to
+    ``recorder``, if given.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        replay: TickReplay = None,
+        recorder: TickRecorder = None,
+    ):
         self.symbol_service = SymbolService()
+        self.seed = seed
+        self.replay = replay
+        self.recorder = recorder
+        self._engine = None
+        self._engine_symbols = None
+
+    def get_engine(self) -> Union[TickEngine, TickReplay]:
+        """
+        Return the batch tick engine for the current symbol universe.
+        The engine is rebuilt only when the symbols snapshot is reloaded.
+        In replay mode the replay is the engine.
+        """
+        if self.replay is not None:
+            return self.replay
+        symbols = self.symbol_service.get_symbol_map()
+        if self._engine is None or symbols is not self._engine_symbols:
+            engine = TickEngine(list(symbols.values()), seed=self.seed)
+            if self._engine is not None:
+                # Keep price paths continuous across symbol file reloads
+                engine.adopt_prices(self._engine)
+            self._engine = engine
+            self._engine_symbols = symbols
+            logger.info("Built tick engine for %s symbols", len(symbols))
+        return self._engine
+
+    def generate_batch(
+        self, engine: Union[TickEngine, TickReplay, None] = None
+    ) -> TickBatch:
+        """
+        Generate one tick for every symbol in a single vectorized pass, from
+        ``engine`` if given so callers can index the batch with it.
+        """
+        batch = (engine or self.get_engine()).generate()
+        TICKS_GENERATED.inc(batch.symbols)
+        if self.recorder is not None and not self.recorder.stopped:
+            if not self.recorder.record(batch):
+                logger.warning(
+                    "Symbols changed, stopped recording ticks to %s", self.recorder.path
+                )
+        return batch
+
+    def next_interval(self, interval: float) -> Optional[float]:
+        """
+        Seconds until the next batch: ``interval`` for simulated ticks, the
+        recorded pace for a replay, or None once a replay has finished.
+        """
+        if self.replay is not None:
+            return self.replay.next_delay()
+        return interval
+
+    def close(self):
+        """Finish the recording, if any."""
+        if self.recorder is not None:
+            self.recorder.close()
+            logger.info(
+                "Recorded %s tick batches to %s",
+                self.recorder.count,
+                self.recorder.path,
+            )
 
     def get_tick_for_symbol(self, symbol_code: str) -> dict:
         """
         Get a simulated tick for the given symbol.
         Returns tick data if symbol exists, otherwise returns error dict.
         """
-        symbol_meta = next(
-            (
-                s
-                for s in self.symbol_service.get_all_symbols()
-                if s.symbol == symbol_code
-            ),
-            None,
-        )
+        engine = self.get_engine()
+        index = engine.index.get(symbol_code)
 
-        if not symbol_meta:
+        if index is None:
             return {"error": f"Invalid symbol: {symbol_code}"}
 
-        return self._generate_tick(symbol_meta)
+        return engine.tick(index)
+
+    def get_ticks_for_symbols(self, symbol_codes: Iterable[str]) -> dict:
+        """
+        Get simulated ticks for many symbols in one call.
+        Returns {"ticks": [...], "unknown": [...]} where unknown lists every
+        requested code that is not in the symbol universe.
+        """
+        engine = self.get_engine()
+        ticks = []
+        unknown = []
+        for symbol_code in symbol_codes:
+            index = engine.index.get(symbol_code)
+            if index is None:
+                unknown.append(symbol_code)
+            else:
+                ticks.append(engine.tick(index))
+        return {"ticks": ticks, "unknown": unknown}
 
     def _generate_tick(self, symbol: Symbol) -> dict:
         """
-        Generate a tick in ±5% range of symbol's close price.
-        """
-        base_price = symbol.close_price
-        price = round(random.uniform(base_price * 0.95, base_price * 1.05), 2)
-        volume = random.randint(1, 1000)
-        tick = {
-            "symbol": symbol.symbol,
-            "price": price,
-            "volume": volume,
-            "timestamp": int(time.time()),
-        }
-        logger.debug(f"Generated tick: {tick}")
+        Generate the next tick on the symbol's simulated price path.
+        """
+        engine = self.get_engine()
+        index = engine.index.get(symbol.symbol)
+        if index is None:
+            raise ValueError(f"Symbol not in tick universe: {symbol.symbol}")
+        tick = engine.tick(index)
+        logger.debug("Generated tick: %s", tick)
         return tick
+
+
+def create_tick_service(source: str = None) -> TickService:
+    """Build the TickService selected by TICK_SOURCE and TICK_RECORD_FILE."""
+    source = source or settings.TICK_SOURCE
+    if source not in TICK_SOURCES:
+        raise ValueError(
+            f"Invalid tick source {source!r}, expected one of {TICK_SOURCES}"
+        )
+    replay = None
+    if source == "replay":
+        if not settings.TICK_REPLAY_FILE:
+            raise ValueError("TICK_SOURCE=replay requires TICK_REPLAY_FILE")
+        replay = TickReplay.open(
+            settings.TICK_REPLAY_FILE,
+            speed=parse_speed(settings.TICK_REPLAY_SPEED),
+            loop=settings.TICK_REPLAY_LOOP,
+        )
+        logger.info(
+            "Replaying %s tick batches for %s symbols from %s at speed %s",
+            len(replay.recording),
+            len(replay.symbols),
+            settings.TICK_REPLAY_FILE,
+            settings.TICK_REPLAY_SPEED,
+        )
+    recorder = None
+    if settings.TICK_RECORD_FILE:
+        recorder = TickRecorder(settings.TICK_RECORD_FILE)
+        logger.info("Recording ticks to %s", settings.TICK_RECORD_FILE)
+    return TickService(replay=replay, recorder=recorder)
@@ -0,0 +1,128 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# Supported bar intervals, in seconds
+BAR_INTERVALS = {
+    "1s": 1,
+    "5s": 5,
+    "15s": 15,
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+}
+
+
+def parse_intervals(spec: str) -> List[str]:
+    """Parse a comma separated interval list such as "1s,1m,5m"."""
+    intervals = [name.strip() for name in spec.split(",") if name.strip()]
+    for name in intervals:
+        if name not in BAR_INTERVALS:
+            raise ValueError(
+                f"Invalid bar interval {name!r}, expected one of {list(BAR_INTERVALS)}"
+            )
+    return intervals
+
+
+class BarAggregator:
+    """
+    Rolling OHLCV bars of one interval for a whole symbol universe.
+
+    Bars live in ring buffers preallocated for ``capacity`` bars, one row per
+    bar period and one column per symbol, so memory is fixed per symbol and
+    every tick batch is folded in with a handful of vectorized NumPy calls.
+    The newest row is the bar still being built; it is closed when the first
+    tick of a later period arrives.
+    """
+
+    def __init__(self, symbols: Sequence[str], interval: str, capacity: int):
+        self.symbols = tuple(symbols)
+        self.index = {code: i for i, code in enumerate(self.symbols)}
+        self.interval = interval
+        self.seconds = BAR_INTERVALS[interval]
+        self.capacity = capacity
+        shape = (capacity, len(self.symbols))
+        self.starts = np.zeros(capacity, dtype=np.int64)
+        self.open = np.full(shape, np.nan)
+        self.high = np.full(shape, np.nan)
+        self.low = np.full(shape, np.nan)
+        self.close = np.full(shape, np.nan)
+        self.volume = np.zeros(shape, dtype=np.int64)
+        # Row of the bar being built, and number of rows filled
+        self.head = -1
+        self.count = 0
+
+    def update(
+        self, prices: np.ndarray, volumes: np.ndarray, timestamp: int
+    ) -> Optional[int]:
+        """
+        Fold one tick per symbol into the current bar.
+
+        Returns the row of the bar this tick closed, if it opened a new one.
+        """
+        start = timestamp - timestamp % self.seconds
+        head = self.head
+        if head >= 0 and self.starts[head] == start:
+            np.maximum(self.high[head], prices, out=self.high[head])
+            np.minimum(self.low[head], prices, out=self.low[head])
+            self.close[head] = prices
+            self.volume[head] += volumes
+            return None
+
+        closed = head if head >= 0 else None
+        head = self.head = (head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.starts[head] = start
+        self.open[head] = prices
+        self.high[head] = prices
+        self.low[head] = prices
+        self.close[head] = prices
+        self.volume[head] = volumes
+        return closed
+
+    def bar(self, row: int, index: int) -> Optional[dict]:
+        """Return the bar at ``row`` for the symbol at ``index``."""
+        if np.isnan(self.open[row, index]):
+            # The symbol joined the universe after this bar
+            return None
+        return {
+            "symbol": self.symbols[index],
+            "interval": self.interval,
+            "start": int(self.starts[row]),
+            "open": float(self.open[row, index]),
+            "high": float(self.high[row, index]),
+            "low": float(self.low[row, index]),
+            "close": float(self.close[row, index]),
+            "volume": int(self.volume[row, index]),
+        }
+
+    def bars(self, index: int, limit: Optional[int] = None) -> List[dict]:
+        """
+        Return up to ``limit`` of the newest bars for the symbol at ``index``,
+        oldest first. The last bar is still open.
+        """
+        count = self.count if limit is None else min(limit, self.count)
+        rows = np.arange(self.head - count + 1, self.head + 1) % self.capacity
+        bars = (self.bar(int(row), index) for row in rows)
+        return [bar for bar in bars if bar is not None]
+
+    def adopt(self, other: "BarAggregator"):
+        """Carry over the history of symbols also present in ``other``."""
+        common = [
+            (index, other.index[code])
+            for code, index in self.index.items()
+            if code in other.index
+        ]
+        capacity = min(self.capacity, other.capacity)
+        count = min(other.count, capacity)
+        if not common or not count:
+            return
+        new, old = (list(columns) for columns in zip(*common))
+        rows = np.arange(other.head - count + 1, other.head + 1) % other.capacity
+        self.starts[:count] = other.starts[rows]
+        for name in ("open", "high", "low", "close", "volume"):
+            target, source = getattr(self, name), getattr(other, name)
+            target[:count, new] = source[rows][:, old]
+        self.head = count - 1
+        self.count = count
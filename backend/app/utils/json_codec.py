@@ -0,0 +1,66 @@
+import json
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# JSON encoders in order of preference; "auto" picks the first installed
+JSON_ENCODERS = ("orjson", "msgspec", "json")
+
+
+def _numpy_default(obj: Any) -> Any:
+    """Encode NumPy scalars and arrays the stdlib encoders do not know."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once: json.dumps with arguments creates a new encoder on every call
+_stdlib_encoder = json.JSONEncoder(separators=(",", ":"), default=_numpy_default)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return _stdlib_encoder.encode(obj).encode()
+
+
+def available_encoders():
+    """Return the names of the encoders usable in this environment."""
+    installed = {"orjson": orjson, "msgspec": msgspec, "json": json}
+    return [name for name in JSON_ENCODERS if installed[name] is not None]
+
+
+def make_encoder(name: Optional[str] = None) -> Callable[[Any], bytes]:
+    """
+    Return a function serializing an object to compact UTF-8 JSON bytes.
+
+    ``name`` is one of ``JSON_ENCODERS``, or "auto"/None for the fastest one
+    installed: orjson, then msgspec, then the stdlib ``json`` module.
+    """
+    name = name or "auto"
+    if name == "auto":
+        name = available_encoders()[0]
+    if name not in JSON_ENCODERS:
+        raise ValueError(
+            f"Invalid JSON encoder {name!r}, expected 'auto' or one of {JSON_ENCODERS}"
+        )
+    if name not in available_encoders():
+        raise ValueError(f"JSON encoder {name!r} is not installed")
+    if name == "orjson":
+        option = orjson.OPT_SERIALIZE_NUMPY
+
+        def dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj, option=option)
+
+        return dumps
+    if name == "msgspec":
+        return msgspec.json.Encoder(enc_hook=_numpy_default).encode
+    return _stdlib_dumps
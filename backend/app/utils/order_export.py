@@ -0,0 +1,73 @@
+import csv
+import io
+import zlib
+from typing import Iterable, Iterator
+
+from app.models.order import OrderResponse
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_FIELDS = ["id", "symbol", "side", "quantity", "price", "timestamp"]
+
+# Encoded bytes gathered before a chunk is handed to the response
+CHUNK_SIZE = 64 * 1024
+
+
+def encode_ndjson(orders: Iterable[OrderResponse]) -> Iterator[bytes]:
+    """Encode orders as newline-delimited JSON, in chunks of ~CHUNK_SIZE."""
+    buffer = bytearray()
+    for order in orders:
+        buffer += order.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def encode_csv(orders: Iterable[OrderResponse]) -> Iterator[bytes]:
+    """Encode orders as CSV with a header row, in chunks of ~CHUNK_SIZE."""
+    text = io.StringIO()
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(CSV_FIELDS)
+    for order in orders:
+        writer.writerow(
+            (
+                order.id,
+                order.symbol,
+                order.side,
+                order.quantity,
+                order.price,
+                order.timestamp,
+            )
+        )
+        if text.tell() >= CHUNK_SIZE:
+            yield text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+    if text.tell():
+        yield text.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a stream of chunks into one gzip member, incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_orders(
+    orders: Iterable[OrderResponse], fmt: str = "ndjson", compress: bool = False
+) -> Iterator[bytes]:
+    """Encode an order stream as ``fmt``, optionally gzip-compressed."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    chunks = encode_csv(orders) if fmt == "csv" else encode_ndjson(orders)
+    return gzip_chunks(chunks) if compress else chunks
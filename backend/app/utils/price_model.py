@@ -0,0 +1,150 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+# Seconds in a trading year (252 days x 6.5 hours); drift, volatility and
+# mean reversion are annualized and scaled to the tick interval with this.
+TRADING_SECONDS_PER_YEAR = 252 * 6.5 * 3600
+
+MIN_PRICE = 0.01
+
+
+class PriceModel:
+    """
+    Array-backed per-symbol price state advanced by a stochastic process.
+
+    ``prices`` holds the current price of every symbol, indexed by the symbol
+    id used by the tick engine. Subclasses implement the process itself.
+    """
+
+    def __init__(
+        self,
+        base_prices: np.ndarray,
+        volatility: float,
+        interval: float,
+    ):
+        self.base_prices = np.asarray(base_prices, dtype=np.float64)
+        self.prices = self.base_prices.copy()
+        self.volatility = volatility
+        self.dt = interval / TRADING_SECONDS_PER_YEAR
+        self._noise = np.empty_like(self.prices)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def set_price(self, index: int, price: float):
+        """Overwrite the current price of one symbol."""
+        self.prices[index] = price
+
+    def step(self, rng: np.random.Generator) -> np.ndarray:
+        """Advance every symbol by one interval and return the price array."""
+        raise NotImplementedError
+
+    def step_one(self, index: int, rng: np.random.Generator) -> float:
+        """Advance a single symbol by one interval and return its price."""
+        raise NotImplementedError
+
+
+class GeometricBrownianMotion(PriceModel):
+    """Random walk in log price: dS = mu*S*dt + sigma*S*dW."""
+
+    def __init__(
+        self,
+        base_prices: np.ndarray,
+        drift: float,
+        volatility: float,
+        interval: float,
+    ):
+        super().__init__(base_prices, volatility, interval)
+        self.drift = drift
+        self._log_step = (drift - 0.5 * volatility**2) * self.dt
+        self._scale = volatility * math.sqrt(self.dt)
+
+    def step(self, rng: np.random.Generator) -> np.ndarray:
+        noise = self._noise
+        rng.standard_normal(out=noise)
+        np.multiply(noise, self._scale, out=noise)
+        np.add(noise, self._log_step, out=noise)
+        np.exp(noise, out=noise)
+        np.multiply(self.prices, noise, out=self.prices)
+        np.maximum(self.prices, MIN_PRICE, out=self.prices)
+        return self.prices
+
+    def step_one(self, index: int, rng: np.random.Generator) -> float:
+        factor = math.exp(self._log_step + self._scale * rng.standard_normal())
+        price = max(float(self.prices[index]) * factor, MIN_PRICE)
+        self.prices[index] = price
+        return price
+
+
+class MeanRevertingModel(PriceModel):
+    """
+    Ornstein-Uhlenbeck process on log price, pulled back to the close price.
+
+    Uses the exact discretization, so the process stays stable for any
+    interval and reversion speed.
+    """
+
+    def __init__(
+        self,
+        base_prices: np.ndarray,
+        reversion: float,
+        volatility: float,
+        interval: float,
+    ):
+        super().__init__(base_prices, volatility, interval)
+        self.reversion = reversion
+        self._anchor = np.log(self.base_prices)
+        self._log_prices = self._anchor.copy()
+        self._decay = math.exp(-reversion * self.dt)
+        if reversion > 0:
+            variance = (1 - math.exp(-2 * reversion * self.dt)) / (2 * reversion)
+        else:
+            variance = self.dt
+        self._scale = volatility * math.sqrt(variance)
+
+    def set_price(self, index: int, price: float):
+        super().set_price(index, price)
+        self._log_prices[index] = math.log(price)
+
+    def step(self, rng: np.random.Generator) -> np.ndarray:
+        log_prices = self._log_prices
+        noise = self._noise
+        rng.standard_normal(out=noise)
+        np.multiply(noise, self._scale, out=noise)
+        np.subtract(log_prices, self._anchor, out=log_prices)
+        np.multiply(log_prices, self._decay, out=log_prices)
+        np.add(log_prices, self._anchor, out=log_prices)
+        np.add(log_prices, noise, out=log_prices)
+        np.exp(log_prices, out=self.prices)
+        np.maximum(self.prices, MIN_PRICE, out=self.prices)
+        return self.prices
+
+    def step_one(self, index: int, rng: np.random.Generator) -> float:
+        anchor = float(self._anchor[index])
+        log_price = (
+            anchor
+            + (float(self._log_prices[index]) - anchor) * self._decay
+            + self._scale * rng.standard_normal()
+        )
+        self._log_prices[index] = log_price
+        price = max(math.exp(log_price), MIN_PRICE)
+        self.prices[index] = price
+        return price
+
+
+def build_price_model(
+    kind: str,
+    base_prices: np.ndarray,
+    interval: float,
+    drift: float = 0.0,
+    volatility: float = 0.4,
+    reversion: Optional[float] = None,
+) -> PriceModel:
+    """Create a price model by name: "gbm" or "ou" (mean-reverting)."""
+    if kind == "gbm":
+        return GeometricBrownianMotion(base_prices, drift, volatility, interval)
+    if kind == "ou":
+        return MeanRevertingModel(base_prices, reversion or 0.0, volatility, interval)
+    raise ValueError(f"Unknown price model: {kind}")
@@ -1,15 +1,125 @@
-import random
 import time
+from typing import List, Optional, Sequence
 
+import numpy as np
+
+from app.config import settings
 from app.models.symbol import Symbol
+from app.utils.price_model import PriceModel, build_price_model
+
+
+class TickBatch:
+    """
+    Columnar batch of ticks for a symbol universe, all sharing one timestamp.
+
+    ``prices`` and ``volumes`` are views of the engine's preallocated buffers
+    and are overwritten by the next ``generate`` call; copy them to keep them.
+    """
+
+    __slots__ = ("symbols", "prices", "volumes", "timestamp")
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        timestamp: int,
+    ):
+        self.symbols = symbols
+        self.prices = prices
+        self.volumes = volumes
+        self.timestamp = timestamp
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def tick(self, index: int) -> dict:
+        """Return the tick at ``index`` in the dict shape used by the API."""
+        return {
+            "symbol": self.symbols[index],
+            "price": float(self.prices[index]),
+            "volume": int(self.volumes[index]),
+            "timestamp": self.timestamp,
+        }
+
+    def to_dicts(self) -> List[dict]:
+        timestamp = self.timestamp
+        return [
+            {"symbol": s, "price": p, "volume": v, "timestamp": timestamp}
+            for s, p, v in zip(
+                self.symbols, self.prices.tolist(), self.volumes.tolist()
+            )
+        ]
+
+
+class TickEngine:
+    """
+    Vectorized tick generator for a whole symbol universe.
+
+    Prices follow a stateful price model (random walk or mean reversion) so
+    consecutive ticks form a continuous path. Every ``generate`` call advances
+    all symbols and draws their volumes in one NumPy pass, writing into arrays
+    allocated once up front.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[Symbol],
+        seed: Optional[int] = None,
+        max_volume: int = 1000,
+        model: Optional[PriceModel] = None,
+    ):
+        self.symbols = tuple(s.symbol for s in symbols)
+        self.index = {code: i for i, code in enumerate(self.symbols)}
+        self.max_volume = max_volume
+        self._rng = np.random.default_rng(seed)
+
+        if model is None:
+            base = np.fromiter(
+                (s.close_price for s in symbols), np.float64, len(symbols)
+            )
+            model = build_price_model(
+                settings.TICK_PRICE_MODEL,
+                base,
+                settings.TICK_INTERVAL,
+                drift=settings.TICK_DRIFT,
+                volatility=settings.TICK_VOLATILITY,
+                reversion=settings.TICK_MEAN_REVERSION,
+            )
+        self.model = model
+        self._prices = np.empty(len(symbols), dtype=np.float64)
+        self._draws = np.empty(len(symbols), dtype=np.float64)
+        self._volumes = np.empty(len(symbols), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def generate(self) -> TickBatch:
+        prices = self._prices
+        np.round(self.model.step(self._rng), 2, out=prices)
+
+        draws = self._draws
+        self._rng.random(out=draws)
+        np.multiply(draws, self.max_volume, out=draws)
+        np.floor(draws, out=draws)
+        np.add(draws, 1, out=draws)
+        self._volumes[:] = draws
+
+        return TickBatch(self.symbols, prices, self._volumes, int(time.time()))
 
+    def adopt_prices(self, other: "TickEngine"):
+        """Continue the price paths of symbols also present in ``other``."""
+        for code, index in self.index.items():
+            other_index = other.index.get(code)
+            if other_index is not None:
+                self.model.set_price(index, float(other.model.prices[other_index]))
 
-def generate_tick(symbol: Symbol):
-    base = symbol.closePrice
-    price = round(random.uniform(base * 0.95, base * 1.05), 2)
-    return {
-        "symbol": symbol.symbol,
-        "price": price,
-        "volume": random.randint(1, 100),
-        "timestamp": int(time.time()),
-    }
+    def tick(self, index: int) -> dict:
+        """Advance a single symbol by one interval and return its tick."""
+        price = self.model.step_one(index, self._rng)
+        return {
+            "symbol": self.symbols[index],
+            "price": round(price, 2),
+            "volume": int(self._rng.integers(1, self.max_volume + 1)),
+            "timestamp": int(time.time()),
+        }
@@ -0,0 +1,76 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.utils.tick_generator import TickBatch
+
+
+class TickHistory:
+    """
+    The last ``capacity`` tick batches of a symbol universe.
+
+    Ticks are kept in preallocated ring buffers, one row per batch and one
+    column per symbol, so memory is fixed per symbol no matter how long the
+    stream runs and appending a batch is a single row copy per field.
+    """
+
+    def __init__(self, symbols: Sequence[str], capacity: int):
+        self.symbols = tuple(symbols)
+        self.index = {code: i for i, code in enumerate(self.symbols)}
+        self.capacity = capacity
+        shape = (capacity, len(self.symbols))
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self.prices = np.full(shape, np.nan)
+        self.volumes = np.zeros(shape, dtype=np.int64)
+        # Row of the newest batch, and number of rows filled
+        self.head = -1
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, batch: TickBatch):
+        head = self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.timestamps[head] = batch.timestamp
+        self.prices[head] = batch.prices
+        self.volumes[head] = batch.volumes
+
+    def _rows(self, limit: Optional[int] = None) -> np.ndarray:
+        count = self.count if limit is None else min(limit, self.count)
+        return np.arange(self.head - count + 1, self.head + 1) % self.capacity
+
+    def snapshot(self, index: int, limit: Optional[int] = None) -> dict:
+        """
+        Return the newest ticks of the symbol at ``index``, oldest first, as
+        one columnar frame.
+        """
+        rows = self._rows(limit)
+        prices = self.prices[rows, index]
+        # Rows from before the symbol joined the universe are empty
+        known = ~np.isnan(prices)
+        return {
+            "type": "snapshot",
+            "symbol": self.symbols[index],
+            "timestamps": self.timestamps[rows][known].tolist(),
+            "prices": prices[known].tolist(),
+            "volumes": self.volumes[rows, index][known].tolist(),
+        }
+
+    def adopt(self, other: "TickHistory"):
+        """Carry over the ticks of symbols also present in ``other``."""
+        common = [
+            (index, other.index[code])
+            for code, index in self.index.items()
+            if code in other.index
+        ]
+        count = min(other.count, self.capacity)
+        if not common or not count:
+            return
+        new, old = (list(columns) for columns in zip(*common))
+        rows = other._rows(count)
+        self.timestamps[:count] = other.timestamps[rows]
+        self.prices[:count, new] = other.prices[rows][:, old]
+        self.volumes[:count, new] = other.volumes[rows][:, old]
+        self.head = count - 1
+        self.count = count
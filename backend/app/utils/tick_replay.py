@@ -0,0 +1,262 @@
+import json
+import math
+import os
+import struct
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.utils.tick_generator import TickBatch
+
+# Binary recordings start with MAGIC, a little-endian uint32 header length and
+# a JSON header {"symbols": [...]}, padded to 8 bytes. Fixed-size batch records
+# follow (see record_dtype), so a recording is read by memory-mapping it.
+MAGIC = b"TICKREC1"
+HEADER_LENGTH = struct.Struct("<I")
+
+# NDJSON recordings hold the same data as text: a {"symbols": [...]} line,
+# then one {"time", "timestamp", "prices", "volumes"} line per batch.
+RECORD_FORMATS = ("binary", "ndjson")
+
+
+def record_dtype(symbol_count: int) -> np.dtype:
+    """
+    One recorded batch: seconds since the recording started (used to pace
+    replay), the batch's epoch timestamp, and a price and volume per symbol.
+    """
+    return np.dtype(
+        [
+            ("time", "<f8"),
+            ("timestamp", "<i8"),
+            ("prices", "<f8", (symbol_count,)),
+            ("volumes", "<i8", (symbol_count,)),
+        ]
+    )
+
+
+def format_for_path(path: str) -> str:
+    """Recordings named *.ndjson or *.jsonl are text; anything else is binary."""
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "binary"
+
+
+def parse_speed(value: str) -> float:
+    """Parse a replay speed: a multiplier such as "1" or "10", or "max"."""
+    if str(value).strip().lower() == "max":
+        return math.inf
+    speed = float(value)
+    if not speed > 0:
+        raise ValueError(f"Invalid replay speed {value!r}, expected > 0 or 'max'")
+    return speed
+
+
+class TickRecording:
+    """Columnar view of a recorded tick file."""
+
+    def __init__(self, symbols: Sequence[str], records: np.ndarray):
+        self.symbols = tuple(symbols)
+        self.records = records
+        self.times = records["time"]
+        self.timestamps = records["timestamp"]
+        self.prices = records["prices"]
+        self.volumes = records["volumes"]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+def load_recording(path: str) -> TickRecording:
+    """
+    Open a recording in either format. Binary files are memory-mapped, so
+    batches are read from the page cache on demand; NDJSON files are parsed
+    into arrays up front. A torn final record or line is ignored.
+    """
+    with open(path, "rb") as f:
+        binary = f.read(len(MAGIC)) == MAGIC
+    if binary:
+        return _load_binary(path)
+    return _load_ndjson(path)
+
+
+def _load_binary(path: str) -> TickRecording:
+    with open(path, "rb") as f:
+        f.seek(len(MAGIC))
+        (length,) = HEADER_LENGTH.unpack(f.read(HEADER_LENGTH.size))
+        header = json.loads(f.read(length))
+        size = os.fstat(f.fileno()).st_size
+    symbols = header["symbols"]
+    dtype = record_dtype(len(symbols))
+    offset = len(MAGIC) + HEADER_LENGTH.size + length
+    count = (size - offset) // dtype.itemsize
+    if count == 0:
+        return TickRecording(symbols, np.zeros(0, dtype=dtype))
+    records = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    return TickRecording(symbols, records)
+
+
+def _load_ndjson(path: str) -> TickRecording:
+    with open(path, "rb") as f:
+        header = json.loads(f.readline())
+        symbols = header["symbols"]
+        rows = []
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                row = json.loads(line)
+                rows.append(
+                    (row["time"], row["timestamp"], row["prices"], row["volumes"])
+                )
+    return TickRecording(symbols, np.array(rows, dtype=record_dtype(len(symbols))))
+
+
+class TickRecorder:
+    """
+    Append generated tick batches to a recording.
+
+    The symbol universe is fixed by the first batch; if it changes later
+    (the symbols file was reloaded), recording stops.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None):
+        self.path = path
+        self.format = fmt or format_for_path(path)
+        if self.format not in RECORD_FORMATS:
+            raise ValueError(
+                f"Invalid recording format {self.format!r}, "
+                f"expected one of {RECORD_FORMATS}"
+            )
+        self.symbols: Optional[Sequence[str]] = None
+        self.count = 0
+        self.stopped = False
+        self._file = None
+        self._dtype = None
+        self._started = None
+
+    def record(self, batch: TickBatch, now: Optional[float] = None) -> bool:
+        """
+        Record ``batch`` taken at ``now`` (monotonic seconds); returns False
+        once recording has stopped.
+        """
+        if self.stopped:
+            return False
+        now = time.monotonic() if now is None else now
+        if self._file is None:
+            self._open(batch.symbols)
+            self._started = now
+        elif tuple(batch.symbols) != self.symbols:
+            self.stopped = True
+            return False
+
+        elapsed = now - self._started
+        if self.format == "binary":
+            record = np.zeros(1, dtype=self._dtype)
+            record["time"] = elapsed
+            record["timestamp"] = batch.timestamp
+            record["prices"] = batch.prices
+            record["volumes"] = batch.volumes
+            self._file.write(record.tobytes())
+        else:
+            line = {
+                "time": round(elapsed, 6),
+                "timestamp": batch.timestamp,
+                "prices": batch.prices.tolist(),
+                "volumes": batch.volumes.tolist(),
+            }
+            self._file.write(json.dumps(line).encode() + b"\n")
+        self.count += 1
+        return True
+
+    def _open(self, symbols: Sequence[str]):
+        self.symbols = tuple(symbols)
+        self._dtype = record_dtype(len(self.symbols))
+        self._file = open(self.path, "wb")
+        header = json.dumps({"symbols": list(self.symbols)}).encode()
+        if self.format == "binary":
+            # Pad so the records that follow are 8-byte aligned for mmap
+            used = len(MAGIC) + HEADER_LENGTH.size + len(header)
+            header += b" " * (-used % 8)
+            self._file.write(MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+        else:
+            self._file.write(header + b"\n")
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.stopped = True
+
+
+class TickReplay:
+    """
+    Tick source that plays a recording back in place of the tick engine.
+
+    Batches come out in recorded order with their recorded prices, volumes
+    and timestamps, so a replay is repeatable. ``next_delay`` paces them by
+    the recorded gaps divided by ``speed``; an infinite speed replays as
+    fast as the consumer allows. With ``loop``, playback restarts at the end
+    with timestamps shifted past the previous pass, so they keep increasing.
+    """
+
+    def __init__(self, recording: TickRecording, speed: float = 1.0, loop: bool = True):
+        if not len(recording):
+            raise ValueError("Tick recording is empty")
+        self.recording = recording
+        self.symbols = recording.symbols
+        self.index = {code: i for i, code in enumerate(self.symbols)}
+        self.speed = speed
+        self.loop = loop
+        self.position = -1
+        self.passes = 0
+        self._span = int(recording.timestamps[-1] - recording.timestamps[0]) + 1
+        self._batch: Optional[TickBatch] = None
+
+    @classmethod
+    def open(cls, path: str, speed: float = 1.0, loop: bool = True) -> "TickReplay":
+        return cls(load_recording(path), speed, loop)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def finished(self) -> bool:
+        return not self.loop and self.position >= len(self.recording) - 1
+
+    def generate(self) -> TickBatch:
+        """Return the next recorded batch (the last one again once finished)."""
+        if not self.finished:
+            self.position += 1
+            if self.position == len(self.recording):
+                self.position = 0
+                self.passes += 1
+            row = self.position
+            timestamp = int(self.recording.timestamps[row]) + self.passes * self._span
+            self._batch = TickBatch(
+                self.symbols,
+                self.recording.prices[row],
+                self.recording.volumes[row],
+                timestamp,
+            )
+        return self._batch
+
+    def next_delay(self) -> Optional[float]:
+        """Seconds until the next batch is due, or None once finished."""
+        if self.finished:
+            return None
+        times = self.recording.times
+        row = self.position
+        if row < 0 or len(times) < 2:
+            return 0.0
+        if row + 1 == len(times):
+            # Wrapping around: keep the cadence of the first recorded gap
+            row = 0
+        return max(0.0, float(times[row + 1] - times[row])) / self.speed
+
+    def tick(self, index: int) -> dict:
+        """Return the current tick of the symbol at ``index``."""
+        batch = self._batch if self._batch is not None else self.generate()
+        return batch.tick(index)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the order id generator.
+
+Generates ids from several threads in each of several processes, checks that
+every id is unique and that each thread sees strictly increasing ids, and
+reports throughput. Each process claims its worker id through the same lock
+file mechanism the API uses, so this also exercises multi-worker startup.
+
+    python benchmarks/bench_id_generator.py --processes 4 --threads 4 --ids 100000
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.id_generator import SnowflakeIdGenerator, claim_worker_id  # noqa: E402
+
+
+def run_process(lock_dir: str, threads: int, ids_per_thread: int, queue):
+    generator = SnowflakeIdGenerator(claim_worker_id(lock_dir))
+    results = [None] * threads
+
+    def worker(slot):
+        results[slot] = [generator.next_id() for _ in range(ids_per_thread)]
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    monotonic = all(all(a < b for a, b in zip(ids, ids[1:])) for ids in results if ids)
+    queue.put(
+        {
+            "worker_id": generator.worker_id,
+            "elapsed_s": elapsed,
+            "monotonic_per_thread": monotonic,
+            "ids": [i for ids in results for i in ids],
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--ids", type=int, default=50000, help="ids per thread")
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    with tempfile.TemporaryDirectory() as lock_dir:
+        procs = [
+            ctx.Process(
+                target=run_process, args=(lock_dir, args.threads, args.ids, queue)
+            )
+            for _ in range(args.processes)
+        ]
+        for p in procs:
+            p.start()
+        reports = [queue.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    all_ids = [i for r in reports for i in r.pop("ids")]
+    total = len(all_ids)
+    result = {
+        "benchmark": "id_generator",
+        "processes": args.processes,
+        "threads_per_process": args.threads,
+        "ids_total": total,
+        "unique": len(set(all_ids)) == total,
+        "monotonic_per_thread": all(r["monotonic_per_thread"] for r in reports),
+        "distinct_workers": len({r["worker_id"] for r in reports}) == len(reports),
+        "ids_per_second_per_process": [
+            round(args.threads * args.ids / r["elapsed_s"]) for r in reports
+        ],
+        "below_2_pow_53": max(all_ids) < 2**53,
+    }
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+    if not (result["unique"] and result["monotonic_per_thread"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the order path.
+
+Measures POST /api/orders (one order) and GET /api/orders (newest page) as
+the number of stored orders of one symbol grows through --checkpoints, for
+each order backend and durability mode, at three layers: the repository,
+OrderService, and the full ASGI app through an in-process HTTP client. Every
+run uses a fresh temporary ORDERS_DIR. The "legacy" backend is the original
+JSON-array repository, which rewrites the whole file on every save; it only
+runs at the repository layer and up to --legacy-max orders.
+
+Reports orders/s and p50/p99 latency per checkpoint as JSON, plus a text
+chart of POST p50 latency against stored orders.
+
+    python benchmarks/bench_orders.py --output orders.json
+    python benchmarks/bench_orders.py --layers repository --backends legacy,jsonl \\
+        --fsync never --checkpoints 0,1000,10000,100000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.chdir(Path(__file__).resolve().parent.parent)
+# App logs go to stdout; keep them out of the JSON results
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.models.order import OrderCreateRequest, OrderResponse  # noqa: E402
+from app.repositories.order_repository import OrderRepository  # noqa: E402
+from app.repositories.sqlite_order_repository import (  # noqa: E402
+    SqliteOrderRepository,
+)
+from app.services.order_service import OrderService  # noqa: E402
+from app.services.symbol_service import SymbolService  # noqa: E402
+from app.utils.id_generator import SnowflakeIdGenerator  # noqa: E402
+
+SYMBOL = "AAPL"
+PREFILL_BATCH = 10000
+MIN_SAMPLES = 3
+
+
+class LegacyOrderRepository:
+    """The original repository: one JSON array per symbol, rewritten per save."""
+
+    def __init__(self, orders_dir: str):
+        self.orders_dir = orders_dir
+
+    def _file_path(self, symbol: str) -> str:
+        return os.path.join(self.orders_dir, f"{symbol}.json")
+
+    def load_orders(self, symbol: str) -> List[OrderResponse]:
+        file_path = self._file_path(symbol)
+        if not os.path.exists(file_path):
+            return []
+        with open(file_path, "r") as f:
+            return [OrderResponse(**o) for o in json.load(f)]
+
+    def save_order(self, order: OrderResponse):
+        file_path = self._file_path(order.symbol)
+        orders = []
+        if os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                orders = json.load(f)
+        orders.append(order.model_dump())
+        with open(file_path, "w") as f:
+            json.dump(orders, f, indent=2)
+
+    def save_orders(self, orders: List[OrderResponse]):
+        file_path = self._file_path(SYMBOL)
+        existing = []
+        if os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                existing = json.load(f)
+        existing.extend(o.model_dump() for o in orders)
+        with open(file_path, "w") as f:
+            json.dump(existing, f, indent=2)
+
+    def close(self):
+        pass
+
+
+def make_repository(backend: str, fsync: str, orders_dir: str):
+    if backend == "legacy":
+        return LegacyOrderRepository(orders_dir)
+    if backend == "sqlite":
+        return SqliteOrderRepository(os.path.join(orders_dir, "orders.db"), fsync)
+    return OrderRepository(orders_dir, fsync=fsync)
+
+
+class Target:
+    """One layer over one backend; subclasses implement post and get."""
+
+    def __init__(self, backend: str, fsync: str, orders_dir: str, page: int):
+        self.backend = backend
+        self.fsync = fsync
+        self.orders_dir = orders_dir
+        self.page = page
+        self.ids = SnowflakeIdGenerator(30)
+        self.price = SymbolService().get_symbol_map()[SYMBOL].close_price
+        self.repository = None
+
+    async def __aenter__(self):
+        self.repository = make_repository(self.backend, self.fsync, self.orders_dir)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.repository.close()
+
+    def new_order(self) -> OrderResponse:
+        return OrderResponse.model_construct(
+            id=self.ids.next_id(),
+            symbol=SYMBOL,
+            side="BUY",
+            quantity=1,
+            price=self.price,
+            timestamp=int(time.time()),
+        )
+
+    def prefill(self, count: int):
+        """Store ``count`` more orders in bulk, outside of any measurement."""
+        while count > 0:
+            batch = min(count, PREFILL_BATCH)
+            self.repository.save_orders([self.new_order() for _ in range(batch)])
+            count -= batch
+
+    async def post(self):
+        raise NotImplementedError
+
+    async def get(self):
+        raise NotImplementedError
+
+
+class RepositoryTarget(Target):
+    async def post(self):
+        self.repository.save_order(self.new_order())
+
+    async def get(self):
+        if self.backend == "legacy":
+            # The original GET /api/orders returned every order
+            self.repository.load_orders(SYMBOL)
+        else:
+            self.repository.query_orders(SYMBOL, limit=self.page, descending=True)
+
+
+class ServiceTarget(Target):
+    async def __aenter__(self):
+        await super().__aenter__()
+        self.service = OrderService(
+            self.repository, symbol_service=SymbolService(), id_generator=self.ids
+        )
+        self.request = OrderCreateRequest(
+            symbol=SYMBOL, side="BUY", quantity=1, price=self.price
+        )
+        return self
+
+    async def post(self):
+        await self.service.create_order_async(self.request)
+
+    async def get(self):
+        await self.service.query_orders_async(SYMBOL, limit=self.page, descending=True)
+
+
+class AsgiTarget(Target):
+    async def __aenter__(self):
+        settings.ORDERS_DIR = self.orders_dir
+        settings.ORDER_BACKEND = self.backend
+        settings.ORDER_FSYNC = self.fsync
+        self.app = create_app()
+        self._lifespan = self.app.router.lifespan_context(self.app)
+        await self._lifespan.__aenter__()
+        self.repository = self.app.state.order_repository
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app), base_url="http://bench"
+        )
+        self.body = {"symbol": SYMBOL, "side": "BUY", "quantity": 1}
+        self.body["price"] = self.price
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.aclose()
+        # The lifespan closes the repository
+        await self._lifespan.__aexit__(*exc)
+
+    async def post(self):
+        response = await self.client.post("/api/orders", json=self.body)
+        response.raise_for_status()
+
+    async def get(self):
+        response = await self.client.get(
+            "/api/orders",
+            params={"symbol": SYMBOL, "limit": self.page, "order": "desc"},
+        )
+        response.raise_for_status()
+
+
+LAYERS = {
+    "repository": RepositoryTarget,
+    "service": ServiceTarget,
+    "asgi": AsgiTarget,
+}
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(operation, samples: int, budget: float, concurrency: int) -> dict:
+    """Run ``operation`` up to ``samples`` times or for ``budget`` seconds."""
+
+    async def timed():
+        started = time.perf_counter()
+        await operation()
+        return time.perf_counter() - started
+
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < samples and (
+        time.perf_counter() - started < budget or len(latencies) < MIN_SAMPLES
+    ):
+        count = min(concurrency, samples - len(latencies))
+        latencies.extend(await asyncio.gather(*(timed() for _ in range(count))))
+    elapsed = time.perf_counter() - started
+    return {
+        "samples": len(latencies),
+        "ops_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+async def run_series(layer, backend, fsync, checkpoints, args) -> dict:
+    series = {"layer": layer, "backend": backend, "fsync": fsync, "points": []}
+    concurrency = 1 if layer == "repository" else args.concurrency
+    with tempfile.TemporaryDirectory() as orders_dir:
+        async with LAYERS[layer](backend, fsync, orders_dir, args.page) as target:
+            stored = 0
+            for checkpoint in checkpoints:
+                target.prefill(checkpoint - stored)
+                stored = checkpoint
+                post = await measure(
+                    target.post, args.samples, args.budget, concurrency
+                )
+                stored += post["samples"]
+                get = await measure(target.get, args.samples, args.budget, concurrency)
+                series["points"].append(
+                    {"orders_per_symbol": checkpoint, "post": post, "get": get}
+                )
+                print(
+                    f"{layer:>10} {backend:>6} {fsync:>6} {checkpoint:>8}: "
+                    f"POST {post['ops_per_second']:>9.1f}/s {post['p50_ms']:.3f}ms"
+                    f" | GET {get['ops_per_second']:>9.1f}/s {get['p50_ms']:.3f}ms",
+                    file=sys.stderr,
+                )
+    return series
+
+
+def chart(results: List[dict], width: int = 40) -> str:
+    """Text chart of POST p50 latency per checkpoint, on a log scale."""
+    values = [
+        point["post"]["p50_ms"] for series in results for point in series["points"]
+    ]
+    if not values:
+        return ""
+    low = math.log10(max(min(values), 1e-3))
+    high = math.log10(max(values))
+    span = max(high - low, 1e-9)
+    lines = ["POST /api/orders p50 latency vs stored orders per symbol (log scale)"]
+    for series in results:
+        lines.append(f"{series['layer']} / {series['backend']} / {series['fsync']}")
+        for point in series["points"]:
+            p50 = point["post"]["p50_ms"]
+            bar = 1 + round((math.log10(max(p50, 1e-3)) - low) / span * (width - 1))
+            count = point["orders_per_symbol"]
+            lines.append(f"  {count:>9,} | {'#' * bar:<{width}} {p50:.3f} ms")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--layers", default="repository,service,asgi")
+    parser.add_argument("--backends", default="legacy,jsonl,sqlite")
+    parser.add_argument("--fsync", default="always,batch,never")
+    parser.add_argument(
+        "--checkpoints",
+        default="0,1000,10000,100000,1000000",
+        help="stored orders per symbol at which to measure",
+    )
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=100000,
+        help="largest checkpoint for the legacy backend (each save rewrites it)",
+    )
+    parser.add_argument("--samples", type=int, default=500, help="max ops per point")
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per point")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page", type=int, default=100, help="GET page size")
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+
+    checkpoints = sorted(int(c) for c in args.checkpoints.split(","))
+    # The tick clock would run alongside the app for bars; keep it quiet
+    settings.BAR_INTERVALS = ""
+
+    results = []
+    for layer in args.layers.split(","):
+        for backend in args.backends.split(","):
+            if backend == "legacy":
+                if layer != "repository":
+                    continue
+                legacy = [c for c in checkpoints if c <= args.legacy_max]
+                results.append(
+                    asyncio.run(run_series(layer, backend, "n/a", legacy, args))
+                )
+                continue
+            for fsync in args.fsync.split(","):
+                results.append(
+                    asyncio.run(run_series(layer, backend, fsync, checkpoints, args))
+                )
+
+    output = json.dumps({"benchmark": "orders", "series": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+    print(chart(results), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
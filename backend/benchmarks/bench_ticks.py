@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the tick stream.
+
+Starts the ASGI app in-process and connects --clients simulated /ws/ticks
+clients to it directly over the ASGI interface (no sockets), each subscribed
+to --symbols-per-client symbols. Reports delivered ticks/s, end-to-end
+latency from publish to delivery (p50/p99/max), frames dropped for slow
+clients and server RSS. Also microbenchmarks the TickService tick paths.
+Clients run on the server's event loop, so their (small) cost is included.
+
+    python benchmarks/bench_ticks.py --clients 2000 --interval 0.1 --duration 10
+    python benchmarks/bench_ticks.py --replay ticks.bin --speed max --output r.json
+    python benchmarks/bench_ticks.py --encoder orjson --binary
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+import timeit
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.chdir(Path(__file__).resolve().parent.parent)
+# App logs go to stdout; keep them out of the JSON results
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.config import settings  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.services.tick_service import TickService  # noqa: E402
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Peak RSS where /proc is unavailable (KiB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Stats:
+    """Delivery counters shared by all clients."""
+
+    def __init__(self):
+        self.published = {}
+        self.latencies = array("d")
+        self.ticks = 0
+        self.measuring = False
+
+    def delivered(self, frame: str, now: float):
+        if not self.measuring:
+            return
+        self.ticks += 1
+        sent = self.published.get(id(frame))
+        if sent is not None and sent[0] is frame:
+            self.latencies.append(now - sent[1])
+
+    def prune(self, older_than: float):
+        stale = [k for k, (_, t) in self.published.items() if t < older_than]
+        for key in stale:
+            del self.published[key]
+
+
+class SimulatedClient:
+    """One /ws/ticks connection driven through the ASGI websocket protocol."""
+
+    def __init__(self, number: int, symbols, stats: Stats):
+        self.symbols = symbols
+        self.stats = stats
+        self.subscribed = asyncio.Event()
+        self._inbox = asyncio.Queue()
+        self._inbox.put_nowait({"type": "websocket.connect"})
+        self.scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": "/ws/ticks",
+            "raw_path": b"/ws/ticks",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 10000 + number),
+            "server": ("bench", 80),
+            "subprotocols": [],
+        }
+
+    async def receive(self):
+        return await self._inbox.get()
+
+    async def send(self, message):
+        kind = message["type"]
+        if kind == "websocket.accept":
+            command = {"action": "subscribe", "symbols": self.symbols}
+            self._inbox.put_nowait(
+                {"type": "websocket.receive", "text": json.dumps(command)}
+            )
+        elif kind == "websocket.send":
+            frame = message.get("text")
+            if frame is None:
+                # Binary data frame (WS_BINARY_FRAMES)
+                self.stats.delivered(message["bytes"], time.perf_counter())
+            elif frame.startswith('{"type"'):
+                if '"subscriptions"' in frame:
+                    self.subscribed.set()
+            else:
+                self.stats.delivered(frame, time.perf_counter())
+
+    def disconnect(self):
+        self._inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+
+async def run_load(args) -> dict:
+    app = create_app()
+    stats = Stats()
+    rss_before = rss_mb()
+    async with app.router.lifespan_context(app):
+        broadcaster = app.state.tick_broadcaster
+        symbols = list(app.state.symbol_service.get_symbol_map())
+
+        publish = broadcaster.publish
+
+        def timed_publish(topic, frame):
+            stats.published[id(frame)] = (frame, time.perf_counter())
+            return publish(topic, frame)
+
+        broadcaster.publish = timed_publish
+
+        clients = []
+        for number in range(args.clients):
+            chosen = [
+                symbols[(number + i) % len(symbols)]
+                for i in range(args.symbols_per_client)
+            ]
+            clients.append(SimulatedClient(number, chosen, stats))
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(app(c.scope, c.receive, c.send)) for c in clients]
+        await asyncio.wait_for(
+            asyncio.gather(*(c.subscribed.wait() for c in clients)), 60
+        )
+        connect_s = time.perf_counter() - started
+        rss_connected = rss_mb()
+
+        stats.measuring = True
+        started = time.perf_counter()
+        rss_peak = rss_connected
+        while time.perf_counter() - started < args.duration:
+            await asyncio.sleep(0.5)
+            stats.prune(time.perf_counter() - 5)
+            rss_peak = max(rss_peak, rss_mb())
+        elapsed = time.perf_counter() - started
+        stats.measuring = False
+
+        dropped = sum(
+            subscriber.dropped
+            for subscribers in broadcaster._subscribers.values()
+            for subscriber in subscribers
+        )
+        for client in clients:
+            client.disconnect()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies_ms = [latency * 1000 for latency in stats.latencies]
+    return {
+        "clients": args.clients,
+        "symbols_per_client": args.symbols_per_client,
+        "tick_interval_s": args.interval,
+        "source": settings.TICK_SOURCE,
+        "encoder": settings.JSON_ENCODER,
+        "binary_frames": settings.WS_BINARY_FRAMES,
+        "connect_s": round(connect_s, 3),
+        "duration_s": round(elapsed, 3),
+        "ticks_delivered": stats.ticks,
+        "ticks_per_second": round(stats.ticks / elapsed),
+        "frames_dropped": dropped,
+        "latency_ms": {
+            "samples": len(latencies_ms),
+            "p50": round(percentile(latencies_ms, 0.50), 3),
+            "p99": round(percentile(latencies_ms, 0.99), 3),
+            "max": round(max(latencies_ms, default=0.0), 3),
+        },
+        "rss_mb": {
+            "before": round(rss_before, 1),
+            "connected": round(rss_connected, 1),
+            "peak": round(rss_peak, 1),
+        },
+    }
+
+
+def run_micro(number: int) -> dict:
+    """Time the per-symbol tick paths of TickService."""
+    service = TickService(seed=0)
+    symbols = service.symbol_service.get_all_symbols()
+    symbol = symbols[0]
+    service.get_engine()
+
+    results = {}
+    cases = {
+        "get_tick_for_symbol": lambda: service.get_tick_for_symbol(symbol.symbol),
+        "_generate_tick": lambda: service._generate_tick(symbol),
+        "generate_batch": service.generate_batch,
+    }
+    for name, call in cases.items():
+        best = min(timeit.repeat(call, number=number, repeat=5))
+        results[name] = {
+            "calls_per_second": round(number / best),
+            "us_per_call": round(best / number * 1e6, 3),
+        }
+    results["generate_batch"]["symbols"] = len(symbols)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--symbols-per-client", type=int, default=1)
+    parser.add_argument(
+        "--interval", type=float, default=0.1, help="seconds between tick batches"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--replay", help="stream this tick recording instead")
+    parser.add_argument("--speed", default="max", help="replay speed multiplier")
+    parser.add_argument(
+        "--encoder", default="auto", help="JSON encoder: auto, orjson, msgspec, json"
+    )
+    parser.add_argument(
+        "--binary", action="store_true", help="send data as binary frames"
+    )
+    parser.add_argument("--micro-calls", type=int, default=20000)
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+
+    # Keep orders created at startup out of the working tree
+    orders_dir = tempfile.TemporaryDirectory()
+    settings.ORDERS_DIR = orders_dir.name
+    # Bars are built off the same clock; leave them out of the tick numbers
+    settings.BAR_INTERVALS = ""
+    settings.JSON_ENCODER = args.encoder
+    settings.WS_BINARY_FRAMES = args.binary
+    # Read by both the tick clock and the price model, so set before startup
+    settings.TICK_INTERVAL = args.interval
+    if args.replay:
+        settings.TICK_SOURCE = "replay"
+        settings.TICK_REPLAY_FILE = args.replay
+        settings.TICK_REPLAY_SPEED = args.speed
+
+    result = {"benchmark": "ticks", "micro": run_micro(args.micro_calls)}
+    if not args.skip_load:
+        result["load"] = asyncio.run(run_load(args))
+    orders_dir.cleanup()
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
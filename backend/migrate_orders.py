@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Import orders from the file store into the SQLite order backend.
+
+Reads every symbol in ORDERS_DIR (JSON-lines logs, and legacy JSON arrays,
+which are first converted to logs as the server would do) and inserts the
+orders into the SQLite database used by ORDER_BACKEND=sqlite. Orders already
+in the database are skipped, so the import can safely be re-run.
+
+Orders whose id is already stored with different values (legacy ids are
+millisecond timestamps, so distinct legacy orders can share one) cannot be
+imported; they are listed and the tool exits with status 1.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings  # noqa: E402
+from app.repositories.order_repository import OrderRepository  # noqa: E402
+from app.repositories.sqlite_order_repository import (  # noqa: E402
+    SqliteOrderRepository,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--orders-dir",
+        default=settings.ORDERS_DIR,
+        help="Directory holding <SYMBOL>.jsonl / <SYMBOL>.json files",
+    )
+    parser.add_argument(
+        "--db",
+        default=settings.ORDER_DB_PATH or None,
+        help="SQLite database to import into (default: <orders-dir>/orders.db)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help="Orders inserted per transaction",
+    )
+    return parser.parse_args()
+
+
+def migrate(orders_dir: str, db_path: str, batch_size: int) -> Tuple[int, list]:
+    """
+    Import every stored symbol. Returns the number of rows inserted and
+    ``(symbol, id)`` of each order that conflicts with a stored one.
+    """
+    source = OrderRepository(orders_dir)
+    target = SqliteOrderRepository(db_path, fsync="batch")
+    total = 0
+    conflicts = []
+    try:
+        for symbol in source.stored_symbols():
+            read = inserted = 0
+            symbol_conflicts = []
+            batch = []
+            for order in source.iter_orders(symbol):
+                batch.append(order)
+                if len(batch) >= batch_size:
+                    count, ids = target.insert_orders(batch)
+                    read, inserted = read + len(batch), inserted + count
+                    symbol_conflicts.extend(ids)
+                    batch = []
+            if batch:
+                count, ids = target.insert_orders(batch)
+                read, inserted = read + len(batch), inserted + count
+                symbol_conflicts.extend(ids)
+            print(
+                f"{symbol}: {inserted} of {read} orders imported, "
+                f"{read - inserted - len(symbol_conflicts)} already present, "
+                f"{len(symbol_conflicts)} conflicting"
+            )
+            total += inserted
+            conflicts.extend((symbol, order_id) for order_id in symbol_conflicts)
+    finally:
+        source.close()
+        target.close()
+    return total, conflicts
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(args.orders_dir, "orders.db")
+    print(f"Importing orders from {args.orders_dir} into {db_path}")
+    print("-" * 50)
+
+    started = time.perf_counter()
+    total, conflicts = migrate(args.orders_dir, db_path, args.batch_size)
+    elapsed = time.perf_counter() - started
+    print("-" * 50)
+    print(f"Imported {total} orders in {elapsed:.1f}s (existing orders skipped)")
+    if conflicts:
+        print(
+            f"{len(conflicts)} orders not imported: their id is already stored "
+            "with different values",
+            file=sys.stderr,
+        )
+        for symbol, order_id in conflicts:
+            print(f"  {symbol} {order_id}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
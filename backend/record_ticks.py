@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Write a synthetic tick recording for TICK_SOURCE=replay.
+
+Runs the simulated tick engine offline with a fixed seed, so the same
+arguments always produce the same file, and records --batches batches spaced
+--interval seconds apart for every symbol in SYMBOLS_FILE. Use *.ndjson for
+a text recording; any other name gets the memory-mapped binary format. To
+capture ticks from a running server instead, set TICK_RECORD_FILE.
+
+    python record_ticks.py --out ticks.bin --batches 100000 --interval 0.01
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings  # noqa: E402
+from app.services.symbol_service import SymbolService  # noqa: E402
+from app.utils.price_model import build_price_model  # noqa: E402
+from app.utils.tick_generator import TickEngine  # noqa: E402
+from app.utils.tick_replay import TickRecorder  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", required=True, help="Recording file to write")
+    parser.add_argument(
+        "--batches", type=int, default=3600, help="Tick batches to record"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between batches"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--start",
+        type=int,
+        default=1700000000,
+        help="Epoch timestamp of the first batch",
+    )
+    return parser.parse_args()
+
+
+def record(
+    out: str, batches: int, interval: float, seed: int, start: int
+) -> TickRecorder:
+    symbols = SymbolService().get_all_symbols()
+    base = np.fromiter((s.close_price for s in symbols), np.float64, len(symbols))
+    # Scale the price steps to the recorded spacing, not TICK_INTERVAL
+    model = build_price_model(
+        settings.TICK_PRICE_MODEL,
+        base,
+        interval,
+        drift=settings.TICK_DRIFT,
+        volatility=settings.TICK_VOLATILITY,
+        reversion=settings.TICK_MEAN_REVERSION,
+    )
+    engine = TickEngine(symbols, seed=seed, model=model)
+    recorder = TickRecorder(out)
+    try:
+        for i in range(batches):
+            elapsed = i * interval
+            batch = engine.generate()
+            batch.timestamp = start + int(elapsed)
+            recorder.record(batch, now=elapsed)
+    finally:
+        recorder.close()
+    return recorder
+
+
+def main():
+    args = parse_args()
+    started = time.perf_counter()
+    recorder = record(args.out, args.batches, args.interval, args.seed, args.start)
+    elapsed = time.perf_counter() - started
+    size = os.path.getsize(args.out)
+    print(
+        f"Recorded {recorder.count} batches x {len(recorder.symbols)} symbols "
+        f"({recorder.format}, {size / 1e6:.1f} MB) to {args.out} in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import json
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from app.models.symbol import Symbol
+from app.services.bar_broadcaster import BarBroadcaster
+from app.services.broadcaster import Subscriber
+from app.services.symbol_service import SymbolService
+from app.utils.bar_aggregator import BarAggregator, parse_intervals
+from app.utils.tick_generator import TickBatch
+
+
+def feed(aggregator, prices, volumes, timestamp):
+    return aggregator.update(
+        np.array(prices, dtype=np.float64), np.array(volumes), timestamp
+    )
+
+
+class TestBarAggregator:
+    """Test cases for the ring-buffered OHLCV aggregator."""
+
+    def test_folds_ticks_into_bars(self):
+        """Test ticks within a period update one bar and the next period closes it."""
+        aggregator = BarAggregator(("AAPL", "MSFT"), "1m", capacity=4)
+
+        assert feed(aggregator, [10.0, 20.0], [1, 2], 60) is None
+        assert feed(aggregator, [12.0, 19.0], [3, 4], 90) is None
+        assert feed(aggregator, [11.0, 21.0], [5, 6], 119) is None
+        closed = feed(aggregator, [13.0, 22.0], [7, 8], 120)
+
+        assert aggregator.bar(closed, 0) == {
+            "symbol": "AAPL",
+            "interval": "1m",
+            "start": 60,
+            "open": 10.0,
+            "high": 12.0,
+            "low": 10.0,
+            "close": 11.0,
+            "volume": 9,
+        }
+        bar = aggregator.bar(closed, 1)
+        assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (
+            20.0,
+            21.0,
+            19.0,
+            21.0,
+        )
+        assert [b["start"] for b in aggregator.bars(0)] == [60, 120]
+
+    def test_ring_keeps_newest_bars(self):
+        """Test memory is fixed: only the newest ``capacity`` bars are kept."""
+        aggregator = BarAggregator(("AAPL",), "1s", capacity=3)
+        for second in range(10):
+            feed(aggregator, [float(second)], [1], second)
+
+        assert [b["close"] for b in aggregator.bars(0)] == [7.0, 8.0, 9.0]
+        assert [b["close"] for b in aggregator.bars(0, limit=2)] == [8.0, 9.0]
+        assert aggregator.open.shape == (3, 1)
+
+    def test_adopt_carries_history_of_common_symbols(self):
+        """Test bar history survives a change of the symbol universe."""
+        old = BarAggregator(("AAPL", "MSFT"), "1s", capacity=3)
+        for second in range(4):
+            feed(old, [1.0 + second, 2.0 + second], [1, 1], second)
+
+        new = BarAggregator(("MSFT", "NVDA"), "1s", capacity=3)
+        new.adopt(old)
+        feed(new, [9.0, 9.5], [1, 1], 4)
+
+        assert [b["close"] for b in new.bars(0)] == [4.0, 5.0, 9.0]
+        assert [b["start"] for b in new.bars(1)] == [4]
+
+    def test_parse_intervals(self):
+        """Test interval lists are parsed and unknown intervals rejected."""
+        assert parse_intervals("1s, 1m,5m") == ["1s", "1m", "5m"]
+        assert parse_intervals("") == []
+        with pytest.raises(ValueError, match="Invalid bar interval"):
+            parse_intervals("2m")
+
+
+class TestBarBroadcaster:
+    """Test cases for publishing closed bars."""
+
+    @pytest.fixture
+    def bars(self):
+        """Create a BarBroadcaster over a fixed symbol universe."""
+        symbol_service = Mock(spec=SymbolService)
+        symbol_service.get_symbol_map.return_value = {
+            s: Symbol(symbol=s, name=s, market="NASDAQ", close_price=100.0)
+            for s in ("AAPL", "MSFT")
+        }
+        return BarBroadcaster(symbol_service, intervals=["1s", "1m"], capacity=10)
+
+    def batch(self, prices, timestamp):
+        return TickBatch(
+            ("AAPL", "MSFT"), np.array(prices), np.array([1, 1]), timestamp
+        )
+
+    @pytest.mark.asyncio
+    async def test_closed_bars_published_to_subscribers(self, bars):
+        """Test each closed bar is pushed once to subscribers of its symbol."""
+        subscriber = Subscriber(maxsize=10)
+        bars.subscribe(subscriber, "MSFT")
+
+        assert bars.publish_batch(self.batch([1.0, 2.0], 60)) == 0
+        assert bars.publish_batch(self.batch([1.5, 2.5], 61)) == 1
+
+        bar = json.loads(await subscriber.get())
+        assert bar["symbol"] == "MSFT"
+        assert bar["interval"] == "1s"
+        assert bar["close"] == 2.0
+        assert [b["close"] for b in bars.get_bars("MSFT", "1m")] == [2.5]
+
+    @pytest.mark.asyncio
+    async def test_invalid_symbol_and_interval(self, bars):
+        """Test unknown symbols and intervals are rejected."""
+        with pytest.raises(ValueError, match="Invalid symbol: NOPE"):
+            bars.subscribe(Subscriber(maxsize=1), "NOPE")
+        with pytest.raises(ValueError, match="Invalid interval: 5m"):
+            bars.get_bars("AAPL", "5m")
+        assert bars.get_bars("AAPL", "1s") == []
+
+    def test_symbols_follow_the_tick_batches(self, bars):
+        """Test symbols are checked against the batches, e.g. of a replay."""
+        assert bars.has_symbol("AAPL")
+        assert not bars.has_symbol("ZZZZ")
+
+        bars.publish_batch(TickBatch(("ZZZZ",), np.array([1.0]), np.array([1]), 60))
+
+        assert bars.has_symbol("ZZZZ")
+        assert not bars.has_symbol("AAPL")
+        bars.subscribe(Subscriber(maxsize=1), "ZZZZ")
@@ -0,0 +1,80 @@
+import threading
+import pytest
+from unittest.mock import patch
+
+from app.utils.id_generator import SnowflakeIdGenerator
+
+
+class TestSnowflakeIdGenerator:
+    """Test cases for SnowflakeIdGenerator."""
+
+    def test_ids_encode_time_and_worker(self):
+        """Test an id decodes back to its millisecond and worker id."""
+        generator = SnowflakeIdGenerator(worker_id=7)
+
+        with patch("time.time", return_value=1700000000.123):
+            order_id = generator.next_id()
+
+        assert SnowflakeIdGenerator.timestamp_ms(order_id) == 1700000000123
+        assert SnowflakeIdGenerator.worker_of(order_id) == 7
+
+    def test_ids_fit_in_javascript_safe_integer(self):
+        """Test ids stay below 2**53 for the next decades."""
+        generator = SnowflakeIdGenerator(worker_id=31)
+
+        with patch("time.time", return_value=3600000000):  # year 2084
+            assert generator.next_id() < 2**53
+
+    def test_same_millisecond_burst_is_unique_and_sorted(self):
+        """Test more ids than the sequence holds in one millisecond stay unique."""
+        generator = SnowflakeIdGenerator()
+
+        with patch("time.time", return_value=1700000000):
+            ids = [generator.next_id() for _ in range(1000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 1000
+
+    def test_clock_going_backwards_stays_monotonic(self):
+        """Test a backwards clock step never yields a smaller id."""
+        generator = SnowflakeIdGenerator()
+
+        with patch("time.time", side_effect=[1700000001, 1700000000]):
+            first = generator.next_id()
+            second = generator.next_id()
+
+        assert second > first
+
+    def test_unique_across_threads(self):
+        """Test concurrent threads never receive the same id."""
+        generator = SnowflakeIdGenerator()
+        results = [[] for _ in range(8)]
+
+        def worker(out):
+            for _ in range(5000):
+                out.append(generator.next_id())
+
+        threads = [threading.Thread(target=worker, args=(r,)) for r in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_ids = [i for r in results for i in r]
+        assert len(set(all_ids)) == len(all_ids)
+        assert all(r == sorted(r) for r in results)
+
+    def test_workers_never_collide(self):
+        """Test two workers in the same millisecond produce disjoint ids."""
+        first, second = SnowflakeIdGenerator(1), SnowflakeIdGenerator(2)
+
+        with patch("time.time", return_value=1700000000):
+            ids_a = {first.next_id() for _ in range(500)}
+            ids_b = {second.next_id() for _ in range(500)}
+
+        assert not ids_a & ids_b
+
+    def test_invalid_worker_id(self):
+        """Test worker ids outside the 5-bit range are rejected."""
+        with pytest.raises(ValueError):
+            SnowflakeIdGenerator(worker_id=32)
@@ -0,0 +1,42 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.utils.json_codec import available_encoders, make_encoder
+
+
+class TestJsonCodec:
+    """Test cases for the pluggable JSON frame encoder."""
+
+    @pytest.mark.parametrize("name", available_encoders())
+    def test_encoders_agree(self, name):
+        """Test every installed encoder produces the same compact JSON."""
+        tick = {
+            "symbol": "AAPL",
+            "price": np.float64(150.25),
+            "volume": np.int64(300),
+            "timestamps": np.arange(3),
+        }
+        data = make_encoder(name)(tick)
+
+        assert isinstance(data, bytes)
+        assert b" " not in data
+        assert json.loads(data) == {
+            "symbol": "AAPL",
+            "price": 150.25,
+            "volume": 300,
+            "timestamps": [0, 1, 2],
+        }
+
+    def test_auto_prefers_fastest_installed(self):
+        """Test "auto" picks the first installed encoder in preference order."""
+        tick = {"symbol": "AAPL"}
+        fastest = available_encoders()[0]
+        assert make_encoder("auto")(tick) == make_encoder(fastest)(tick)
+        assert available_encoders()[-1] == "json"
+
+    def test_rejects_unknown_encoder(self):
+        """Test an unknown encoder name fails fast."""
+        with pytest.raises(ValueError):
+            make_encoder("yaml")
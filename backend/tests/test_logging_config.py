@@ -0,0 +1,80 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from app.core.logging_config import (
+    JsonFormatter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+class TestLoggingConfig:
+    """Test cases for the application logging setup."""
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        """Remove handlers installed by a test, even if it fails."""
+        yield
+        shutdown_logging()
+
+    def test_json_formatter_includes_extra_and_exception(self):
+        """Test JSON lines carry the message, extra fields and the traceback."""
+        logger = logging.getLogger("test.json")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logger.makeRecord(
+                logger.name,
+                logging.ERROR,
+                __file__,
+                1,
+                "Order %s failed",
+                (42,),
+                sys.exc_info(),
+                extra={"symbol": "AAPL"},
+            )
+        entry = json.loads(JsonFormatter().format(record))
+        assert entry["level"] == "ERROR"
+        assert entry["logger"] == "test.json"
+        assert entry["message"] == "Order 42 failed"
+        assert entry["symbol"] == "AAPL"
+        assert "ValueError: boom" in entry["exception"]
+
+    @pytest.mark.parametrize("use_queue", [False, True])
+    def test_writes_json_lines_to_file(self, tmp_path, use_queue):
+        """Test logs reach the file both directly and through the queue."""
+        log_file = tmp_path / "app.log"
+        configure_logging("INFO", "json", use_queue=use_queue, log_file=str(log_file))
+        logger = logging.getLogger("test.file")
+        logger.debug("hidden %s", "debug")
+        logger.info("Saved %s orders", 3, extra={"symbol": "MSFT"})
+        try:
+            raise RuntimeError("disk full")
+        except RuntimeError:
+            logger.error("Save failed", exc_info=True)
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [e["message"] for e in entries] == ["Saved 3 orders", "Save failed"]
+        assert entries[0]["symbol"] == "MSFT"
+        assert "RuntimeError: disk full" in entries[1]["exception"]
+
+    def test_shutdown_restores_root_logger(self, tmp_path):
+        """Test reconfiguring replaces handlers and shutdown undoes the setup."""
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+        configure_logging("DEBUG", "text", log_file=str(tmp_path / "a.log"))
+        configure_logging("DEBUG", "text", log_file=str(tmp_path / "b.log"))
+        assert len(root.handlers) == len(handlers) + 2
+        assert root.level == logging.DEBUG
+        shutdown_logging()
+        assert root.handlers == handlers
+        assert root.level == level
+
+    def test_rejects_unknown_format(self):
+        """Test an unsupported LOG_FORMAT fails fast."""
+        with pytest.raises(ValueError):
+            configure_logging("INFO", "xml")
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    FanoutCounter,
+    Histogram,
+    Registry,
+)
+from app.main import create_app
+
+
+class TestMetrics:
+    """Test cases for the metric types and text rendering."""
+
+    def test_counter_sums_thread_shards(self):
+        """Test increments from many threads are all counted."""
+        counter = Counter("test_events_total", "Events.")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.labels().value() == 80000
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in the first bucket whose bound holds them."""
+        registry = Registry()
+        histogram = registry.register(
+            Histogram("test_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+        )
+        child = histogram.labels("save")
+        for value in (0.05, 0.1, 0.5, 2.0):
+            child.observe(value)
+
+        text = registry.render()
+        assert "# TYPE test_seconds histogram" in text
+        assert 'test_seconds_bucket{op="save",le="0.1"} 2' in text
+        assert 'test_seconds_bucket{op="save",le="1"} 3' in text
+        assert 'test_seconds_bucket{op="save",le="+Inf"} 4' in text
+        assert 'test_seconds_count{op="save"} 4' in text
+        assert 'test_seconds_sum{op="save"} 2.65' in text
+
+    def test_labels_are_checked_and_escaped(self):
+        """Test label counts are enforced and values escaped when rendered."""
+        counter = Counter("test_labelled_total", "Labelled.", ("name",))
+        with pytest.raises(ValueError):
+            counter.labels()
+        counter.labels('a"b').inc(2)
+        assert 'test_labelled_total{name="a\\"b"} 2' in counter.render()
+
+    def test_fanout_counter_spreads_tuples(self):
+        """Test one increment counts once for every value of the tuple."""
+        ticks = FanoutCounter("test_ticks_total", "Ticks.", "symbol")
+        batch = ("AAPL", "MSFT")
+        for _ in range(3):
+            ticks.inc(batch)
+        ticks.inc(("AAPL",))
+
+        assert list(ticks.samples()) == [
+            ("test_ticks_total", (("symbol", "AAPL"),), 4),
+            ("test_ticks_total", (("symbol", "MSFT"),), 3),
+        ]
+
+
+class TestMetricsRoute:
+    """Test cases for the /metrics endpoint."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Create a test client storing orders in a temporary directory."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        with TestClient(create_app()) as client:
+            yield client
+
+    def test_metrics_cover_orders_and_streams(self, client):
+        """Test order activity and live subscriptions show up when scraped."""
+        client.post(
+            "/api/orders",
+            json={"symbol": "AAPL", "side": "BUY", "quantity": 1, "price": 180.0},
+        )
+        client.post(
+            "/api/orders",
+            json={"symbol": "AAPL", "side": "BUY", "quantity": 1, "price": 1.0},
+        )
+        client.get("/api/orders", params={"symbol": "AAPL", "limit": 10})
+
+        with client.websocket_connect("/ws/ticks") as websocket:
+            websocket.send_json({"action": "subscribe", "symbols": ["AAPL"]})
+            while websocket.receive_json().get("type") != "subscriptions":
+                pass
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(CONTENT_TYPE)
+        text = response.text
+        assert 'trading_order_validation_seconds_count{result="accepted"}' in text
+        assert 'trading_order_validation_seconds_count{result="rejected"}' in text
+        assert (
+            'trading_order_repository_seconds_count{backend="jsonl",operation="save"}'
+            in text
+        )
+        assert 'operation="query"' in text
+        assert 'trading_ws_clients{stream="ticks"} 1' in text
+        assert 'trading_ws_subscriptions{stream="ticks"} 1' in text
+        assert "# TYPE trading_ws_queue_depth_max gauge" in text
+        assert 'trading_ws_queued_frames{stream="ticks"}' in text
+        assert 'trading_ws_send_seconds_count{path="/ws/ticks"}' in text
+        assert "# TYPE trading_ticks_generated_total counter" in text
+
+    def test_metrics_can_be_disabled(self, tmp_path, monkeypatch):
+        """Test METRICS_ENABLED=false leaves the endpoint out."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+        with TestClient(create_app()) as client:
+            assert client.get("/metrics").status_code == 404
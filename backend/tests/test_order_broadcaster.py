@@ -0,0 +1,73 @@
+import asyncio
+import json
+import threading
+import pytest
+from unittest.mock import Mock
+
+from app.models.order import OrderResponse
+from app.models.symbol import Symbol
+from app.services.broadcaster import Subscriber
+from app.services.order_broadcaster import OrderBroadcaster
+from app.services.symbol_service import SymbolService
+
+
+class TestOrderBroadcaster:
+    """Test cases for the live order stream hub."""
+
+    @pytest.fixture
+    def broadcaster(self):
+        """Create an OrderBroadcaster over a fixed symbol universe."""
+        symbol_service = Mock(spec=SymbolService)
+        symbol_service.get_symbol_map.return_value = {
+            s: Symbol(symbol=s, name=s, market="NASDAQ", close_price=100.0)
+            for s in ("AAPL", "MSFT")
+        }
+        return OrderBroadcaster(symbol_service)
+
+    def make_order(self, order_id=1, symbol="AAPL"):
+        return OrderResponse(
+            id=order_id,
+            symbol=symbol,
+            side="BUY",
+            quantity=1,
+            price=100.0,
+            timestamp=1700000000,
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_fans_out_per_symbol(self, broadcaster):
+        """Test an order reaches only subscribers of its symbol."""
+        aapl, msft = Subscriber(maxsize=10), Subscriber(maxsize=10)
+        broadcaster.subscribe(aapl, "AAPL")
+        broadcaster.subscribe(msft, "MSFT")
+
+        assert broadcaster.publish_order(self.make_order()) == 1
+
+        frame = await asyncio.wait_for(aapl.get(), 1)
+        assert json.loads(frame)["id"] == 1
+        assert msft.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_symbol_rejected(self, broadcaster):
+        """Test subscribing to an unknown symbol raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid symbol: NOPE"):
+            broadcaster.subscribe(Subscriber(maxsize=1), "NOPE")
+
+    @pytest.mark.asyncio
+    async def test_publish_from_other_thread(self, broadcaster):
+        """Test orders committed off the event loop are delivered on it."""
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.subscribe(subscriber, "AAPL")
+
+        thread = threading.Thread(
+            target=broadcaster.publish_order, args=(self.make_order(7),)
+        )
+        thread.start()
+        thread.join()
+
+        frame = await asyncio.wait_for(subscriber.get(), 1)
+        assert json.loads(frame)["id"] == 7
+
+    def test_publish_without_subscribers(self, broadcaster):
+        """Test publishing with nobody subscribed is a no-op."""
+        assert broadcaster.publish_order(self.make_order()) == 0
@@ -0,0 +1,103 @@
+import pytest
+
+from app.models.order import OrderResponse
+from app.repositories.order_cache import OrderCache
+
+
+def make_order(order_id, symbol="AAPL", side="BUY"):
+    return OrderResponse(
+        id=order_id,
+        symbol=symbol,
+        side=side,
+        quantity=1,
+        price=155.0,
+        timestamp=1640995200 + order_id,
+    )
+
+
+class TestOrderCache:
+    """Test cases for the per-symbol LRU order cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a cache holding 5 orders per symbol and 8 in total."""
+        return OrderCache(max_orders=8, symbol_orders=5)
+
+    def test_get_validates_log_size(self, cache):
+        """Test a book is only returned while the log size matches."""
+        cache.put("AAPL", [make_order(1)], size=100, complete=True)
+
+        assert cache.get("AAPL", 100) is not None
+        assert cache.get("AAPL", 120) is None
+        assert cache.get("AAPL", 100) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_window_is_capped_per_symbol(self, cache):
+        """Test only the newest orders are kept and the book marked partial."""
+        book = cache.put("AAPL", [make_order(i) for i in range(1, 8)], 0, True)
+
+        assert [o.id for o in cache.orders(book)] == [3, 4, 5, 6, 7]
+        assert not book.complete
+
+    def test_least_recently_used_symbol_evicted(self, cache):
+        """Test the total cap evicts the least recently used symbol."""
+        cache.put("AAPL", [make_order(1), make_order(2)], 1, True)
+        cache.put("MSFT", [make_order(3), make_order(4)], 1, True)
+        cache.get("AAPL", 1)
+        cache.put("TSLA", [make_order(i) for i in range(5, 10)], 1, True)
+
+        assert cache.get("MSFT", 1) is None
+        assert cache.get("AAPL", 1) is not None
+        assert len(cache) == 7
+
+    def test_append_writes_through(self, cache):
+        """Test appends extend a matching book and drop a stale one."""
+        book = cache.put("AAPL", [make_order(1)], 10, True)
+        cache.append("AAPL", [make_order(2)], old_size=10, new_size=20)
+
+        assert [o.id for o in cache.orders(book)] == [1, 2]
+        assert cache.get("AAPL", 20) is book
+
+        cache.append("AAPL", [make_order(3)], old_size=25, new_size=30)
+        assert cache.get("AAPL", 30) is None
+
+    def test_select_from_partial_window(self, cache):
+        """Test queries answerable from a recent window, and ones that are not."""
+        book = cache.put(
+            "AAPL",
+            [make_order(i, side=("BUY", "SELL")[i % 2]) for i in range(5, 10)],
+            0,
+            complete=False,
+        )
+
+        assert [o.id for o in cache.select(book, limit=2, descending=True)] == [9, 8]
+        assert [o.id for o in cache.select(book, after_id=6)] == [7, 8, 9]
+        assert cache.select(book, limit=4, side="SELL", descending=True) is None
+        assert cache.select(book, limit=2) is None
+
+    def test_out_of_order_appends_stay_sorted(self, cache):
+        """Test appended ids below the newest are inserted in id order."""
+        book = cache.put("AAPL", [make_order(i) for i in (6, 8, 9)], 0, False)
+        cache.append("AAPL", [make_order(7), make_order(10)], 0, 10)
+
+        assert [o.id for o in cache.orders(book)] == [6, 7, 8, 9, 10]
+        assert [o.id for o in cache.select(book, after_id=6)] == [7, 8, 9, 10]
+        assert cache.select(book, after_id=5) is None
+
+        cache.append("AAPL", [make_order(3)], 10, 20)
+        # 3 fell out of the window, so ids up to 6 may be missing from it
+        assert [o.id for o in cache.orders(book)] == [6, 7, 8, 9, 10]
+        assert cache.select(book, limit=5, descending=True) is None
+        assert [o.id for o in cache.select(book, limit=4, descending=True)] == [
+            10,
+            9,
+            8,
+            7,
+        ]
+
+    def test_disabled_cache(self):
+        """Test a zero-sized cache stores nothing."""
+        cache = OrderCache(max_orders=0, symbol_orders=100)
+
+        assert not cache.enabled
+        assert cache.put("AAPL", [make_order(1)], 0, True) is None
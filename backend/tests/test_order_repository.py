@@ -0,0 +1,642 @@
+import asyncio
+import errno
+import json
+import multiprocessing
+import os
+import threading
+import pytest
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from app.models.order import OrderResponse
+from app.repositories.order_repository import OrderRepository
+from app.repositories.order_writer import OrderWriter, PartialWriteError
+
+
+class TestOrderRepository:
+    """Test cases for the append-only OrderRepository."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create an OrderRepository writing to a temporary directory."""
+        repo = OrderRepository(orders_dir=str(tmp_path), compact_every=1000)
+        yield repo
+        repo.close()
+
+    def make_order(self, order_id, symbol="AAPL", side="BUY"):
+        return OrderResponse(
+            id=order_id,
+            symbol=symbol,
+            side=side,
+            quantity=10,
+            price=155.0,
+            timestamp=1640995200 + order_id,
+        )
+
+    def test_load_orders_missing_file(self, repository):
+        """Test loading orders for a symbol without a log returns empty list."""
+        assert repository.load_orders("AAPL") == []
+
+    def test_save_and_load_round_trip(self, repository):
+        """Test saved orders are returned in insertion order."""
+        orders = [self.make_order(i) for i in range(1, 4)]
+        for order in orders:
+            repository.save_order(order)
+
+        assert repository.load_orders("AAPL") == orders
+        assert repository.load_orders("MSFT") == []
+
+    def test_save_order_appends_one_line(self, repository, tmp_path):
+        """Test each save appends exactly one JSON line to the symbol log."""
+        repository.save_order(self.make_order(1))
+        repository.save_order(self.make_order(2))
+
+        lines = (tmp_path / "AAPL.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["id"] == 2
+
+    def test_migrates_legacy_json_array(self, tmp_path):
+        """Test a legacy <SYMBOL>.json array is migrated to the log format."""
+        legacy = [self.make_order(1).model_dump(), self.make_order(2).model_dump()]
+        (tmp_path / "AAPL.json").write_text(json.dumps(legacy, indent=2))
+
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        repository.save_order(self.make_order(3))
+
+        assert [o.id for o in repository.load_orders("AAPL")] == [1, 2, 3]
+        assert not (tmp_path / "AAPL.json").exists()
+        assert (tmp_path / "AAPL.json.migrated").exists()
+        repository.close()
+
+    def test_torn_trailing_record_is_skipped(self, repository, tmp_path):
+        """Test a partial last line does not break loading or later appends."""
+        repository.save_order(self.make_order(1))
+        repository.close()
+        with open(tmp_path / "AAPL.jsonl", "a") as f:
+            f.write('{"id": 2, "symbol": "AA')
+
+        repository.save_order(self.make_order(3))
+
+        assert [o.id for o in repository.load_orders("AAPL")] == [1, 3]
+
+    def test_compaction_drops_duplicates(self, tmp_path):
+        """Test periodic compaction removes duplicate ids and corrupt lines."""
+        repository = OrderRepository(orders_dir=str(tmp_path), compact_every=3)
+        repository.save_order(self.make_order(1))
+        repository.save_order(self.make_order(1))
+        repository.save_order(self.make_order(2))
+        # Waits for the background compaction
+        repository.close()
+
+        lines = (tmp_path / "AAPL.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert [o.id for o in repository.load_orders("AAPL")] == [1, 2]
+
+    def test_compacts_only_when_needed(self, tmp_path, monkeypatch):
+        """Test a log already in id order without duplicates is not rewritten."""
+        repository = OrderRepository(orders_dir=str(tmp_path), compact_every=2)
+        compacted = []
+        monkeypatch.setattr(repository, "compact", compacted.append)
+        repository.save_orders([self.make_order(1), self.make_order(2)])
+        repository.save_orders([self.make_order(4, symbol="MSFT")])
+        repository.save_orders([self.make_order(3, symbol="MSFT")])
+        repository.close()
+
+        assert compacted == ["MSFT"]
+
+    def test_appends_during_compaction_are_kept(self, tmp_path, monkeypatch):
+        """Test orders appended while compaction rewrites the log survive it."""
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        other = OrderRepository(orders_dir=str(tmp_path))
+        repository.save_orders([self.make_order(2), self.make_order(1)])
+        tmp_file = repository._tmp_file
+
+        def append_first(file_path):
+            if file_path.endswith(".jsonl"):
+                # Would deadlock if compaction held the symbol lock here
+                other.save_order(self.make_order(3))
+            return tmp_file(file_path)
+
+        monkeypatch.setattr(repository, "_tmp_file", append_first)
+        assert repository.compact("AAPL") == 2
+        other.save_order(self.make_order(4))
+
+        lines = (tmp_path / "AAPL.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4]
+        assert [o.id for o in repository.query_orders("AAPL")] == [1, 2, 3, 4]
+        assert not list(tmp_path.glob("*.tmp"))
+        repository.close()
+        other.close()
+
+    def test_compaction_keeps_legacy_orders_sharing_an_id(self, tmp_path):
+        """Test distinct orders with the same millisecond id survive compaction."""
+        legacy = [
+            self.make_order(1640995200123).model_dump(),
+            {**self.make_order(1640995200123).model_dump(), "side": "SELL"},
+        ]
+        (tmp_path / "AAPL.json").write_text(json.dumps(legacy))
+        repository = OrderRepository(orders_dir=str(tmp_path))
+
+        assert repository.compact("AAPL") == 2
+        orders = repository.load_orders("AAPL")
+        assert [(o.id, o.side) for o in orders] == [
+            (1640995200123, "BUY"),
+            (1640995200123, "SELL"),
+        ]
+        repository.close()
+
+    @pytest.mark.asyncio
+    async def test_async_save_and_load(self, repository):
+        """Test the async API persists through the writer thread."""
+        orders = [self.make_order(i) for i in range(1, 6)]
+
+        await asyncio.gather(*(repository.save_order_async(o) for o in orders))
+
+        loaded = await repository.load_orders_async("AAPL")
+        assert sorted(o.id for o in loaded) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_async_save_runs_off_event_loop(self, repository, monkeypatch):
+        """Test disk writes happen on the writer thread, not the loop thread."""
+        threads = []
+        save_orders = repository.save_orders
+
+        def recording_save(orders):
+            threads.append(threading.current_thread().name)
+            save_orders(orders)
+
+        repository._writer._write_batch = recording_save
+        await repository.save_order_async(self.make_order(1))
+
+        assert threads == ["order-writer"]
+
+    def test_close_drains_pending_writes(self, tmp_path):
+        """Test close writes everything that was queued before returning."""
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        futures = [repository._writer.submit(self.make_order(i)) for i in range(50)]
+
+        repository.close()
+
+        assert all(f.done() for f in futures)
+        assert len((tmp_path / "AAPL.jsonl").read_text().splitlines()) == 50
+
+    @pytest.mark.parametrize(
+        "mode, expected_syncs", [("always", 4), ("batch", 2), ("never", 0)]
+    )
+    def test_fsync_modes(self, tmp_path, monkeypatch, mode, expected_syncs):
+        """Test the number of fsyncs per batch for each durability mode."""
+        repository = OrderRepository(orders_dir=str(tmp_path), fsync=mode)
+        syncs = []
+        monkeypatch.setattr("app.repositories.order_repository.os.fsync", syncs.append)
+
+        repository.save_orders(
+            [
+                self.make_order(1),
+                self.make_order(2),
+                self.make_order(3, symbol="MSFT"),
+                self.make_order(4),
+            ]
+        )
+
+        assert len(syncs) == expected_syncs
+        assert len(repository.load_orders("AAPL")) == 3
+        monkeypatch.undo()
+        repository.close()
+
+    def test_failed_symbol_is_rolled_back(self, tmp_path, monkeypatch):
+        """Test a sync failure fails and removes only that symbol's orders."""
+        repository = OrderRepository(orders_dir=str(tmp_path), fsync="batch")
+        repository.save_order(self.make_order(1, symbol="MSFT"))
+        real_fsync = os.fsync
+        calls = []
+
+        def fsync(fd):
+            calls.append(fd)
+            if len(calls) == 2:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            real_fsync(fd)
+
+        monkeypatch.setattr("app.repositories.order_repository.os.fsync", fsync)
+        with pytest.raises(PartialWriteError) as excinfo:
+            repository.save_orders(
+                [self.make_order(2), self.make_order(3, symbol="MSFT")]
+            )
+        monkeypatch.undo()
+
+        assert list(excinfo.value.errors) == [1]
+        assert [o.id for o in repository.load_orders("AAPL")] == [2]
+        assert [o.id for o in repository.load_orders("MSFT")] == [1]
+        repository.save_order(self.make_order(4, symbol="MSFT"))
+        assert [o.id for o in repository.query_orders("MSFT")] == [1, 4]
+        repository.close()
+
+    def test_compaction_failure_keeps_orders_saved(self, tmp_path, monkeypatch):
+        """Test a failed compaction does not fail the orders that triggered it."""
+        repository = OrderRepository(orders_dir=str(tmp_path), compact_every=2)
+        calls = []
+
+        def fail(symbol):
+            calls.append(symbol)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(repository, "compact", fail)
+        repository.save_order(self.make_order(2))
+        repository.save_order(self.make_order(1))
+        repository.close()
+
+        assert calls == ["AAPL"]
+        assert [o.id for o in repository.load_orders("AAPL")] == [1, 2]
+
+    def test_invalid_fsync_mode(self, tmp_path):
+        """Test an unknown durability mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid fsync mode"):
+            OrderRepository(orders_dir=str(tmp_path), fsync="sometimes")
+
+    @pytest.mark.asyncio
+    async def test_group_commit_batches_concurrent_orders(self, tmp_path):
+        """Test orders arriving together are committed in a single batch."""
+        repository = OrderRepository(
+            orders_dir=str(tmp_path), fsync="batch", batch_window=0.05
+        )
+        batches = []
+        save_orders = repository.save_orders
+
+        def recording_save(orders):
+            batches.append(len(orders))
+            save_orders(orders)
+
+        repository._writer._write_batch = recording_save
+        await asyncio.gather(
+            *(repository.save_order_async(self.make_order(i)) for i in range(20))
+        )
+
+        assert sum(batches) == 20
+        assert len(batches) < 20
+        repository.close()
+
+    def test_query_pages_with_cursor(self, repository):
+        """Test limit and after_id page through orders in log order."""
+        for i in range(1, 11):
+            repository.save_order(self.make_order(i))
+
+        page = repository.query_orders("AAPL", limit=4)
+        assert [o.id for o in page] == [1, 2, 3, 4]
+        page = repository.query_orders("AAPL", limit=4, after_id=page[-1].id)
+        assert [o.id for o in page] == [5, 6, 7, 8]
+        page = repository.query_orders("AAPL", limit=4, after_id=page[-1].id)
+        assert [o.id for o in page] == [9, 10]
+
+    def test_query_newest_first(self, repository):
+        """Test descending queries page backwards with before_id."""
+        for i in range(1, 6):
+            repository.save_order(self.make_order(i))
+
+        page = repository.query_orders("AAPL", limit=2, descending=True)
+        assert [o.id for o in page] == [5, 4]
+        page = repository.query_orders(
+            "AAPL", limit=2, before_id=page[-1].id, descending=True
+        )
+        assert [o.id for o in page] == [3, 2]
+
+    def test_query_time_range_and_side(self, repository):
+        """Test since/until bound timestamps inclusively and side filters."""
+        for i in range(1, 11):
+            repository.save_order(self.make_order(i, side="BUY" if i % 2 else "SELL"))
+
+        orders = repository.query_orders(
+            "AAPL", since=1640995200 + 3, until=1640995200 + 8
+        )
+        assert [o.id for o in orders] == [3, 4, 5, 6, 7, 8]
+        orders = repository.query_orders("AAPL", side="SELL", limit=3)
+        assert [o.id for o in orders] == [2, 4, 6]
+        assert repository.query_orders("MSFT", limit=3) == []
+
+    def test_query_reads_only_the_page(self, repository, monkeypatch):
+        """Test a page is read through the index without parsing the log."""
+        for i in range(1, 101):
+            repository.save_order(self.make_order(i))
+        monkeypatch.setattr(
+            repository, "_read_log", lambda symbol: pytest.fail("full scan")
+        )
+
+        assert [o.id for o in repository.query_orders("AAPL", after_id=97)] == [
+            98,
+            99,
+            100,
+        ]
+
+    def test_query_across_symbols(self, repository):
+        """Test a query without a symbol merges every log by id."""
+        for i in range(1, 7):
+            repository.save_order(self.make_order(i, "AAPL" if i < 4 else "MSFT"))
+
+        orders = repository.query_orders(None, after_id=2, limit=3)
+        assert [o.id for o in orders] == [3, 4, 5]
+        orders = repository.query_orders(None, limit=2, descending=True)
+        assert [o.id for o in orders] == [6, 5]
+
+    def test_stale_index_is_rebuilt(self, repository, tmp_path):
+        """Test a missing or truncated index is rebuilt from the log."""
+        for i in range(1, 6):
+            repository.save_order(self.make_order(i))
+        repository.close()
+        index = tmp_path / "AAPL.idx"
+        index.write_bytes(index.read_bytes()[:-40])
+
+        reopened = OrderRepository(orders_dir=str(tmp_path))
+        assert [o.id for o in reopened.query_orders("AAPL", after_id=2)] == [3, 4, 5]
+        reopened.close()
+
+        index.unlink()
+        reopened = OrderRepository(orders_dir=str(tmp_path))
+        reopened.save_order(self.make_order(6))
+        assert [o.id for o in reopened.query_orders("AAPL", after_id=4)] == [5, 6]
+        reopened.close()
+
+    def test_index_follows_compaction(self, tmp_path):
+        """Test queries stay correct after compaction rewrites the log."""
+        repository = OrderRepository(orders_dir=str(tmp_path), compact_every=4)
+        for i in [1, 1, 2, 3, 4, 5]:
+            repository.save_order(self.make_order(i))
+
+        assert [o.id for o in repository.query_orders("AAPL", after_id=1)] == [
+            2,
+            3,
+            4,
+            5,
+        ]
+        repository.close()
+
+    def test_iter_orders_is_lazy(self, repository, tmp_path):
+        """Test iter_orders streams records and skips corrupt lines."""
+        repository.save_order(self.make_order(1))
+        repository.save_order(self.make_order(2, symbol="MSFT"))
+        repository.close()
+        with open(tmp_path / "AAPL.jsonl", "a") as f:
+            f.write("not json\n")
+            f.write(self.make_order(3).model_dump_json() + "\n")
+
+        orders = repository.iter_orders("AAPL")
+        assert next(orders).id == 1
+        assert [o.id for o in orders] == [3]
+        assert list(repository.iter_orders("TSLA")) == []
+        assert repository.stored_symbols() == ["AAPL", "MSFT"]
+
+    def test_reads_are_served_from_cache(self, repository, monkeypatch):
+        """Test repeated reads of a book do not touch the log again."""
+        for i in range(1, 6):
+            repository.save_order(self.make_order(i))
+        assert len(repository.load_orders("AAPL")) == 5
+        repository.query_orders("AAPL", limit=2, descending=True)
+        monkeypatch.setattr(repository, "_read_log", lambda s: pytest.fail("read"))
+        monkeypatch.setattr(repository, "_query_index", lambda *a, **k: pytest.fail())
+
+        repository.save_order(self.make_order(6))
+
+        assert [o.id for o in repository.load_orders("AAPL")] == [1, 2, 3, 4, 5, 6]
+        page = repository.query_orders("AAPL", limit=2, descending=True)
+        assert [o.id for o in page] == [6, 5]
+
+    def test_cache_sees_other_writers(self, tmp_path):
+        """Test a cached book is reloaded after another process appends."""
+        first = OrderRepository(orders_dir=str(tmp_path))
+        second = OrderRepository(orders_dir=str(tmp_path))
+        first.save_order(self.make_order(1))
+        assert [o.id for o in first.load_orders("AAPL")] == [1]
+
+        second.save_order(self.make_order(2))
+
+        assert [o.id for o in first.load_orders("AAPL")] == [1, 2]
+        page = first.query_orders("AAPL", limit=1, descending=True)
+        assert [o.id for o in page] == [2]
+        first.close()
+        second.close()
+
+    def test_two_writers_share_a_log(self, tmp_path):
+        """Test repositories on one directory see and index each other's appends."""
+        first = OrderRepository(orders_dir=str(tmp_path))
+        second = OrderRepository(orders_dir=str(tmp_path))
+
+        first.save_order(self.make_order(1))
+        second.save_order(self.make_order(2))
+        first.save_order(self.make_order(3))
+        second.save_order(self.make_order(4))
+
+        for repo in (first, second):
+            assert [o.id for o in repo.load_orders("AAPL")] == [1, 2, 3, 4]
+            assert [o.id for o in repo.query_orders("AAPL", after_id=1)] == [2, 3, 4]
+        first.close()
+        second.close()
+
+    def test_interleaved_ids_from_two_writers(self, tmp_path):
+        """Test paging stays in id order when writers append ids out of order."""
+        first = OrderRepository(orders_dir=str(tmp_path), compact_every=1000)
+        second = OrderRepository(orders_dir=str(tmp_path), compact_every=1000)
+        for repo, order_id in [(first, 10), (second, 30), (first, 20), (second, 40)]:
+            repo.save_order(self.make_order(order_id))
+
+        page = first.query_orders("AAPL", limit=2)
+        assert [o.id for o in page] == [10, 20]
+        page = first.query_orders("AAPL", limit=2, after_id=page[-1].id)
+        assert [o.id for o in page] == [30, 40]
+        page = first.query_orders("AAPL", limit=3, before_id=40, descending=True)
+        assert [o.id for o in page] == [30, 20, 10]
+        orders = first.query_orders("AAPL", since=1640995200 + 15, until=1640995235)
+        assert [o.id for o in orders] == [20, 30]
+        assert [o.id for o in first.load_orders("AAPL")] == [10, 20, 30, 40]
+        assert [o.id for o in first.iter_orders("AAPL")] == [10, 20, 30, 40]
+
+        first.compact("AAPL")
+        lines = (tmp_path / "AAPL.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [10, 20, 30, 40]
+        page = second.query_orders("AAPL", limit=2, after_id=20)
+        assert [o.id for o in page] == [30, 40]
+        first.close()
+        second.close()
+
+    def test_append_after_foreign_compaction(self, tmp_path):
+        """Test a writer reopens a log another process compacted away."""
+        first = OrderRepository(orders_dir=str(tmp_path))
+        second = OrderRepository(orders_dir=str(tmp_path))
+        first.save_order(self.make_order(1))
+        second.save_order(self.make_order(1))
+
+        second.compact("AAPL")
+        first.save_order(self.make_order(2))
+
+        assert [o.id for o in second.load_orders("AAPL")] == [1, 2]
+        assert [o.id for o in second.query_orders("AAPL", limit=5)] == [1, 2]
+        first.close()
+        second.close()
+
+    @pytest.mark.skipif(fcntl is None, reason="needs flock")
+    def test_held_symbol_lock_does_not_block_other_symbols(self, tmp_path):
+        """Test a symbol locked by another process leaves other symbols writable."""
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        foreign = os.open(str(tmp_path / "AAPL.lock"), os.O_RDWR | os.O_CREAT)
+        fcntl.flock(foreign, fcntl.LOCK_EX)
+        blocked = threading.Thread(
+            target=repository.save_order, args=(self.make_order(1),)
+        )
+        blocked.start()
+        try:
+            repository.save_order(self.make_order(2, symbol="MSFT"))
+            assert blocked.is_alive()
+        finally:
+            fcntl.flock(foreign, fcntl.LOCK_UN)
+            os.close(foreign)
+        blocked.join(timeout=5)
+        repository.close()
+
+        assert [o.id for o in repository.load_orders("AAPL")] == [1]
+        assert [o.id for o in repository.load_orders("MSFT")] == [2]
+
+    def test_concurrent_processes_lose_no_writes(self, tmp_path):
+        """Test worker processes appending and compacting keep every order."""
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_append_orders, args=(str(tmp_path), start))
+            for start in (0, 1000, 2000)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            assert process.exitcode == 0
+
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        ids = [o.id for o in repository.load_orders("AAPL")]
+        assert sorted(ids) == sorted(
+            i for start in (0, 1000, 2000) for i in range(start, start + 150)
+        )
+        indexed = repository.query_orders("AAPL", limit=1000)
+        assert [o.id for o in indexed] == ids
+        repository.close()
+
+    def test_recover_repairs_interrupted_writes(self, tmp_path):
+        """Test the startup scan removes temp files and fixes torn logs."""
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        for i in range(1, 4):
+            repository.save_order(self.make_order(i))
+        repository.close()
+        (tmp_path / "AAPL.jsonl.tmp").write_text("partial rewrite")
+        with open(tmp_path / "AAPL.jsonl", "a") as f:
+            f.write('{"id": 4, "symbol": "AA')
+        (tmp_path / "AAPL.idx").write_bytes(b"junk")
+
+        recovered = OrderRepository(orders_dir=str(tmp_path))
+        sizes = recovered.recover()
+
+        log = (tmp_path / "AAPL.jsonl").read_bytes()
+        assert sizes == {"AAPL": len(log)}
+        assert log.endswith(b"\n")
+        assert not (tmp_path / "AAPL.jsonl.tmp").exists()
+        assert [o.id for o in recovered.query_orders("AAPL", after_id=1)] == [2, 3]
+        recovered.close()
+
+    def test_recover_handles_dotted_symbols(self, tmp_path):
+        """Test interrupted rewrites of a symbol like BRK.B are found and removed."""
+        repository = OrderRepository(orders_dir=str(tmp_path))
+        repository.save_order(self.make_order(1, symbol="BRK.B"))
+        repository.close()
+        (tmp_path / "BRK.B.jsonl.tmp").write_text("partial rewrite")
+        (tmp_path / "BRK.B.idx.k2x9_a.tmp").write_text("partial rewrite")
+
+        recovered = OrderRepository(orders_dir=str(tmp_path))
+        sizes = recovered.recover()
+
+        assert list(sizes) == ["BRK.B"]
+        assert not (tmp_path / "BRK.B.jsonl.tmp").exists()
+        assert not (tmp_path / "BRK.B.idx.k2x9_a.tmp").exists()
+        assert not (tmp_path / "BRK.lock").exists()
+        assert [o.id for o in recovered.load_orders("BRK.B")] == [1]
+        recovered.close()
+
+
+class TestOrderWriter:
+    """Test cases for the OrderWriter thread."""
+
+    def test_write_errors_reach_the_future(self):
+        """Test an exception raised while writing is set on the caller's future."""
+
+        def failing_write(order):
+            raise OSError("disk full")
+
+        writer = OrderWriter(failing_write)
+        future = writer.submit(object())
+
+        with pytest.raises(OSError, match="disk full"):
+            future.result(timeout=1)
+        writer.close()
+
+    def test_submit_after_close_fails(self):
+        """Test a closed writer rejects new orders."""
+        writer = OrderWriter(lambda order: None)
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.submit(object())
+
+    def test_batches_are_capped(self):
+        """Test no batch exceeds max_batch orders."""
+        batches = []
+        writer = OrderWriter(
+            lambda orders: batches.append(len(orders)), window=0.05, max_batch=3
+        )
+        futures = [writer.submit(i) for i in range(10)]
+
+        for future in futures:
+            future.result(timeout=1)
+        writer.close()
+
+        assert sum(batches) == 10
+        assert max(batches) <= 3
+
+    def test_partial_failure_fails_only_its_callers(self):
+        """Test a PartialWriteError fails only the orders it names."""
+        release = threading.Event()
+
+        def partial_write(orders):
+            release.wait(1)
+            raise PartialWriteError({1: OSError("disk full")})
+
+        writer = OrderWriter(partial_write, window=0.05, max_batch=10)
+        futures = [writer.submit(i) for i in range(3)]
+        release.set()
+
+        assert futures[0].result(timeout=1) == 0
+        with pytest.raises(OSError, match="disk full"):
+            futures[1].result(timeout=1)
+        assert futures[2].result(timeout=1) == 2
+        writer.close()
+
+    def test_failed_batch_fails_every_caller(self):
+        """Test a write error is reported to every order in the batch."""
+        release = threading.Event()
+
+        def blocking_write(orders):
+            release.wait(1)
+            raise OSError("disk full")
+
+        writer = OrderWriter(blocking_write, window=0.05, max_batch=10)
+        futures = [writer.submit(i) for i in range(3)]
+        release.set()
+
+        for future in futures:
+            with pytest.raises(OSError):
+                future.result(timeout=1)
+        writer.close()
+
+
+def _append_orders(orders_dir, start):
+    repository = OrderRepository(orders_dir=orders_dir, compact_every=40)
+    for i in range(start, start + 150):
+        repository.save_order(
+            OrderResponse(
+                id=i, symbol="AAPL", side="BUY", quantity=1, price=155.0, timestamp=i
+            )
+        )
+    repository.close()
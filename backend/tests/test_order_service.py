@@ -7,6 +7,7 @@ from app.models.order import OrderCreateRequest, OrderResponse
 from app.models.symbol import Symbol
 from app.repositories.order_repository import OrderRepository
 from app.services.order_service import OrderService
+from app.utils.id_generator import SnowflakeIdGenerator
 
 
 class TestOrderService:
@@ -69,7 +70,7 @@ class TestOrderService:
         assert result.side == "BUY"
         assert result.quantity == 10
         assert result.price == 155.0
-        assert result.id == 1640995200000  # time * 1000
+        assert SnowflakeIdGenerator.timestamp_ms(result.id) == 1640995200000
         assert result.timestamp == 1640995200
 
     def test_validate_order_invalid_symbol(self, order_service):
@@ -154,12 +155,29 @@ class TestOrderService:
         assert result.side == "BUY"
         assert result.quantity == 10
         assert result.price == 155.0
-        assert result.id == 1640995200000
+        assert SnowflakeIdGenerator.timestamp_ms(result.id) == 1640995200000
         assert result.timestamp == 1640995200
 
         # Verify repository was called
         order_service.repository.save_order.assert_called_once_with(result)
 
+    def test_create_order_publishes_after_save(
+        self, mock_repository, sample_symbols, valid_order_request
+    ):
+        """Test committed orders are pushed to the broadcaster, failed ones are not."""
+        broadcaster = Mock()
+        service = OrderService(
+            mock_repository, symbols=sample_symbols, broadcaster=broadcaster
+        )
+
+        result = service.create_order(valid_order_request)
+        broadcaster.publish_order.assert_called_once_with(result)
+
+        mock_repository.save_order.side_effect = Exception("Database error")
+        with pytest.raises(Exception):
+            service.create_order(valid_order_request)
+        assert broadcaster.publish_order.call_count == 1
+
     def test_create_order_repository_error(self, order_service, valid_order_request):
         """Test order creation fails when repository raises an exception."""
         order_service.repository.save_order.side_effect = Exception("Database error")
@@ -246,6 +264,17 @@ class TestOrderService:
 
         assert str(exc_info.value) == "File read error"
 
+    def test_query_orders_passes_filters(self, order_service):
+        """Test paged queries are validated and forwarded to the repository."""
+        order_service.repository.query_orders.return_value = []
+
+        assert order_service.query_orders("AAPL", limit=10, after_id=5) == []
+        order_service.repository.query_orders.assert_called_once_with(
+            "AAPL", limit=10, after_id=5
+        )
+        with pytest.raises(HTTPException):
+            order_service.query_orders("INVALID", limit=10)
+
     def test_different_symbols_price_ranges(self, order_service):
         """Test price validation works correctly for different symbols."""
         # GOOGL has close_price of 2800.0, so range is 2240.0 - 3360.0
@@ -292,13 +321,40 @@ class TestOrderService:
         assert sell_result.quantity == 5
 
     def test_order_id_uniqueness(self, order_service, valid_order_request):
-        """Test that order IDs are unique based on timestamp."""
-        with patch(
-            "time.time", side_effect=[1640995200, 1640995200, 1640995201, 1640995201]
-        ):
+        """Test that orders created in the same millisecond get distinct ids."""
+        with patch("time.time", return_value=1640995200):
             result1 = order_service._validate_order(valid_order_request)
             result2 = order_service._validate_order(valid_order_request)
 
-        assert result1.id == 1640995200000
-        assert result2.id == 1640995201000
         assert result1.id != result2.id
+        assert result2.id > result1.id
+        assert SnowflakeIdGenerator.timestamp_ms(result1.id) == 1640995200000
+
+    def test_symbols_follow_symbol_service(self, mock_repository, sample_symbols):
+        """Test a service built with a SymbolService validates against its snapshot."""
+        symbol_service = Mock()
+        symbol_service.get_symbol_map.return_value = {"AAPL": sample_symbols[0]}
+        service = OrderService(mock_repository, symbol_service=symbol_service)
+
+        assert list(service.symbols) == ["AAPL"]
+
+        symbol_service.get_symbol_map.return_value = {"MSFT": sample_symbols[2]}
+        request = OrderCreateRequest(symbol="MSFT", side="BUY", quantity=1, price=300.0)
+        assert service._validate_order(request).symbol == "MSFT"
+
+    @pytest.mark.asyncio
+    async def test_create_order_async(self, order_service, valid_order_request):
+        """Test async order creation awaits the repository's async save."""
+        result = await order_service.create_order_async(valid_order_request)
+
+        assert result.symbol == "AAPL"
+        order_service.repository.save_order_async.assert_awaited_once_with(result)
+        order_service.repository.save_order.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_orders_async_invalid_symbol(self, order_service):
+        """Test async listing validates the symbol before touching storage."""
+        with pytest.raises(HTTPException):
+            await order_service.list_orders_async("INVALID")
+
+        order_service.repository.load_orders_async.assert_not_called()
@@ -0,0 +1,42 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import create_app
+
+
+class TestBarRoutes:
+    """Test cases for the /api/bars endpoint."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Create a test client; the tick clock starts with the app."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        with TestClient(create_app()) as client:
+            yield client
+
+    def test_bars_built_without_subscribers(self, client):
+        """Test bars are aggregated even when nobody streams ticks."""
+        for _ in range(100):
+            response = client.get(
+                "/api/bars", params={"symbol": "AAPL", "interval": "1s"}
+            )
+            if response.json():
+                break
+            time.sleep(0.01)
+
+        assert response.status_code == 200
+        bar = response.json()[-1]
+        assert bar["symbol"] == "AAPL"
+        assert bar["low"] <= bar["open"] <= bar["high"]
+        assert bar["volume"] > 0
+
+    def test_invalid_symbol_and_interval(self, client):
+        """Test unknown symbols and intervals are rejected with 400."""
+        response = client.get("/api/bars", params={"symbol": "NOPE"})
+        assert response.status_code == 400
+        response = client.get("/api/bars", params={"symbol": "AAPL", "interval": "2h"})
+        assert response.status_code == 400
+        assert "Invalid interval" in response.json()["error"]
@@ -0,0 +1,175 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import create_app
+
+
+class TestOrderRoutes:
+    """Test cases for the order REST endpoints."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Create a test client storing orders in a temporary directory."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        with TestClient(create_app()) as client:
+            yield client
+
+    def test_create_and_list_orders(self, client):
+        """Test an order created over REST is returned by the list endpoint."""
+        response = client.post(
+            "/api/orders",
+            json={"symbol": "AAPL", "side": "BUY", "quantity": 5, "price": 180.0},
+        )
+        assert response.status_code == 200
+        created = response.json()
+
+        response = client.get("/api/orders", params={"symbol": "AAPL"})
+        assert response.status_code == 200
+        assert response.json() == [created]
+
+    def test_list_orders_paginated(self, client):
+        """Test limit, cursor and side parameters page through orders."""
+        created = [
+            client.post(
+                "/api/orders",
+                json={"symbol": "AAPL", "side": side, "quantity": 1, "price": 180.0},
+            ).json()
+            for side in ["BUY", "SELL", "BUY", "SELL", "BUY"]
+        ]
+
+        response = client.get("/api/orders", params={"symbol": "AAPL", "limit": 2})
+        assert response.json() == created[:2]
+        response = client.get(
+            "/api/orders",
+            params={"symbol": "AAPL", "limit": 2, "after_id": created[1]["id"]},
+        )
+        assert response.json() == created[2:4]
+        response = client.get(
+            "/api/orders", params={"symbol": "AAPL", "side": "SELL", "order": "desc"}
+        )
+        assert response.json() == [created[3], created[1]]
+
+    def test_list_orders_rejects_bad_limit(self, client):
+        """Test page sizes outside the allowed range are rejected."""
+        response = client.get("/api/orders", params={"symbol": "AAPL", "limit": 0})
+        assert response.status_code == 422
+
+    def test_list_all_symbols_is_capped(self, client, monkeypatch):
+        """Test listing without a symbol returns at most ORDER_PAGE_MAX orders."""
+        created = self.create_orders(client, 3) + self.create_orders(
+            client, 1, "MSFT", price=300.0
+        )
+        monkeypatch.setattr(settings, "ORDER_PAGE_MAX", 2)
+
+        response = client.get("/api/orders")
+        assert response.json() == created[:2]
+        response = client.get("/api/orders", params={"after_id": created[1]["id"]})
+        assert response.json() == created[2:]
+        response = client.get("/api/orders", params={"symbol": "AAPL"})
+        assert response.json() == created[:3]
+
+    def create_orders(self, client, count, symbol="AAPL", price=180.0):
+        return [
+            client.post(
+                "/api/orders",
+                json={"symbol": symbol, "side": "BUY", "quantity": 1, "price": price},
+            ).json()
+            for _ in range(count)
+        ]
+
+    def test_export_ndjson(self, client):
+        """Test the export streams one JSON object per line."""
+        created = self.create_orders(client, 3)
+
+        response = client.get("/api/orders/export", params={"symbol": "AAPL"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "orders-AAPL.ndjson" in response.headers["content-disposition"]
+        assert [json.loads(line) for line in response.text.splitlines()] == created
+
+    def test_export_csv_gzip(self, client):
+        """Test a gzipped CSV export of every stored symbol."""
+        created = self.create_orders(client, 2) + self.create_orders(
+            client, 1, "MSFT", 330.0
+        )
+
+        response = client.get(
+            "/api/orders/export", params={"format": "csv", "gzip": "true"}
+        )
+
+        assert response.headers["content-type"] == "application/gzip"
+        text = gzip.decompress(response.content).decode()
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert [int(row["id"]) for row in rows] == [o["id"] for o in created]
+        assert rows[-1]["symbol"] == "MSFT"
+
+    def test_export_invalid_symbol(self, client):
+        """Test exporting an unknown symbol fails before streaming starts."""
+        response = client.get("/api/orders/export", params={"symbol": "NOPE"})
+        assert response.status_code == 400
+
+    def test_sqlite_backend(self, tmp_path, monkeypatch):
+        """Test the API works unchanged on the SQLite backend."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "ORDER_BACKEND", "sqlite")
+        with TestClient(create_app()) as client:
+            created = self.create_orders(client, 2) + self.create_orders(
+                client, 1, "MSFT", 330.0
+            )
+
+            response = client.get("/api/orders", params={"order": "desc"})
+            assert response.json() == created[::-1]
+            response = client.get("/api/orders/export", params={"symbol": "AAPL"})
+            assert len(response.text.splitlines()) == 2
+        assert (tmp_path / "orders.db").exists()
+
+    def test_order_stream_pushes_new_orders(self, client):
+        """Test /ws/orders pushes each created order to its symbol's subscribers."""
+        with client.websocket_connect("/ws/orders") as ws:
+            ws.send_text(json.dumps({"action": "subscribe", "symbols": ["MSFT"]}))
+            ack = json.loads(ws.receive_text())
+            assert ack == {"type": "subscriptions", "symbols": ["MSFT"]}
+
+            self.create_orders(client, 1)
+            created = self.create_orders(client, 1, "MSFT", 330.0)
+
+            assert json.loads(ws.receive_text()) == created[0]
+
+    def test_invalid_symbol_rejected(self, client):
+        """Test orders for unknown symbols are rejected with 400."""
+        response = client.post(
+            "/api/orders",
+            json={"symbol": "NOPE", "side": "BUY", "quantity": 5, "price": 10.0},
+        )
+        assert response.status_code == 400
+        assert response.json()["error"] == "Invalid symbol"
+
+    def test_services_are_built_once(self, client):
+        """Test requests share the OrderService created in the lifespan."""
+        service = client.app.state.order_service
+        client.get("/api/orders", params={"symbol": "AAPL"})
+        client.get("/api/symbols")
+
+        assert client.app.state.order_service is service
+        assert service.repository is client.app.state.order_repository
+
+    def test_shutdown_closes_repository(self, tmp_path, monkeypatch):
+        """Test the lifespan shutdown flushes and closes order logs."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        with TestClient(create_app()) as client:
+            client.post(
+                "/api/orders",
+                json={"symbol": "AAPL", "side": "SELL", "quantity": 1, "price": 180.0},
+            )
+            repository = client.app.state.order_repository
+            assert repository._handles
+
+        assert repository._handles == {}
+        assert (tmp_path / "AAPL.jsonl").read_text().count("\n") == 1
@@ -0,0 +1,161 @@
+import json
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import create_app
+from app.utils.tick_generator import TickBatch
+from app.utils.tick_replay import TickRecorder
+
+
+class TestTickWebSocket:
+    """Test cases for the /ws/ticks subscription protocol."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Create a test client with a fast shared tick broadcaster."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        with TestClient(create_app()) as client:
+            broadcaster = client.app.state.tick_broadcaster
+            broadcaster.interval = 0.01
+            yield client
+
+    def receive_until(self, ws, predicate, limit=50):
+        for _ in range(limit):
+            data = json.loads(ws.receive_text())
+            if predicate(data):
+                return data
+        raise AssertionError("Expected message not received")
+
+    def test_subscribe_multiple_symbols(self, client):
+        """Test one connection receives ticks for every subscribed symbol."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_text(
+                json.dumps({"action": "subscribe", "symbols": ["AAPL", "MSFT"]})
+            )
+
+            ack = self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+            assert ack["symbols"] == ["AAPL", "MSFT"]
+
+            seen = set()
+            for _ in range(50):
+                data = json.loads(ws.receive_text())
+                if "price" in data:
+                    seen.add(data["symbol"])
+                if seen == {"AAPL", "MSFT"}:
+                    break
+            assert seen == {"AAPL", "MSFT"}
+
+    def test_binary_frames(self, tmp_path, monkeypatch):
+        """Test WS_BINARY_FRAMES sends ticks as bytes and control frames as text."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "WS_BINARY_FRAMES", True)
+        with TestClient(create_app()) as client:
+            client.app.state.tick_broadcaster.interval = 0.01
+            with client.websocket_connect("/ws/ticks") as ws:
+                ws.send_json({"action": "subscribe", "symbols": ["AAPL"]})
+                kinds = {}
+                for _ in range(50):
+                    message = ws.receive()
+                    frame = message.get("text") or message.get("bytes")
+                    data = json.loads(frame)
+                    kind = data.get("type", "tick")
+                    kinds[kind] = "text" if message.get("text") else "bytes"
+                    if "tick" in kinds:
+                        break
+
+        assert kinds == {"snapshot": "bytes", "subscriptions": "text", "tick": "bytes"}
+
+    def test_legacy_single_symbol_subscribe(self, client):
+        """Test the original {"symbol": ...} message still subscribes."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_text(json.dumps({"action": "subscribe", "symbol": "NVDA"}))
+
+            tick = self.receive_until(ws, lambda d: "price" in d)
+            assert tick["symbol"] == "NVDA"
+
+    def test_unknown_symbols_reported_in_bulk(self, client):
+        """Test unknown symbols are reported together without dropping valid ones."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_text(
+                json.dumps({"action": "subscribe", "symbols": ["NOPE", "AAPL", "XYZ"]})
+            )
+
+            error = self.receive_until(ws, lambda d: "error" in d)
+            assert error["unknown"] == ["NOPE", "XYZ"]
+            ack = self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+            assert ack["symbols"] == ["AAPL"]
+
+    def test_unsubscribe_while_streaming(self, client):
+        """Test unsubscribe is applied while ticks are flowing."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_text(
+                json.dumps({"action": "subscribe", "symbols": ["AAPL", "MSFT"]})
+            )
+            self.receive_until(ws, lambda d: "price" in d)
+
+            ws.send_text(json.dumps({"action": "unsubscribe", "symbols": ["AAPL"]}))
+
+            ack = self.receive_until(
+                ws,
+                lambda d: d.get("type") == "subscriptions" and d["symbols"] == ["MSFT"],
+            )
+            assert ack["symbols"] == ["MSFT"]
+            broadcaster = client.app.state.tick_broadcaster
+            assert broadcaster.subscriber_count("AAPL") == 0
+
+    def test_invalid_message(self, client):
+        """Test malformed JSON returns an error instead of closing the socket."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_text("not json")
+            assert json.loads(ws.receive_text()) == {"error": "Invalid message"}
+
+    @pytest.mark.parametrize("symbols", [5, ["AAPL", 5], {"AAPL": True}, None])
+    def test_invalid_symbols_rejected(self, client, symbols):
+        """Test a symbols field that is not a list of strings returns an error."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_json({"action": "subscribe", "symbols": symbols})
+            error = json.loads(ws.receive_text())
+            assert error["error"].startswith("Invalid message")
+
+            ws.send_json({"action": "subscribe", "symbols": ["AAPL"]})
+            ack = self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+            assert ack["symbols"] == ["AAPL"]
+
+    def test_empty_unsubscribe_is_a_no_op(self, client):
+        """Test an empty symbol list keeps subscriptions; no field clears them."""
+        with client.websocket_connect("/ws/ticks") as ws:
+            ws.send_json({"action": "subscribe", "symbols": ["AAPL", "MSFT"]})
+            self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+
+            ws.send_json({"action": "unsubscribe", "symbols": []})
+            ack = self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+            assert ack["symbols"] == ["AAPL", "MSFT"]
+
+            ws.send_json({"action": "unsubscribe"})
+            ack = self.receive_until(ws, lambda d: d.get("type") == "subscriptions")
+            assert ack["symbols"] == []
+
+    def test_replay_source_streams_recorded_ticks(self, tmp_path, monkeypatch):
+        """Test TICK_SOURCE=replay feeds recorded ticks through /ws/ticks."""
+        path = tmp_path / "ticks.bin"
+        recorder = TickRecorder(str(path))
+        for i in range(5):
+            batch = TickBatch(
+                ("AAPL", "MSFT"), np.array([150.0 + i, 300.0]), np.ones(2), 1000 + i
+            )
+            recorder.record(batch, now=float(i))
+        recorder.close()
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "TICK_SOURCE", "replay")
+        monkeypatch.setattr(settings, "TICK_REPLAY_FILE", str(path))
+        monkeypatch.setattr(settings, "TICK_REPLAY_SPEED", "max")
+
+        with TestClient(create_app()) as client:
+            with client.websocket_connect("/ws/ticks") as ws:
+                ws.send_text(json.dumps({"action": "subscribe", "symbols": ["AAPL"]}))
+                tick = self.receive_until(ws, lambda d: "price" in d)
+
+        assert tick["price"] in {150.0, 151.0, 152.0, 153.0, 154.0}
+        assert tick["timestamp"] >= 1000
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import pytest
+
+from app.config import settings
+from app.models.order import OrderResponse
+from app.repositories.order_backends import create_order_repository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.order_writer import PartialWriteError
+from app.repositories.sqlite_order_repository import SqliteOrderRepository
+from migrate_orders import migrate
+
+
+def make_order(order_id, symbol="AAPL", side="BUY"):
+    return OrderResponse(
+        id=order_id,
+        symbol=symbol,
+        side=side,
+        quantity=10,
+        price=155.0,
+        timestamp=1640995200 + order_id,
+    )
+
+
+class TestSqliteOrderRepository:
+    """Test cases for the SQLite order backend."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create a SqliteOrderRepository in a temporary directory."""
+        repo = SqliteOrderRepository(str(tmp_path / "orders.db"))
+        yield repo
+        repo.close()
+
+    def test_save_and_load_round_trip(self, repository):
+        """Test saved orders are returned per symbol in id order."""
+        orders = [make_order(i) for i in (3, 1, 2)]
+        repository.save_orders(orders + [make_order(4, symbol="MSFT")])
+
+        assert repository.load_orders("AAPL") == sorted(orders, key=lambda o: o.id)
+        assert repository.load_orders("TSLA") == []
+        assert repository.stored_symbols() == ["AAPL", "MSFT"]
+
+    def test_wal_mode_and_indexes(self, repository):
+        """Test the database uses WAL and indexes symbol/timestamp."""
+        conn = sqlite3.connect(repository.db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(orders)")}
+        assert {"orders_symbol_timestamp", "orders_symbol_id"} <= indexes
+        conn.close()
+
+    def test_duplicate_ids_are_ignored(self, repository):
+        """Test re-saving an order id does not create a second row."""
+        repository.save_order(make_order(1))
+        repository.save_order(make_order(1))
+
+        assert [o.id for o in repository.load_orders("AAPL")] == [1]
+
+    @pytest.mark.parametrize("fsync", ["always", "batch"])
+    def test_conflicting_ids_are_reported(self, tmp_path, fsync):
+        """Test a different order under a stored id is not silently dropped."""
+        repository = SqliteOrderRepository(str(tmp_path / "orders.db"), fsync)
+        repository.save_order(make_order(1))
+
+        with pytest.raises((ValueError, PartialWriteError)) as excinfo:
+            repository.save_orders([make_order(2), make_order(1, side="SELL")])
+        if fsync == "always":
+            assert list(excinfo.value.errors) == [1]
+        assert "[1]" in str(excinfo.value)
+        assert repository.insert_orders([make_order(1), make_order(3)]) == (1, [])
+        assert repository.insert_orders([make_order(3, side="SELL")]) == (0, [3])
+
+        saved = [2, 3] if fsync == "always" else [3]
+        assert [o.id for o in repository.load_orders("AAPL")] == [1] + saved
+        assert repository.load_orders("AAPL")[0].side == "BUY"
+        repository.close()
+
+    def test_query_filters(self, repository):
+        """Test cursor, time range, side and cross-symbol queries."""
+        repository.save_orders(
+            [
+                make_order(i, symbol="AAPL" if i % 2 else "MSFT", side=side)
+                for i, side in enumerate(["BUY", "SELL"] * 5, start=1)
+            ]
+        )
+
+        assert [o.id for o in repository.query_orders("AAPL", limit=2)] == [1, 3]
+        page = repository.query_orders("AAPL", limit=2, after_id=3)
+        assert [o.id for o in page] == [5, 7]
+        page = repository.query_orders(None, since=1640995204, until=1640995207)
+        assert [o.id for o in page] == [4, 5, 6, 7]
+        page = repository.query_orders(None, side="SELL", limit=3, descending=True)
+        assert [o.id for o in page] == [10, 8, 6]
+
+    def test_iter_orders_streams(self, repository):
+        """Test iter_orders yields every order of a symbol in id order."""
+        repository.save_orders([make_order(i) for i in range(1, 2501)])
+
+        assert [o.id for o in repository.iter_orders("AAPL")] == list(range(1, 2501))
+
+    def test_iter_orders_releases_connections_between_pages(self, tmp_path):
+        """Test a paused export holds no pooled connection."""
+        repository = SqliteOrderRepository(str(tmp_path / "orders.db"), pool_size=1)
+        repository.save_orders([make_order(i) for i in range(1, 1501)])
+
+        orders = repository.iter_orders("AAPL")
+        assert next(orders).id == 1
+        # Would block forever if the export still held the only connection
+        assert repository._pool.qsize() == 1
+        assert [o.id for o in repository.query_orders("AAPL", limit=1)] == [1]
+        assert sum(1 for _ in orders) == 1499
+        repository.close()
+
+    @pytest.mark.asyncio
+    async def test_async_save_and_query(self, repository):
+        """Test the async API persists through the shared writer thread."""
+        await asyncio.gather(
+            *(repository.save_order_async(make_order(i)) for i in range(1, 21))
+        )
+
+        page = await repository.query_orders_async("AAPL", limit=5, descending=True)
+        assert [o.id for o in page] == [20, 19, 18, 17, 16]
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test two repositories (as two workers would) share one database."""
+        path = str(tmp_path / "orders.db")
+        first = SqliteOrderRepository(path)
+        second = SqliteOrderRepository(path)
+
+        def write(repo, start):
+            for i in range(start, start + 200):
+                repo.save_order(make_order(i))
+
+        threads = [
+            threading.Thread(target=write, args=(first, 0)),
+            threading.Thread(target=write, args=(second, 1000)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(first.load_orders("AAPL")) == 400
+        first.close()
+        second.close()
+
+    def test_factory_selects_backend(self, tmp_path, monkeypatch):
+        """Test ORDER_BACKEND chooses the backend, built with current settings."""
+        monkeypatch.setattr(settings, "ORDERS_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "ORDER_FSYNC", "never")
+        for backend, cls in (
+            ("jsonl", OrderRepository),
+            ("sqlite", SqliteOrderRepository),
+        ):
+            repo = create_order_repository(backend)
+            assert isinstance(repo, cls)
+            assert repo.fsync == "never"
+            repo.close()
+        assert (tmp_path / "orders.db").exists()
+        with pytest.raises(ValueError, match="Unknown order backend"):
+            create_order_repository("postgres")
+
+    def test_migrate_from_files(self, tmp_path, capsys):
+        """Test the migration tool imports every file log, idempotently."""
+        files = OrderRepository(str(tmp_path))
+        files.save_orders([make_order(1), make_order(2), make_order(3, "MSFT")])
+        files.close()
+        db_path = str(tmp_path / "orders.db")
+
+        assert migrate(str(tmp_path), db_path, batch_size=2) == (3, [])
+        assert migrate(str(tmp_path), db_path, batch_size=2) == (0, [])
+        assert "AAPL: 0 of 2 orders imported, 2 already present" in (
+            capsys.readouterr().out
+        )
+
+        repository = SqliteOrderRepository(db_path)
+        assert [o.id for o in repository.query_orders(None)] == [1, 2, 3]
+        repository.close()
+
+    def test_migrate_reports_conflicting_legacy_ids(self, tmp_path, capsys):
+        """Test legacy orders sharing an id are counted, not silently dropped."""
+        legacy = [make_order(5).model_dump(), make_order(5, side="SELL").model_dump()]
+        (tmp_path / "TSLA.json").write_text(json.dumps(legacy))
+
+        total, conflicts = migrate(
+            str(tmp_path), str(tmp_path / "orders.db"), batch_size=10
+        )
+
+        assert (total, conflicts) == (1, [("TSLA", 5)])
+        assert "TSLA: 1 of 2 orders imported, 0 already present, 1 conflicting" in (
+            capsys.readouterr().out
+        )
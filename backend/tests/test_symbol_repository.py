@@ -0,0 +1,97 @@
+import json
+import os
+import pytest
+
+from app.repositories.symbol_repository import SymbolRepository
+
+
+class TestSymbolRepository:
+    """Test cases for the cached SymbolRepository."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty process-wide cache."""
+        SymbolRepository.clear_cache()
+        yield
+        SymbolRepository.clear_cache()
+
+    @pytest.fixture
+    def symbols_file(self, tmp_path):
+        """Create a symbols file with two entries."""
+        path = tmp_path / "symbols.json"
+        self.write_symbols(path, [("AAPL", 150.0), ("MSFT", 300.0)])
+        return path
+
+    def write_symbols(self, path, entries):
+        data = [
+            {"symbol": s, "name": f"{s} Inc.", "market": "NASDAQ", "closePrice": p}
+            for s, p in entries
+        ]
+        path.write_text(json.dumps(data))
+
+    def test_load_symbols_maps_fields(self, symbols_file):
+        """Test camelCase JSON keys are mapped onto the Symbol model."""
+        symbols = SymbolRepository(str(symbols_file)).load_symbols()
+
+        assert list(symbols) == ["AAPL", "MSFT"]
+        assert symbols["AAPL"].close_price == 150.0
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing symbols file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            SymbolRepository(str(tmp_path / "missing.json")).load_symbols()
+
+    def test_snapshot_shared_across_instances(self, symbols_file):
+        """Test repositories for the same file share one snapshot."""
+        first = SymbolRepository(str(symbols_file), check_interval=60)
+        second = SymbolRepository(str(symbols_file), check_interval=60)
+
+        assert first.load_symbols() is second.load_symbols()
+        assert second.stats()["reloads"] == 1
+        assert second.stats()["hits"] == 1
+
+    def test_snapshot_is_read_only(self, symbols_file):
+        """Test the returned mapping cannot be modified by callers."""
+        symbols = SymbolRepository(str(symbols_file)).load_symbols()
+
+        with pytest.raises(TypeError):
+            symbols["NVDA"] = symbols["AAPL"]
+
+    def test_no_reload_when_file_unchanged(self, symbols_file):
+        """Test an unchanged file is not re-parsed after the check interval."""
+        repo = SymbolRepository(str(symbols_file), check_interval=0)
+        first = repo.load_symbols()
+        second = repo.load_symbols()
+
+        assert first is second
+        assert repo.stats()["reloads"] == 1
+
+    def test_reload_when_file_changes(self, symbols_file):
+        """Test a modified file is picked up and the snapshot swapped."""
+        repo = SymbolRepository(str(symbols_file), check_interval=0)
+        first = repo.load_symbols()
+
+        self.write_symbols(symbols_file, [("NVDA", 450.0)])
+        stat = os.stat(symbols_file)
+        os.utime(symbols_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = repo.load_symbols()
+
+        assert list(first) == ["AAPL", "MSFT"]
+        assert list(second) == ["NVDA"]
+        assert repo.stats()["version"] == 2
+
+    def test_invalid_reload_keeps_previous_snapshot(self, symbols_file):
+        """Test a broken file after startup keeps serving the last good snapshot."""
+        repo = SymbolRepository(str(symbols_file), check_interval=0)
+        first = repo.load_symbols()
+
+        symbols_file.write_text("{not json")
+        assert repo.load_symbols() is first
+
+    def test_check_interval_skips_stat(self, symbols_file):
+        """Test no file access happens within the check interval."""
+        repo = SymbolRepository(str(symbols_file), check_interval=60)
+        repo.load_symbols()
+        os.remove(symbols_file)
+
+        assert list(repo.load_symbols()) == ["AAPL", "MSFT"]
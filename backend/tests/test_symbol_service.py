@@ -187,3 +187,14 @@ class TestSymbolService:
         assert result[0].name == "Apple Inc."
         assert result[0].market == "NASDAQ"
         assert result[0].close_price == 150.0
+
+    def test_get_symbol_map_returns_repository_mapping(
+        self, symbol_service, mock_repository, sample_symbols_dict
+    ):
+        """Test the symbol map is returned without copying."""
+        mock_repository.load_symbols.return_value = sample_symbols_dict
+
+        result = symbol_service.get_symbol_map()
+
+        assert result is sample_symbols_dict
+        mock_repository.load_symbols.assert_called_once()
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock
+
+from app.models.symbol import Symbol
+from app.services.broadcaster import Broadcaster, Subscriber
+from app.services.symbol_service import SymbolService
+from app.services.tick_broadcaster import TickBroadcaster
+from app.services.tick_service import TickService
+from app.utils.tick_generator import TickEngine
+
+
+class TestSubscriber:
+    """Test cases for the bounded Subscriber queue."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_when_full(self):
+        """Test a full queue drops the oldest frame and counts it."""
+        subscriber = Subscriber(maxsize=2)
+        for frame in ("a", "b", "c"):
+            subscriber.put(frame)
+
+        assert subscriber.dropped == 1
+        assert await subscriber.get() == "b"
+        assert await subscriber.get() == "c"
+        assert subscriber.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_frame(self):
+        """Test get blocks until a frame is published."""
+        subscriber = Subscriber(maxsize=2)
+        waiter = asyncio.create_task(subscriber.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        subscriber.put("tick")
+
+        assert await asyncio.wait_for(waiter, 1) == "tick"
+
+
+class TestBroadcaster:
+    """Test cases for the topic-based Broadcaster."""
+
+    def test_publish_fans_out_same_frame(self):
+        """Test one published frame object reaches every subscriber."""
+        hub = Broadcaster()
+        subscribers = [Subscriber(maxsize=10) for _ in range(3)]
+        for subscriber in subscribers:
+            hub.add(subscriber, "AAPL")
+
+        frame = '{"symbol": "AAPL"}'
+        assert hub.publish("AAPL", frame) == 3
+        assert hub.publish("MSFT", frame) == 0
+        assert all(s._frames[0] is frame for s in subscribers)
+
+    def test_encode_text_and_binary_frames(self):
+        """Test frames are compact JSON, as str or as UTF-8 bytes."""
+        tick = {"symbol": "AAPL", "price": 150.25}
+
+        text = Broadcaster(binary=False, encoder="json").encode(tick)
+        data = Broadcaster(binary=True).encode(tick)
+
+        assert text == '{"symbol":"AAPL","price":150.25}'
+        assert isinstance(data, bytes)
+        assert json.loads(data) == tick
+
+    def test_add_and_remove_report_first_and_last(self):
+        """Test add/remove report topic transitions used to start/stop producers."""
+        hub = Broadcaster()
+        first, second = Subscriber(maxsize=1), Subscriber(maxsize=1)
+
+        assert hub.add(first, "AAPL") is True
+        assert hub.add(second, "AAPL") is False
+        assert hub.remove(first, "AAPL") is False
+        assert hub.remove(second, "AAPL") is True
+        assert hub.subscriber_count("AAPL") == 0
+
+
+class TestTickBroadcaster:
+    """Test cases for the shared TickBroadcaster."""
+
+    @pytest.fixture
+    def tick_service(self):
+        """Create a TickService over a fixed symbol universe."""
+        service = TickService()
+        service.symbol_service = Mock(spec=SymbolService)
+        service.symbol_service.get_symbol_map.return_value = {
+            "AAPL": Symbol(
+                symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=150.0
+            )
+        }
+        return service
+
+    @pytest.fixture
+    def broadcaster(self, tick_service):
+        """Create a TickBroadcaster with a short tick interval."""
+        return TickBroadcaster(tick_service, interval=0.01)
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_ticks(self, broadcaster):
+        """Test all subscribers of a symbol receive identical frames."""
+        first, second = Subscriber(maxsize=10), Subscriber(maxsize=10)
+        broadcaster.subscribe(first, "AAPL")
+        broadcaster.subscribe(second, "AAPL")
+        for subscriber in (first, second):
+            snapshot = json.loads(await subscriber.get())
+            assert snapshot["type"] == "snapshot"
+
+        frame_a = await asyncio.wait_for(first.get(), 1)
+        frame_b = await asyncio.wait_for(second.get(), 1)
+
+        assert frame_a is frame_b
+        assert json.loads(frame_a)["symbol"] == "AAPL"
+        await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalid_symbol_rejected(self, broadcaster):
+        """Test subscribing to an unknown symbol raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid symbol: NOPE"):
+            broadcaster.subscribe(Subscriber(maxsize=1), "NOPE")
+        assert broadcaster._task is None
+
+    @pytest.mark.asyncio
+    async def test_clock_stops_after_last_unsubscribe(self, broadcaster):
+        """Test the clock task is cancelled when nobody is watching."""
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.subscribe(subscriber, "AAPL")
+        task = broadcaster._task
+
+        broadcaster.unsubscribe_all(subscriber)
+        await asyncio.sleep(0)
+
+        assert broadcaster._task is None
+        assert task.cancelled() or task.done()
+
+    @pytest.mark.asyncio
+    async def test_started_clock_feeds_bars_without_subscribers(self, tick_service):
+        """Test start keeps the clock running for bars after unsubscribes."""
+        bars = Mock()
+        broadcaster = TickBroadcaster(tick_service, interval=0.01, bars=bars)
+        broadcaster.start()
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.subscribe(subscriber, "AAPL")
+        broadcaster.unsubscribe_all(subscriber)
+        await asyncio.sleep(0.05)
+
+        assert broadcaster._task is not None
+        assert bars.publish_batch.call_count >= 2
+        await broadcaster.stop()
+        assert broadcaster._task is None
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_does_not_stop_the_clock(
+        self, broadcaster, tick_service, monkeypatch
+    ):
+        """Test ticks keep flowing after one batch raises."""
+        generate_batch = tick_service.generate_batch
+        calls = []
+
+        def flaky_batch(engine=None):
+            calls.append(None)
+            if len(calls) == 2:
+                raise RuntimeError("bad batch")
+            return generate_batch(engine)
+
+        monkeypatch.setattr(tick_service, "generate_batch", flaky_batch)
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.subscribe(subscriber, "AAPL")
+        await subscriber.get()
+
+        for _ in range(3):
+            tick = json.loads(await asyncio.wait_for(subscriber.get(), 1))
+            assert tick["symbol"] == "AAPL"
+        assert len(calls) >= 4
+        assert broadcaster._task is not None
+        await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_sent_before_live_ticks(self, broadcaster):
+        """Test a new subscriber first gets recent ticks, then live ones."""
+        for _ in range(3):
+            broadcaster.publish_batch()
+        recent = broadcaster.history.snapshot(0)
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.subscribe(subscriber, "AAPL")
+
+        snapshot = json.loads(await subscriber.get())
+        assert snapshot == recent
+        assert snapshot["symbol"] == "AAPL"
+        assert len(snapshot["prices"]) == len(snapshot["timestamps"]) == 3
+        tick = json.loads(await asyncio.wait_for(subscriber.get(), 1))
+        assert "price" in tick
+        await broadcaster.stop()
+
+    def test_publish_batch_only_serializes_subscribed_symbols(
+        self, broadcaster, tick_service
+    ):
+        """Test one batch publishes ticks only for symbols with subscribers."""
+        tick_service.symbol_service.get_symbol_map.return_value = {
+            code: Symbol(symbol=code, name=code, market="NASDAQ", close_price=100.0)
+            for code in ("AAPL", "MSFT", "NVDA")
+        }
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.add(subscriber, "MSFT")
+
+        assert broadcaster.publish_batch() == 1
+        assert json.loads(subscriber._frames[0])["symbol"] == "MSFT"
+
+    def test_publish_batch_drops_removed_symbol(self, broadcaster, tick_service):
+        """Test subscribers of a symbol that left the universe get an error."""
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.add(subscriber, "GONE")
+
+        assert broadcaster.publish_batch() == 0
+        assert json.loads(subscriber._frames[0]) == {"error": "Invalid symbol: GONE"}
+        assert subscriber.topics == set()
+
+    def test_publish_batch_indexes_with_the_generating_engine(
+        self, broadcaster, tick_service
+    ):
+        """Test a symbol reload mid-publish cannot mix up two engines."""
+        codes = [("AAPL", "MSFT"), ("MSFT", "AAPL")]
+        engines = [
+            TickEngine(
+                [
+                    Symbol(symbol=code, name=code, market="NASDAQ", close_price=1.0)
+                    for code in universe
+                ]
+            )
+            for universe in codes
+        ]
+        tick_service.get_engine = Mock(side_effect=engines)
+        subscriber = Subscriber(maxsize=10)
+        broadcaster.add(subscriber, "MSFT")
+
+        assert broadcaster.publish_batch() == 1
+        assert json.loads(subscriber._frames[0])["symbol"] == "MSFT"
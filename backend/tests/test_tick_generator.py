@@ -0,0 +1,160 @@
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from app.models.symbol import Symbol
+from app.utils.price_model import (
+    GeometricBrownianMotion,
+    MeanRevertingModel,
+    build_price_model,
+)
+from app.utils.tick_generator import TickBatch, TickEngine
+
+
+class TestTickEngine:
+    """Test cases for the vectorized TickEngine."""
+
+    @pytest.fixture
+    def symbols(self):
+        """Create a small symbol universe."""
+        return [
+            Symbol(
+                symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=150.0
+            ),
+            Symbol(
+                symbol="MSFT",
+                name="Microsoft Corp.",
+                market="NASDAQ",
+                close_price=300.0,
+            ),
+            Symbol(symbol="PENNY", name="Penny Stock", market="OTC", close_price=0.5),
+        ]
+
+    def test_generate_returns_columnar_batch(self, symbols):
+        """Test a batch holds one price and volume per symbol."""
+        engine = TickEngine(symbols, seed=1)
+
+        with patch("time.time", return_value=1640995200):
+            batch = engine.generate()
+
+        assert isinstance(batch, TickBatch)
+        assert len(batch) == 3
+        assert batch.symbols == ("AAPL", "MSFT", "PENNY")
+        assert batch.prices.shape == (3,)
+        assert batch.volumes.dtype == np.int64
+        assert batch.timestamp == 1640995200
+
+    def test_prices_and_volumes_in_range(self, symbols):
+        """Test prices stay positive and rounded and volumes within 1-1000."""
+        engine = TickEngine(symbols, seed=7)
+
+        for _ in range(200):
+            batch = engine.generate()
+            assert np.all(batch.prices >= 0.01)
+            assert np.all((batch.volumes >= 1) & (batch.volumes <= 1000))
+            assert np.array_equal(batch.prices, np.round(batch.prices, 2))
+
+    def test_prices_follow_model_state(self, symbols):
+        """Test batch prices are the rounded state of the price model."""
+        engine = TickEngine(symbols, seed=9)
+
+        batch = engine.generate()
+
+        assert np.array_equal(batch.prices, np.round(engine.model.prices, 2))
+        assert batch.prices is not engine.model.prices
+
+    def test_seed_is_reproducible(self, symbols):
+        """Test engines with the same seed produce identical batches."""
+        first = TickEngine(symbols, seed=42).generate()
+        second = TickEngine(symbols, seed=42).generate()
+
+        assert first.to_dicts() == second.to_dicts()
+
+    def test_buffers_are_reused(self, symbols):
+        """Test generate writes into the same preallocated arrays."""
+        engine = TickEngine(symbols, seed=3)
+
+        first = engine.generate()
+        second = engine.generate()
+
+        assert first.prices is second.prices
+        assert first.volumes is second.volumes
+
+    def test_tick_matches_api_shape(self, symbols):
+        """Test a single tick from a batch has the API dict shape."""
+        engine = TickEngine(symbols, seed=5)
+        batch = engine.generate()
+
+        tick = batch.tick(engine.index["MSFT"])
+
+        assert set(tick) == {"symbol", "price", "volume", "timestamp"}
+        assert tick["symbol"] == "MSFT"
+        assert isinstance(tick["price"], float)
+        assert isinstance(tick["volume"], int)
+        assert batch.to_dicts()[1] == tick
+
+    def test_empty_universe(self):
+        """Test an engine without symbols yields empty batches."""
+        batch = TickEngine([], seed=1).generate()
+
+        assert len(batch) == 0
+        assert batch.to_dicts() == []
+
+
+class TestPriceModel:
+    """Test cases for the stateful price models."""
+
+    @pytest.fixture
+    def base_prices(self):
+        return np.array([100.0, 250.0, 10.0])
+
+    def test_build_price_model(self, base_prices):
+        """Test models are selected by name."""
+        assert isinstance(
+            build_price_model("gbm", base_prices, 1.0), GeometricBrownianMotion
+        )
+        assert isinstance(
+            build_price_model("ou", base_prices, 1.0, reversion=10.0),
+            MeanRevertingModel,
+        )
+        with pytest.raises(ValueError):
+            build_price_model("uniform", base_prices, 1.0)
+
+    def test_gbm_drift_without_volatility(self, base_prices):
+        """Test a zero-volatility GBM grows deterministically at the drift rate."""
+        model = GeometricBrownianMotion(
+            base_prices, drift=0.5, volatility=0.0, interval=3600.0
+        )
+        rng = np.random.default_rng(0)
+
+        for _ in range(10):
+            model.step(rng)
+
+        expected = base_prices * np.exp(0.5 * model.dt * 10)
+        assert np.allclose(model.prices, expected)
+
+    def test_ou_reverts_to_close_price(self, base_prices):
+        """Test a displaced mean-reverting price is pulled back to the close."""
+        model = MeanRevertingModel(
+            base_prices, reversion=50000.0, volatility=0.0, interval=60.0
+        )
+        model.set_price(0, 150.0)
+        rng = np.random.default_rng(0)
+
+        for _ in range(50):
+            model.step(rng)
+
+        assert model.prices[0] == pytest.approx(100.0, rel=1e-3)
+
+    def test_step_one_matches_state(self, base_prices):
+        """Test advancing one symbol only changes that symbol's state."""
+        model = GeometricBrownianMotion(
+            base_prices, drift=0.0, volatility=0.4, interval=1.0
+        )
+        rng = np.random.default_rng(1)
+
+        price = model.step_one(1, rng)
+
+        assert model.prices[1] == price
+        assert model.prices[0] == 100.0
+        assert model.prices[2] == 10.0
@@ -0,0 +1,46 @@
+import numpy as np
+
+from app.utils.tick_generator import TickBatch
+from app.utils.tick_history import TickHistory
+
+
+def batch(symbols, prices, timestamp):
+    return TickBatch(
+        symbols, np.array(prices, dtype=np.float64), np.ones(len(prices)), timestamp
+    )
+
+
+class TestTickHistory:
+    """Test cases for the ring-buffered tick history."""
+
+    def test_keeps_newest_batches(self):
+        """Test memory is fixed: only the newest ``capacity`` ticks are kept."""
+        symbols = ("AAPL", "MSFT")
+        history = TickHistory(symbols, capacity=3)
+        for second in range(5):
+            history.append(batch(symbols, [1.0 + second, 2.0 + second], second))
+
+        snapshot = history.snapshot(1)
+        assert snapshot == {
+            "type": "snapshot",
+            "symbol": "MSFT",
+            "timestamps": [2, 3, 4],
+            "prices": [4.0, 5.0, 6.0],
+            "volumes": [1, 1, 1],
+        }
+        assert len(history) == 3
+        assert history.prices.shape == (3, 2)
+
+    def test_adopt_skips_ticks_before_symbol_joined(self):
+        """Test history survives a reload and new symbols start empty."""
+        old = TickHistory(("AAPL",), capacity=4)
+        for second in range(2):
+            old.append(batch(("AAPL",), [10.0 + second], second))
+
+        symbols = ("NVDA", "AAPL")
+        new = TickHistory(symbols, capacity=4)
+        new.adopt(old)
+        new.append(batch(symbols, [50.0, 12.0], 2))
+
+        assert new.snapshot(1)["prices"] == [10.0, 11.0, 12.0]
+        assert new.snapshot(0)["timestamps"] == [2]
@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.services.broadcaster import Subscriber
+from app.services.tick_broadcaster import TickBroadcaster
+from app.services.tick_service import TickService
+from app.utils.tick_generator import TickBatch
+from app.utils.tick_replay import (
+    TickRecorder,
+    TickReplay,
+    load_recording,
+    parse_speed,
+)
+
+SYMBOLS = ("AAPL", "MSFT")
+
+
+def make_batch(i, symbols=SYMBOLS):
+    return TickBatch(
+        symbols,
+        np.array([100.0 + i, 200.0 + i]),
+        np.array([i + 1, i + 2]),
+        1700000000 + i,
+    )
+
+
+def record(path, count, spacing=0.5):
+    recorder = TickRecorder(str(path))
+    for i in range(count):
+        recorder.record(make_batch(i), now=10.0 + i * spacing)
+    recorder.close()
+    return recorder
+
+
+class TestTickRecording:
+    """Test cases for recording and loading tick files."""
+
+    @pytest.mark.parametrize("name", ["ticks.bin", "ticks.ndjson"])
+    def test_round_trip(self, tmp_path, name):
+        """Test recorded batches load back unchanged in both formats."""
+        recorder = record(tmp_path / name, 3)
+        recording = load_recording(str(tmp_path / name))
+
+        assert recorder.format == ("ndjson" if name.endswith("ndjson") else "binary")
+        assert recording.symbols == SYMBOLS
+        assert recording.times.tolist() == [0.0, 0.5, 1.0]
+        assert recording.timestamps.tolist() == [1700000000, 1700000001, 1700000002]
+        assert recording.prices[2].tolist() == [102.0, 202.0]
+        assert recording.volumes[1].tolist() == [2, 3]
+
+    def test_binary_is_memory_mapped_and_ignores_torn_record(self, tmp_path):
+        """Test binary recordings are mmapped and a partial last record is skipped."""
+        path = tmp_path / "ticks.bin"
+        record(path, 3)
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 7)
+
+        recording = load_recording(str(path))
+        assert isinstance(recording.records, np.memmap)
+        assert len(recording) == 3
+
+    def test_recording_stops_when_symbols_change(self, tmp_path):
+        """Test a new symbol universe ends the recording instead of corrupting it."""
+        recorder = TickRecorder(str(tmp_path / "ticks.bin"))
+        assert recorder.record(make_batch(0), now=0.0)
+        assert not recorder.record(make_batch(1, ("AAPL", "NVDA")), now=1.0)
+        recorder.close()
+
+        assert len(load_recording(str(tmp_path / "ticks.bin"))) == 1
+
+    def test_parse_speed(self):
+        """Test speed multipliers and "max" are parsed; others are rejected."""
+        assert parse_speed("1") == 1.0
+        assert parse_speed("2.5") == 2.5
+        assert parse_speed("max") == math.inf
+        with pytest.raises(ValueError, match="Invalid replay speed"):
+            parse_speed("0")
+
+
+class TestTickReplay:
+    """Test cases for replaying recordings."""
+
+    @pytest.fixture
+    def recording(self, tmp_path):
+        record(tmp_path / "ticks.bin", 3)
+        return load_recording(str(tmp_path / "ticks.bin"))
+
+    def test_replays_batches_in_order_at_speed(self, recording):
+        """Test batches replay unchanged, paced by recorded gaps over speed."""
+        replay = TickReplay(recording, speed=2.0, loop=False)
+
+        first = replay.generate()
+        assert first.prices.tolist() == [100.0, 200.0]
+        assert first.timestamp == 1700000000
+        assert replay.next_delay() == 0.25
+        assert replay.tick(replay.index["MSFT"])["volume"] == 2
+
+    def test_loop_keeps_timestamps_increasing(self, recording):
+        """Test a looping replay shifts timestamps past the previous pass."""
+        replay = TickReplay(recording, speed=math.inf)
+        timestamps = [replay.generate().timestamp for _ in range(5)]
+
+        assert timestamps == [
+            1700000000,
+            1700000001,
+            1700000002,
+            1700000003,
+            1700000004,
+        ]
+        assert replay.next_delay() == 0.0
+
+    def test_finishes_without_loop(self, recording):
+        """Test a one-shot replay ends and keeps its last batch."""
+        replay = TickReplay(recording, loop=False)
+        for _ in range(3):
+            replay.generate()
+
+        assert replay.finished
+        assert replay.next_delay() is None
+        assert replay.generate().timestamp == 1700000002
+
+
+class TestTickServiceReplay:
+    """Test cases for TickService replay and record modes."""
+
+    def test_replay_replaces_engine(self, tmp_path):
+        """Test the service serves replayed ticks and records its batches."""
+        record(tmp_path / "in.bin", 2)
+        recorder = TickRecorder(str(tmp_path / "out.ndjson"))
+        service = TickService(
+            replay=TickReplay.open(str(tmp_path / "in.bin"), speed=math.inf),
+            recorder=recorder,
+        )
+
+        batches = [service.generate_batch().prices.tolist() for _ in range(2)]
+        service.close()
+
+        assert batches == [[100.0, 200.0], [101.0, 201.0]]
+        assert service.next_interval(1.0) == 0.0
+        assert load_recording(str(tmp_path / "out.ndjson")).prices.tolist() == batches
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_use_recorded_symbols(self, tmp_path):
+        """Test replayed streams accept the recording's symbols, not the file's."""
+        recorder = TickRecorder(str(tmp_path / "in.bin"))
+        recorder.record(
+            TickBatch(("ZZZZ",), np.array([1.0]), np.array([1]), 1700000000)
+        )
+        recorder.close()
+        service = TickService(
+            replay=TickReplay.open(str(tmp_path / "in.bin"), speed=math.inf)
+        )
+        broadcaster = TickBroadcaster(service, interval=0.01, history_size=0)
+
+        with pytest.raises(ValueError, match="Invalid symbol: AAPL"):
+            broadcaster.subscribe(Subscriber(maxsize=1), "AAPL")
+        broadcaster.subscribe(Subscriber(maxsize=1), "ZZZZ")
+        await broadcaster.stop()
@@ -61,30 +61,29 @@ class TestTickService:
         self, tick_service, mock_symbol_service, sample_symbols
     ):
         """Test successful tick generation for valid symbol."""
-        # Mock the symbol service to return our sample symbols
-        mock_symbol_service.get_all_symbols.return_value = sample_symbols
-
-        # Mock random and time for predictable results
-        with patch("random.uniform", return_value=157.5), patch(
-            "random.randint", return_value=500
-        ), patch("time.time", return_value=1640995200):
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
+        with patch("time.time", return_value=1640995200):
             result = tick_service.get_tick_for_symbol("AAPL")
 
         assert isinstance(result, dict)
         assert result["symbol"] == "AAPL"
-        assert result["price"] == 157.5
-        assert result["volume"] == 500
+        assert 120.0 <= result["price"] <= 180.0
+        assert 1 <= result["volume"] <= 1000
         assert result["timestamp"] == 1640995200
 
         # Verify symbol service was called
-        mock_symbol_service.get_all_symbols.assert_called_once()
+        mock_symbol_service.get_symbol_map.assert_called_once()
 
     def test_get_tick_for_symbol_invalid_symbol(
         self, tick_service, mock_symbol_service, sample_symbols
     ):
         """Test tick generation for invalid symbol returns error."""
-        mock_symbol_service.get_all_symbols.return_value = sample_symbols
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
         result = tick_service.get_tick_for_symbol("INVALID")
 
@@ -93,13 +92,15 @@ class TestTickService:
         assert result["error"] == "Invalid symbol: INVALID"
 
         # Verify symbol service was called
-        mock_symbol_service.get_all_symbols.assert_called_once()
+        mock_symbol_service.get_symbol_map.assert_called_once()
 
     def test_get_tick_for_symbol_case_sensitive(
         self, tick_service, mock_symbol_service, sample_symbols
     ):
         """Test that symbol matching is case sensitive."""
-        mock_symbol_service.get_all_symbols.return_value = sample_symbols
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
         result = tick_service.get_tick_for_symbol("aapl")  # lowercase
 
@@ -111,7 +112,7 @@ class TestTickService:
         self, tick_service, mock_symbol_service
     ):
         """Test tick generation when no symbols are available."""
-        mock_symbol_service.get_all_symbols.return_value = []
+        mock_symbol_service.get_symbol_map.return_value = {}
 
         result = tick_service.get_tick_for_symbol("AAPL")
 
@@ -123,7 +124,7 @@ class TestTickService:
         self, tick_service, mock_symbol_service
     ):
         """Test handling of symbol service errors."""
-        mock_symbol_service.get_all_symbols.side_effect = Exception(
+        mock_symbol_service.get_symbol_map.side_effect = Exception(
             "Symbol service error"
         )
 
@@ -132,156 +133,161 @@ class TestTickService:
 
         assert str(exc_info.value) == "Symbol service error"
 
-    def test_generate_tick_price_range(self, tick_service):
-        """Test that generated tick price is within ±5% range of base price."""
-        symbol = Symbol(
-            symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=150.0
-        )
-
-        # Test multiple random generations
-        for _ in range(100):
-            with patch("random.uniform") as mock_uniform, patch(
-                "random.randint", return_value=100
-            ), patch("time.time", return_value=1640995200):
-
-                # Mock random.uniform to return a value within our expected range
-                mock_uniform.return_value = 155.0  # Within ±5% range
-
-                result = tick_service._generate_tick(symbol)
-
-                assert result["symbol"] == "AAPL"
-                assert result["price"] == 155.0
-                assert result["volume"] == 100
-                assert result["timestamp"] == 1640995200
-
-    def test_generate_tick_price_calculation(self, tick_service):
-        """Test that price calculation uses correct base price and range."""
-        symbol = Symbol(
-            symbol="GOOGL", name="Alphabet Inc.", market="NASDAQ", close_price=2800.0
-        )
+    def test_generate_tick_price_path_is_continuous(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
+        """Test consecutive ticks follow a continuous path instead of jumping."""
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
+        symbol = sample_symbols[0]
 
-        with patch("random.uniform") as mock_uniform, patch(
-            "random.randint", return_value=200
-        ), patch("time.time", return_value=1640995200):
+        prices = [tick_service._generate_tick(symbol)["price"] for _ in range(100)]
 
-            # Mock random.uniform to verify it's called with correct range
-            mock_uniform.return_value = 2900.0
+        steps = [abs(b - a) / a for a, b in zip(prices, prices[1:])]
+        assert max(steps) < 0.01
+        assert all(p > 0 for p in prices)
 
-            result = tick_service._generate_tick(symbol)
+    def test_generate_tick_keeps_state_per_symbol(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
+        """Test each symbol's price path starts from its own close price."""
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
-            # Verify random.uniform was called with correct range (±5% of 2800)
-            expected_min = 2800.0 * 0.95  # 2660.0
-            expected_max = 2800.0 * 1.05  # 2940.0
-            mock_uniform.assert_called_once_with(expected_min, expected_max)
+        aapl = tick_service._generate_tick(sample_symbols[0])
+        googl = tick_service._generate_tick(sample_symbols[1])
 
-            assert result["price"] == 2900.0
-            assert result["volume"] == 200
+        assert aapl["price"] == pytest.approx(150.0, rel=0.01)
+        assert googl["price"] == pytest.approx(2800.0, rel=0.01)
 
-    def test_generate_tick_volume_range(self, tick_service):
+    def test_generate_tick_volume_range(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
         """Test that generated volume is within expected range (1-1000)."""
-        symbol = Symbol(
-            symbol="MSFT", name="Microsoft Corp.", market="NASDAQ", close_price=300.0
-        )
-
-        # Test multiple volume generations
-        volumes = []
-        for _ in range(50):
-            with patch("random.uniform", return_value=310.0), patch(
-                "random.randint"
-            ) as mock_randint, patch("time.time", return_value=1640995200):
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
+        symbol = sample_symbols[2]
 
-                mock_randint.return_value = 500
-                result = tick_service._generate_tick(symbol)
-                volumes.append(result["volume"])
+        volumes = [tick_service._generate_tick(symbol)["volume"] for _ in range(200)]
 
-                # Verify random.randint was called with correct range
-                mock_randint.assert_called_with(1, 1000)
+        assert all(isinstance(v, int) for v in volumes)
+        assert all(1 <= v <= 1000 for v in volumes)
 
-        # All volumes should be 500 (our mocked value)
-        assert all(v == 500 for v in volumes)
-
-    def test_generate_tick_timestamp(self, tick_service):
+    def test_generate_tick_timestamp(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
         """Test that timestamp is correctly set."""
-        symbol = Symbol(
-            symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=150.0
-        )
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
         test_timestamp = 1640995200
-        with patch("random.uniform", return_value=155.0), patch(
-            "random.randint", return_value=100
-        ), patch("time.time", return_value=test_timestamp):
-
-            result = tick_service._generate_tick(symbol)
+        with patch("time.time", return_value=test_timestamp):
+            result = tick_service._generate_tick(sample_symbols[0])
 
-            assert result["timestamp"] == test_timestamp
+        assert result["timestamp"] == test_timestamp
 
-    def test_generate_tick_rounding(self, tick_service):
+    def test_generate_tick_rounding(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
         """Test that price is rounded to 2 decimal places."""
-        symbol = Symbol(
-            symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=150.0
-        )
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
-        with patch("random.uniform", return_value=155.123456), patch(
-            "random.randint", return_value=100
-        ), patch("time.time", return_value=1640995200):
+        for _ in range(20):
+            result = tick_service._generate_tick(sample_symbols[0])
+            assert result["price"] == round(result["price"], 2)
 
-            result = tick_service._generate_tick(symbol)
-
-            assert result["price"] == 155.12  # Should be rounded to 2 decimal places
-
-    def test_generate_tick_edge_cases(self, tick_service):
+    def test_generate_tick_edge_cases(self, tick_service, mock_symbol_service):
         """Test tick generation with edge case prices."""
-        # Test with very low price
         low_symbol = Symbol(
             symbol="PENNY", name="Penny Stock", market="OTC", close_price=0.01
         )
-        with patch("random.uniform", return_value=0.0095), patch(
-            "random.randint", return_value=1
-        ), patch("time.time", return_value=1640995200):
-
-            result = tick_service._generate_tick(low_symbol)
-            assert result["price"] == 0.01  # Should be rounded to 2 decimal places
-
-        # Test with very high price
         high_symbol = Symbol(
             symbol="EXPENSIVE",
             name="Expensive Stock",
             market="NYSE",
             close_price=10000.0,
         )
-        with patch("random.uniform", return_value=10500.0), patch(
-            "random.randint", return_value=1000
-        ), patch("time.time", return_value=1640995200):
+        mock_symbol_service.get_symbol_map.return_value = {
+            "PENNY": low_symbol,
+            "EXPENSIVE": high_symbol,
+        }
+
+        for _ in range(20):
+            assert tick_service._generate_tick(low_symbol)["price"] >= 0.01
+        result = tick_service._generate_tick(high_symbol)
+        assert result["price"] == pytest.approx(10000.0, rel=0.01)
+
+    def test_generate_tick_unknown_symbol(self, tick_service, mock_symbol_service):
+        """Test generating a tick for a symbol outside the universe fails."""
+        mock_symbol_service.get_symbol_map.return_value = {}
+        symbol = Symbol(
+            symbol="AAPL", name="Apple Inc.", market="NASDAQ", close_price=1
+        )
+
+        with pytest.raises(ValueError):
+            tick_service._generate_tick(symbol)
+
+    def test_seeded_services_are_reproducible(self, sample_symbols):
+        """Test two services with the same seed produce the same ticks."""
+        services = [TickService(seed=11), TickService(seed=11)]
+        for service in services:
+            service.symbol_service = Mock(spec=SymbolService)
+            service.symbol_service.get_symbol_map.return_value = {
+                s.symbol: s for s in sample_symbols
+            }
+
+        with patch("time.time", return_value=1640995200):
+            first = [services[0].get_tick_for_symbol("MSFT") for _ in range(5)]
+            second = [services[1].get_tick_for_symbol("MSFT") for _ in range(5)]
 
-            result = tick_service._generate_tick(high_symbol)
-            assert result["price"] == 10500.0
+        assert first == second
+
+    def test_engine_rebuild_keeps_price_paths(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
+        """Test a symbols reload keeps the current price of surviving symbols."""
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
+        last = tick_service.get_tick_for_symbol("AAPL")
+        old_engine = tick_service.get_engine()
+        old_price = old_engine.model.prices[old_engine.index["AAPL"]]
+
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols[:1]
+        }
+        engine = tick_service.get_engine()
+
+        assert engine is not old_engine
+        assert engine.model.prices[engine.index["AAPL"]] == old_price
+        assert round(old_price, 2) == last["price"]
 
     def test_get_tick_for_symbol_multiple_calls(
         self, tick_service, mock_symbol_service, sample_symbols
     ):
         """Test that multiple calls work correctly and don't interfere with each other."""
-        mock_symbol_service.get_all_symbols.return_value = sample_symbols
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
 
-        with patch("random.uniform", side_effect=[155.0, 2850.0, 305.0]), patch(
-            "random.randint", side_effect=[100, 200, 300]
-        ), patch("time.time", return_value=1640995200):
+        result1 = tick_service.get_tick_for_symbol("AAPL")
+        result2 = tick_service.get_tick_for_symbol("GOOGL")
+        result3 = tick_service.get_tick_for_symbol("MSFT")
 
-            # Get ticks for different symbols
-            result1 = tick_service.get_tick_for_symbol("AAPL")
-            result2 = tick_service.get_tick_for_symbol("GOOGL")
-            result3 = tick_service.get_tick_for_symbol("MSFT")
+        assert result1["symbol"] == "AAPL"
+        assert result1["price"] == pytest.approx(150.0, rel=0.01)
 
-            assert result1["symbol"] == "AAPL"
-            assert result1["price"] == 155.0
-            assert result1["volume"] == 100
+        assert result2["symbol"] == "GOOGL"
+        assert result2["price"] == pytest.approx(2800.0, rel=0.01)
 
-            assert result2["symbol"] == "GOOGL"
-            assert result2["price"] == 2850.0
-            assert result2["volume"] == 200
-
-            assert result3["symbol"] == "MSFT"
-            assert result3["price"] == 305.0
-            assert result3["volume"] == 300
+        assert result3["symbol"] == "MSFT"
+        assert result3["price"] == pytest.approx(300.0, rel=0.01)
 
     def test_get_tick_for_symbol_symbol_not_found_after_filter(
         self, tick_service, mock_symbol_service
@@ -302,10 +308,34 @@ class TestTickService:
                 close_price=300.0,
             ),
         ]
-        mock_symbol_service.get_all_symbols.return_value = other_symbols
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in other_symbols
+        }
 
         result = tick_service.get_tick_for_symbol("AAPL")
 
         assert isinstance(result, dict)
         assert "error" in result
         assert result["error"] == "Invalid symbol: AAPL"
+
+    def test_get_ticks_for_symbols_batch(
+        self, tick_service, mock_symbol_service, sample_symbols
+    ):
+        """Test batch tick generation resolves known codes and reports unknown ones."""
+        mock_symbol_service.get_symbol_map.return_value = {
+            s.symbol: s for s in sample_symbols
+        }
+
+        result = tick_service.get_ticks_for_symbols(["AAPL", "NOPE", "MSFT", "XYZ"])
+
+        assert [t["symbol"] for t in result["ticks"]] == ["AAPL", "MSFT"]
+        assert result["unknown"] == ["NOPE", "XYZ"]
+        mock_symbol_service.get_symbol_map.assert_called_once()
+
+    def test_get_ticks_for_symbols_empty(self, tick_service, mock_symbol_service):
+        """Test batch tick generation with no codes returns empty results."""
+        mock_symbol_service.get_symbol_map.return_value = {}
+
+        result = tick_service.get_ticks_for_symbols([])
+
+        assert result == {"ticks": [], "unknown": []}
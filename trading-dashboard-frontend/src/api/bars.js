@@ -0,0 +1,25 @@
+import apiClient from './apiClient';
+import { getWsBarsUrl } from '../config/config';
+import { openSubscriptionStream } from './subscriptionStream';
+
+/**
+ * Fetch the newest OHLCV bars for a symbol, oldest first
+ * (the last bar is still being built)
+ * @param {string} symbol - e.g. "NVDA"
+ * @param {object} [params] - optional { interval, limit }
+ * @returns {Promise<Array>} List of bars
+ */
+export async function fetchBars(symbol, params = {}) {
+  const res = await apiClient.get('/bars', { params: { symbol, ...params } });
+  return res;
+}
+
+/**
+ * Opens a WebSocket that pushes bars as they close
+ * @param {function} onBar - callback with each closed bar
+ * @param {function} onError - callback on error (optional)
+ * @returns {{subscribe: function, unsubscribe: function, close: function, socket: WebSocket}}
+ */
+export function openBarStream(onBar, onError) {
+  return openSubscriptionStream(getWsBarsUrl(), onBar, onError);
+}
@@ -1,12 +1,15 @@
 import apiClient from './apiClient';
+import { getWsOrdersUrl } from '../config/config';
+import { openSubscriptionStream } from './subscriptionStream';
 
 /**
- * Fetch all orders for a given symbol
+ * Fetch orders for a given symbol
  * @param {string} symbol - e.g. "NVDA"
+ * @param {object} [params] - optional { limit, after_id, before_id, since, until, side, order }
  * @returns {Promise<Array>} List of orders
  */
-export async function fetchOrders(symbol) {
-  const res = await apiClient.get(`/orders?symbol=${symbol}`);
+export async function fetchOrders(symbol, params = {}) {
+  const res = await apiClient.get('/orders', { params: { symbol, ...params } });
   return res;
 }
 
@@ -20,3 +23,13 @@ export async function submitOrder(order) {
   const res = await apiClient.post('/orders', order);
   return res;
 }
+
+/**
+ * Opens a WebSocket that pushes orders as they are created
+ * @param {function} onOrder - callback with each new order
+ * @param {function} onError - callback on error (optional)
+ * @returns {{subscribe: function, unsubscribe: function, close: function, socket: WebSocket}}
+ */
+export function openOrderStream(onOrder, onError) {
+  return openSubscriptionStream(getWsOrdersUrl(), onOrder, onError);
+}
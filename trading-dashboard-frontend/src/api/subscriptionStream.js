@@ -0,0 +1,66 @@
+/**
+ * Opens a WebSocket speaking the server's subscription protocol
+ * ({action: 'subscribe' | 'unsubscribe', symbols: [...]}).
+ * Symbols can be added or removed at any time without reconnecting.
+ * @param {string} url - WebSocket endpoint (e.g. ws://localhost:8000/ws/ticks)
+ * @param {function} onMessage - callback for each data message
+ * @param {function} onError - callback on error (optional)
+ * @param {function} onSnapshot - callback for snapshot frames (optional)
+ * @returns {{subscribe: function, unsubscribe: function, close: function, socket: WebSocket}}
+ */
+export function openSubscriptionStream(url, onMessage, onError, onSnapshot) {
+  const ws = new WebSocket(url);
+  // Data frames may arrive as binary UTF-8 JSON (WS_BINARY_FRAMES)
+  ws.binaryType = 'arraybuffer';
+  const decoder = new TextDecoder();
+  const pending = [];
+
+  const send = message => {
+    if (ws.readyState === WebSocket.OPEN) {
+      ws.send(JSON.stringify(message));
+    } else {
+      pending.push(message);
+    }
+  };
+
+  ws.onopen = () => {
+    pending.splice(0).forEach(message => ws.send(JSON.stringify(message)));
+  };
+
+  ws.onmessage = event => {
+    try {
+      const text =
+        typeof event.data === 'string'
+          ? event.data
+          : decoder.decode(event.data);
+      const data = JSON.parse(text);
+      if (data.error) {
+        onError?.(data.error);
+      } else if (data.type === 'snapshot') {
+        onSnapshot?.(data);
+      } else if (!data.type) {
+        // Control frames (e.g. subscription acks) carry a "type" field
+        onMessage(data);
+      }
+    } catch (err) {
+      console.error('Stream parse error:', err);
+      onError?.(err);
+    }
+  };
+
+  ws.onerror = err => {
+    console.error('WebSocket error:', err);
+    onError?.(err);
+  };
+
+  ws.onclose = () => {
+    console.log('WebSocket closed');
+  };
+
+  return {
+    subscribe: symbols => send({ action: 'subscribe', symbols }),
+    unsubscribe: symbols => send({ action: 'unsubscribe', symbols }),
+    close: () => ws.close(),
+    socket: ws,
+  };
+}
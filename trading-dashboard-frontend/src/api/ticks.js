@@ -1,43 +1,32 @@
 import { getWsUrl } from '../config/config';
+import { openSubscriptionStream } from './subscriptionStream';
 
 const WS_BASE_URL = getWsUrl();
 
 /**
- * Opens a WebSocket connection to the tick server
+ * Opens a single WebSocket connection that can stream ticks for many symbols.
+ * Symbols can be added or removed at any time without reconnecting.
+ * Each subscription starts with a snapshot of the symbol's recent ticks
+ * ({symbol, timestamps: [...], prices: [...], volumes: [...]}).
+ * @param {function} onTick - callback when a tick message arrives
+ * @param {function} onError - callback on error (optional)
+ * @param {function} onSnapshot - callback with each snapshot (optional)
+ * @returns {{subscribe: function, unsubscribe: function, close: function, socket: WebSocket}}
+ */
+export function openTickStream(onTick, onError, onSnapshot) {
+  return openSubscriptionStream(WS_BASE_URL, onTick, onError, onSnapshot);
+}
+
+/**
+ * Opens a WebSocket connection to the tick server for a single symbol
  * @param {string} symbol - symbol to subscribe (e.g., AAPL)
  * @param {function} onTick - callback when a tick message arrives
  * @param {function} onError - callback on error (optional)
+ * @param {function} onSnapshot - callback with the recent ticks (optional)
  * @returns {WebSocket} the WebSocket instance
  */
-export function subscribeToTicks(symbol, onTick, onError) {
-  const ws = new WebSocket(WS_BASE_URL);
-
-  ws.onopen = () => {
-    ws.send(JSON.stringify({ action: 'subscribe', symbol }));
-  };
-
-  ws.onmessage = event => {
-    try {
-      const data = JSON.parse(event.data);
-      if (data.error) {
-        onError?.(data.error);
-      } else {
-        onTick(data);
-      }
-    } catch (err) {
-      console.error('Tick parse error:', err);
-      onError?.(err);
-    }
-  };
-
-  ws.onerror = err => {
-    console.error('WebSocket error:', err);
-    onError?.(err);
-  };
-
-  ws.onclose = () => {
-    console.log('WebSocket closed');
-  };
-
-  return ws;
+export function subscribeToTicks(symbol, onTick, onError, onSnapshot) {
+  const stream = openTickStream(onTick, onError, onSnapshot);
+  stream.subscribe([symbol]);
+  return stream.socket;
 }
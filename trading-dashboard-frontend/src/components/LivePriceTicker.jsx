@@ -2,9 +2,14 @@ import { useEffect, useState, useRef } from 'react';
 import { Box, Typography, Paper, Autocomplete, TextField } from '@mui/material';
 import { useSelector, useDispatch } from 'react-redux';
 import { subscribeToTicks } from '../api/ticks';
+import { fetchBars, openBarStream } from '../api/bars';
 import { loadSymbols } from '../store/symbolsSlice';
 import { LineChart, Line, XAxis, Tooltip, ResponsiveContainer } from 'recharts';
 
+// The sparkline plots server-aggregated bars rather than raw ticks
+const CHART_INTERVAL = '1s';
+const CHART_BARS = 100;
+
 /**
  * LivePriceTicker displays real-time tick data for a selected symbol
  * with a sparkline chart and user-friendly time axis.
@@ -16,8 +21,9 @@ export default function LivePriceTicker() {
   const [selectedSymbol, setSelectedSymbol] = useState(null);
   const [tick, setTick] = useState(null);
   const [prevPrice, setPrevPrice] = useState(null);
-  const [tickHistory, setTickHistory] = useState([]);
+  const [bars, setBars] = useState([]);
   const wsRef = useRef(null);
+  const barStreamRef = useRef(null);
 
   useEffect(() => {
     if (status === 'idle' || symbols.length === 0) {
@@ -28,6 +34,7 @@ export default function LivePriceTicker() {
   useEffect(() => {
     return () => {
       wsRef.current?.close();
+      barStreamRef.current?.close();
     };
   }, []);
 
@@ -39,16 +46,51 @@ export default function LivePriceTicker() {
         data => {
           setPrevPrice(tick?.price || null);
           setTick(data);
-          setTickHistory(prev => {
-            const updated = [...prev, data];
-            return updated.slice(-100);
-          });
         },
-        err => console.error('Tick error:', err)
+        err => console.error('Tick error:', err),
+        snapshot => {
+          // Paint the latest known tick right away instead of waiting
+          const { prices, volumes, timestamps } = snapshot;
+          const last = prices.length - 1;
+          if (last < 0) return;
+          setPrevPrice(last > 0 ? prices[last - 1] : null);
+          setTick({
+            symbol: snapshot.symbol,
+            price: prices[last],
+            volume: volumes[last],
+            timestamp: timestamps[last],
+          });
+        }
+      );
+
+      // Closed bars replace the open bar with the same start
+      const addBar = bar => {
+        if (bar.interval !== CHART_INTERVAL) return;
+        setBars(prev =>
+          [...prev.filter(b => b.start !== bar.start), bar].slice(-CHART_BARS)
+        );
+      };
+      setBars([]);
+      barStreamRef.current?.close();
+      barStreamRef.current = openBarStream(addBar, err =>
+        console.error('Bar error:', err)
       );
+      barStreamRef.current.subscribe([selectedSymbol.symbol]);
+      fetchBars(selectedSymbol.symbol, {
+        interval: CHART_INTERVAL,
+        limit: CHART_BARS,
+      })
+        .then(history =>
+          setBars(prev => {
+            // Bars pushed while the request was in flight win
+            const pushed = new Set(prev.map(b => b.start));
+            return [...history.filter(b => !pushed.has(b.start)), ...prev];
+          })
+        )
+        .catch(err => console.error('Error fetching bars:', err));
     } else {
       setTick(null);
-      setTickHistory([]);
+      setBars([]);
     }
   }, [selectedSymbol]);
 
@@ -137,9 +179,9 @@ export default function LivePriceTicker() {
 
           <Box sx={{ mt: 3, height: 200 }}>
             <ResponsiveContainer width="100%" height="100%">
-              <LineChart data={tickHistory}>
+              <LineChart data={bars}>
                 <XAxis
-                  dataKey="timestamp"
+                  dataKey="start"
                   tickFormatter={ts => new Date(ts * 1000).toLocaleTimeString()}
                   tick={{ fill: 'white', fontSize: 10 }}
                   interval="preserveStartEnd"
@@ -158,7 +200,7 @@ export default function LivePriceTicker() {
                 />
                 <Line
                   type="monotone"
-                  dataKey="price"
+                  dataKey="close"
                   stroke="#00f5a0"
                   strokeWidth={2}
                   dot={false}
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import {
   Box,
   Button,
@@ -18,10 +18,26 @@ import {
   getSortedRowModel,
   flexRender,
 } from '@tanstack/react-table';
-import { fetchOrders } from '../api/orders';
+import { fetchOrders, openOrderStream } from '../api/orders';
 import { useDispatch, useSelector } from 'react-redux';
 import { loadSymbols } from '../store/symbolsSlice';
 
+// Newest orders shown per symbol; the server pages through its index
+const ORDERS_PAGE_SIZE = 500;
+// The order stream only carries orders created by the server worker it is
+// connected to, so live mode also polls for the rest now and then
+const CATCH_UP_INTERVAL_MS = 10000;
+
+// Merge orders into a newest-first list, skipping ones already shown
+const mergeOrders = (prev, incoming) => {
+  const known = new Set(prev.map(o => o.id));
+  const fresh = incoming.filter(o => !known.has(o.id));
+  if (!fresh.length) return prev;
+  return [...fresh, ...prev]
+    .sort((a, b) => (a.id < b.id ? 1 : -1))
+    .slice(0, ORDERS_PAGE_SIZE);
+};
+
 /**
  * OrdersTable allows users to select a symbol and view its orders
  * with sorting, filtering, refresh, live mode, and skeleton loading.
@@ -36,12 +52,17 @@ export default function OrdersTable({ defaultSymbol = null }) {
   const [liveMode, setLiveMode] = useState(false);
   const [loading, setLoading] = useState(false);
   const [sorting, setSorting] = useState([]);
+  const ordersRef = useRef(orders);
+  ordersRef.current = orders;
 
   const loadOrders = async () => {
     if (!selectedSymbol?.symbol) return;
     try {
       setLoading(true);
-      const data = await fetchOrders(selectedSymbol.symbol);
+      const data = await fetchOrders(selectedSymbol.symbol, {
+        limit: ORDERS_PAGE_SIZE,
+        order: 'desc',
+      });
       setOrders(data);
     } catch (err) {
       console.error('Error fetching orders:', err);
@@ -64,10 +85,35 @@ export default function OrdersTable({ defaultSymbol = null }) {
 
   useEffect(() => {
     if (!liveMode || !selectedSymbol?.symbol) return;
-    const interval = setInterval(() => {
-      loadOrders();
-    }, 5000);
-    return () => clearInterval(interval);
+    const symbol = selectedSymbol.symbol;
+    let active = true;
+    // New orders are pushed by the server instead of polling the REST API
+    const stream = openOrderStream(order => {
+      setOrders(prev => mergeOrders(prev, [order]));
+    });
+    stream.subscribe([symbol]);
+    // Catch up on orders created since the last load
+    loadOrders();
+    const catchUp = async () => {
+      const newest = ordersRef.current[0];
+      try {
+        const data = await fetchOrders(
+          symbol,
+          newest
+            ? { after_id: newest.id, limit: ORDERS_PAGE_SIZE }
+            : { limit: ORDERS_PAGE_SIZE, order: 'desc' }
+        );
+        if (active) setOrders(prev => mergeOrders(prev, data));
+      } catch (err) {
+        console.error('Error catching up on orders:', err);
+      }
+    };
+    const timer = setInterval(catchUp, CATCH_UP_INTERVAL_MS);
+    return () => {
+      active = false;
+      clearInterval(timer);
+      stream.close();
+    };
   }, [liveMode, selectedSymbol]);
 
   const filteredOrders =
@@ -7,6 +7,14 @@ export const API_CONFIG = {
   WS_BASE_URL:
     process.env.REACT_APP_WS_BASE_URL || 'ws://localhost:8000/ws/ticks',
 
+  // WebSocket URL for the live order stream
+  WS_ORDERS_URL:
+    process.env.REACT_APP_WS_ORDERS_URL || 'ws://localhost:8000/ws/orders',
+
+  // WebSocket URL for closed OHLCV bars
+  WS_BARS_URL:
+    process.env.REACT_APP_WS_BARS_URL || 'ws://localhost:8000/ws/bars',
+
   // Environment
   ENV: process.env.REACT_APP_ENV || 'development',
 
@@ -14,6 +22,7 @@ export const API_CONFIG = {
   ENDPOINTS: {
     ORDERS: '/orders',
     SYMBOLS: '/symbols',
+    BARS: '/bars',
     TICKS: '/ticks',
   },
 };
@@ -45,3 +54,13 @@ export const getApiUrl = endpoint => {
 export const getWsUrl = () => {
   return API_CONFIG.WS_BASE_URL;
 };
+
+// Helper function to get the order stream WebSocket URL
+export const getWsOrdersUrl = () => {
+  return API_CONFIG.WS_ORDERS_URL;
+};
+
+// Helper function to get the bar stream WebSocket URL
+export const getWsBarsUrl = () => {
+  return API_CONFIG.WS_BARS_URL;
+};